@@ -13,10 +13,13 @@ from flask_sqlalchemy import SQLAlchemy
 
 import redis
 import rq
+from cagecat.const import job_queues
 from config_files.sensitive import init_config
 
 r = redis.Redis()
-q = rq.Queue(connection=r, default_timeout=28800) # 8h for 1 job
+# the timeout of each job is set by its resource profile (see classes.py)
+queues = {name: rq.Queue(name, connection=r, default_timeout=28800)  # 8h for 1 job
+          for name in job_queues}
 
 app = Flask("cagecat")
 app.config.update(init_config)
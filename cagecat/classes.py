@@ -3,6 +3,10 @@
 Author: Matthias van den Belt
 """
 
+import os
+import resource
+import typing as t
+
 import cagecat.workers.workers as w
 
 function_dict = {'search': w.cblaster_search,
@@ -14,6 +18,104 @@ function_dict = {'search': w.cblaster_search,
                  'clinker': w.clinker,
                  'clinker_query': w.clinker_query}
 
+
+class ResourceProfile:
+    """Class to store the limits of the commands executed by a job type
+
+    Input:
+        - timeout: wall-clock time in seconds after which the command is
+            killed
+        - cpu_time: CPU time in seconds per process (RLIMIT_CPU), None for
+            no limit
+        - memory: address space in bytes per process (RLIMIT_AS), None for
+            no limit
+        - nice: niceness of the command
+
+    The limits are set on the child process itself (see apply), so they are
+    inherited by any process started by the command (e.g. DIAMOND).
+    """
+
+    def __init__(self, timeout: int,
+                 cpu_time: t.Optional[int] = None,
+                 memory: t.Optional[int] = None,
+                 nice: int = 0):
+        self.timeout = timeout
+        self.cpu_time = cpu_time
+        self.memory = memory
+        self.nice = nice
+
+    def get_job_timeout(self) -> int:
+        """Returns the timeout of the rq job executing the command
+
+        Output:
+            - timeout in seconds, leaving time for the pre- and post-job
+                formalities after the command has been killed
+        """
+        return self.timeout + job_timeout_margin
+
+    def apply(self) -> None:
+        """Applies the limits to the current process
+
+        Output:
+            - None
+
+        Used as preexec_fn of subprocess.Popen, so it is executed in the
+        child process before the command is started. The child is started in
+        a new session (and process group), so the command can be killed
+        together with the processes it starts (see kill_process_group).
+        """
+        os.setsid()
+
+        if self.nice:
+            os.nice(self.nice)
+
+        if self.cpu_time is not None:
+            resource.setrlimit(resource.RLIMIT_CPU,
+                               (self.cpu_time, self.cpu_time))
+
+        if self.memory is not None:
+            resource.setrlimit(resource.RLIMIT_AS, (self.memory, self.memory))
+
+
+GiB = 1024 ** 3
+job_timeout_margin = 600  # seconds
+
+# recompute jobs mostly run in the worker itself, where the recompute profile
+# is checked between stages instead of being set with setrlimit (see
+# workers.recompute.ResourceGuard)
+resource_profiles = {
+    'search': ResourceProfile(timeout=28800, memory=32 * GiB, nice=5),
+    'recompute': ResourceProfile(timeout=3600, cpu_time=3600, memory=8 * GiB),
+    'gne': ResourceProfile(timeout=7200, cpu_time=7200, memory=8 * GiB,
+                           nice=10),
+    'extract_sequences': ResourceProfile(timeout=3600, memory=8 * GiB),
+    'extract_clusters': ResourceProfile(timeout=3600, cpu_time=3600,
+                                        memory=8 * GiB),
+    'clinker': ResourceProfile(timeout=7200, memory=16 * GiB, nice=10),
+    'clinker_query': ResourceProfile(timeout=7200, memory=16 * GiB, nice=10)}
+
+# job types which are not routed to the fast queue. Searches in HMM mode are
+# routed to the hmm queue (see get_queue_name)
+queue_per_job_type = {'search': 'search',
+                      'clinker': 'search'}  # long-running on large uploads
+
+
+def get_queue_name(job_type: str, options: t.Mapping[str, str]) -> str:
+    """Returns the name of the queue a job should be executed from
+
+    Input:
+        - job_type: the type of job
+        - options: user submitted parameters via HTML form
+
+    Output:
+        - name of the queue, one of const.job_queues
+    """
+    if job_type == 'search' and options.get('mode') == 'hmm':
+        return 'hmm'
+
+    return queue_per_job_type.get(job_type, 'fast')
+
+
 class CAGECATJob:
     """Class to temporarily store settings required to create a CAGECAT job
 
@@ -47,6 +149,9 @@ class CAGECATJob:
         if self.job_type is None:
             self.job_type = self.options['job_type']
 
+        self.resource_profile = resource_profiles[self.job_type]
+        self.queue_name = get_queue_name(self.job_type, self.options)
+
     def get_job_type(self):
         # TODO: check if this can be removed
         return self.options['job_type']
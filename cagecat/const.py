@@ -8,19 +8,34 @@ from config_files.config import thresholds
 
 clinker_modules = ('clinker_query', 'clinker')
 modules_with_plots = ["search", "recompute", "gne", "clinker", "clinker_query"]
+# precompressed copies of plots (see workers_helpers.compress_plot), in order
+# of preference: (encoding, extension)
+precompressed_encodings = (('br', '.br'), ('gzip', '.gz'))
 
 fasta_extensions = (".fa", ".fsa", ".fna", ".fasta", ".faa")
 genbank_extensions = (".gbk", ".gb", ".genbank", ".gbf", ".gbff")
 
 submit_url = "/submit_job"
+
+# rq queues, each with its own pool of workers (see supervisord.conf), and the
+# label shown to users. Job types are routed to a queue by
+# classes.get_queue_name
+job_queues = {'fast': 'Downstream analyses',
+              'search': 'Remote searches',
+              'hmm': 'HMM searches'}
 hmm_database_organisms = ('prokaryota', 'fungi')
 
 clust_number_with_score_pattern = r"\(Cluster (\d+), score: \d+\.\d+\)"
 clust_number_without_score_pattern = r"\(Cluster (\d+)"
 clust_number_with_clinker_score_pattern = r"\(Cluster (\d+), \d+\.\d+ score\)"
 jobs_dir = os.path.join("cagecat", "jobs")
+time_format = '%B %d %Y - %H:%M:%S'  # used when showing times to users
 folders_to_create = ["uploads", "results", "logs"]
 
+# written to the log of a job when its command was killed (see run_command)
+resource_limits_exceeded = 'CAGECAT - Job exceeded its resource limits'
+resource_limits_reason = 'Your job exceeded the time or memory available for this analysis, and was stopped. Try to reduce the size of your input or loosen your search parameters, and try again.'
+
 failure_reasons = {
     'ERROR - No valid profiles could be selected':  # module search, hmm/hmm+remote mode, incorrect HMM profiles
         'No valid HMM profiles have been entered. Check your HMM profiles for potential spelling errors.',
@@ -29,7 +44,11 @@ failure_reasons = {
     'Too many selected clusters':  # clinker, clinker_query, extract_clusters
         'You have selected too many clusters to use in your downstream analysis. Check the maximum number of clusters for the analysis you were trying to execute, and try again.',
     'Too many samples':  # gne module
-        'You set the value for the number of samples parameter too high. Change it to the maximum value and try again.'
+        'You set the value for the number of samples parameter too high. Change it to the maximum value and try again.',
+    resource_limits_exceeded:  # any module, killed by run_command
+        resource_limits_reason,
+    'MemoryError':  # any module, memory limit of its resource profile
+        resource_limits_reason
 }
 
 module_to_tool = {
@@ -38,6 +57,7 @@ module_to_tool = {
     'recompute': 'cblaster',
     'extract': 'cblaster',
     'extract_clusters': 'cblaster',
+    'extract_sequences': 'cblaster',
     'clinker_query': 'cblaster',
     'clinker': 'clinker'
 }
@@ -15,32 +15,58 @@ class Job(db.Model):
         Inherits from db.Model
     """
     id = db.Column(db.String(15), primary_key=True)
-    job_type = db.Column(db.String(10), nullable=False)
+    job_type = db.Column(db.String(10), nullable=False, index=True)
     redis_id = db.Column(db.String(80))
-    status = db.Column(db.Text, nullable=False)
+    status = db.Column(db.Text, nullable=False, index=True)
 
     # user-specified items
     title = db.Column(db.String(60))
     email = db.Column(db.String(100))
 
-    # connecting jobs
+    # connecting jobs (see JobLink for all connections of a job)
     main_search_job = db.Column(db.String(15))
-    child_jobs = db.Column(db.String(), default="")
     depending_on = db.Column(db.String(10))
 
-    # timing
-    post_time = db.Column(db.String(), nullable=False, default=datetime.utcnow().strftime('%B %d %Y - %H:%M:%S'))
-    start_time = db.Column(db.String())
-    finish_time = db.Column(db.String)
+    # timing (UTC). Note that utcnow is passed as function, so it is
+    # evaluated when a job is added instead of when this module is imported
+    post_time = db.Column(db.DateTime, nullable=False, default=datetime.utcnow,
+                          index=True)
+    start_time = db.Column(db.DateTime)
+    finish_time = db.Column(db.DateTime, index=True)  # used for expiry
 
     def __repr__(self):
         # print("Main search", self.main_search_job)
-        # print("Children", self.child_jobs)
         # print("Depending", self.depending_on)
         return f"ID: {self.id}; Type: {self.job_type}; " \
                f"Status: {self.status}; " \
                f"Finished: {self.finish_time}; Main job{self.main_search_job}"
 
+class JobLink(db.Model):
+    """Model for creating a connection between two jobs
+
+    Inherits from db.Model
+
+    Link types:
+        - "main_search": parent is the main search job of the child
+        - "depending": child depends on (uses the output of) the parent
+    """
+    __tablename__ = 'job_links'
+    __table_args__ = (
+        db.Index('ix_job_links_parent_type', 'parent_id', 'link_type'),
+        db.UniqueConstraint('parent_id', 'child_id', 'link_type'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    parent_id = db.Column(db.String(15), db.ForeignKey('job.id'),
+                          nullable=False)
+    child_id = db.Column(db.String(15), db.ForeignKey('job.id'),
+                         nullable=False, index=True)
+    link_type = db.Column(db.String(15), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"{self.parent_id} -> {self.child_id} ({self.link_type})"
+
+
 class Statistic(db.Model):
     """Model for creating a entry for job statistics
 
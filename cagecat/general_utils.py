@@ -2,22 +2,30 @@
 
 Author: Matthias van den Belt
 """
+import json
 import os
 import smtplib
+import time
 import typing as t
 from email.message import EmailMessage
 
 import redis
 import rq
 from flask import render_template
+from rq.exceptions import NoSuchJobError
+from rq.job import Job as RQJob
 from rq.registry import StartedJobRegistry
 
-from cagecat import q, r
-from cagecat.const import jobs_dir
+from cagecat import queues, r
+from cagecat.const import jobs_dir, job_queues
 from cagecat.db_models import Statistic, Job
-from config_files.config import email_footer_msg
+from cagecat.job_durations import get_duration_percentiles, get_queue_duration_key
+from config_files.config import email_footer_msg, server_info_cache_conf
 from config_files.sensitive import account, pwd, smtp_server, sender_email, port
 
+server_info_key = 'cagecat:server_info'
+local_server_info = {'info': None, 'expires': 0.0}
+
 
 def send_email(subject: str, message: str, receiving_email: str) -> None:
     """Send an email
@@ -63,44 +71,180 @@ def show_template(template_name: str, help_enabled:bool = True,
     """
     if stat_code is None:
         return render_template(template_name, help_enabled=help_enabled,
-                               serv_info=get_server_info(q, r),
+                               serv_info=get_server_info(queues, r),
                                show_examples=show_examples, **kwargs)
     else:
         return render_template(template_name, help_enabled=help_enabled,
-                               serv_info=get_server_info(q, r),
+                               serv_info=get_server_info(queues, r),
                                show_examples=show_examples,
                                **kwargs), stat_code
 
 
-def get_server_info(queue: rq.Queue = None, redis_conn: redis.Redis = None) \
-        -> t.Dict[str, t.Union[str, int]]:
+def get_server_info(rq_queues: t.Dict[str, rq.Queue] = None,
+                    redis_conn: redis.Redis = None) \
+        -> t.Dict[str, t.Any]:
     """Returns current server statistics and information
 
     Input:
-        - q, rq.Queue: connection to queue of jobs waiting to be executed
+        - rq_queues: queue name -> connection to queue of jobs waiting to be
+            executed
         - redis_conn, redis.Redis: instance of Redis server. Used to connect
             to Redis
 
     Output:
         - dict: info about the current status of the server and queued
             or running jobs
+
+    As this function is called for every rendered page, the information is
+    cached per process for server_info_cache_conf['local_ttl'] seconds and
+    shared between processes via Redis for server_info_cache_conf
+    ['shared_ttl'] seconds. The shared snapshot is invalidated when a job
+    starts or finishes (see invalidate_server_info).
     """
-    # TODO future: optimization: maybe we can instantiate this registry once instead of every time
-    if queue is None:
-        queue = q
+    if rq_queues is None:
+        rq_queues = queues
     if redis_conn is None:
         redis_conn = r
 
-    start_registry = StartedJobRegistry('default', connection=redis_conn)
-    # above registry has the jobs in it which have been started, but are not
-    # finished yet: running jobs.
-    running = len(start_registry)
+    now = time.monotonic()
+    if local_server_info['expires'] > now:
+        return local_server_info['info']
+
+    snapshot = redis_conn.get(server_info_key)
+    if snapshot is None:
+        info = compute_server_info(rq_queues, redis_conn)
+        redis_conn.set(server_info_key, json.dumps(info),
+                       ex=server_info_cache_conf['shared_ttl'])
+    else:
+        info = json.loads(snapshot)
+
+    local_server_info['info'] = info
+    local_server_info['expires'] = now + server_info_cache_conf['local_ttl']
+
+    return info
+
+
+def compute_server_info(rq_queues: t.Dict[str, rq.Queue],
+                        redis_conn: redis.Redis) -> t.Dict[str, t.Any]:
+    """Queries Redis and the SQL database for current server information
+
+    Input:
+        - rq_queues: queue name -> connection to queue of jobs waiting to be
+            executed
+        - redis_conn, redis.Redis: instance of Redis server. Used to connect
+            to Redis
+
+    Output:
+        - dict: info about the current status of the server and queued
+            or running jobs. The "queues" entry contains the information
+            per queue (see get_queue_info)
+    """
+    queue_info = {name: get_queue_info(queue, redis_conn)
+                  for name, queue in rq_queues.items()}
+    running = sum(info['running'] for info in queue_info.values())
 
     return {"server_status": 'idle' if running == 0 else 'running',
-            "queued": len(queue),
+            "queued": sum(info['queued'] for info in queue_info.values()),
             "running": running,
             "completed": Statistic.query.filter_by(
-                name="finished").first().count}
+                name="finished").first().count,
+            "queues": queue_info}
+
+
+def get_queue_info(queue: rq.Queue, redis_conn: redis.Redis) \
+        -> t.Dict[str, t.Any]:
+    """Returns the depth and estimated waiting time of a queue
+
+    Input:
+        - queue: queue to get the information of
+        - redis_conn, redis.Redis: instance of Redis server. Used to connect
+            to Redis
+
+    Output:
+        - dict with the label, number of queued and running jobs, number of
+            workers, the typical (P50) duration of its jobs, and the
+            estimated waiting time and finish time of a job submitted now in
+            seconds (None if unknown), with their texts shown to users
+
+    The typical duration is taken from the duration model (see
+    job_durations.py), and the queued jobs are divided over the workers of
+    the queue.
+    """
+    queued = len(queue)
+    # jobs which have been started, but are not finished yet: running jobs
+    running = len(StartedJobRegistry(queue.name, connection=redis_conn))
+    workers = rq.Worker.count(connection=redis_conn, queue=queue)
+
+    percentiles = get_duration_percentiles(
+        [get_queue_duration_key(queue.name)], redis_conn)
+    duration = None if percentiles is None else percentiles['p50']
+
+    if queued == 0:
+        estimated_wait = 0
+    else:
+        estimated_wait = None if duration is None or workers == 0 else \
+            int(queued * duration / workers)
+
+    estimated_finish = None if estimated_wait is None or duration is None \
+        else int(estimated_wait + duration)
+
+    return {"label": job_queues.get(queue.name, queue.name),
+            "queued": queued,
+            "running": running,
+            "workers": workers,
+            "typical_duration": duration,
+            "estimated_wait": estimated_wait,
+            "estimated_wait_text": format_waiting_time(estimated_wait),
+            "estimated_finish": estimated_finish,
+            "estimated_finish_text": format_waiting_time(estimated_finish)}
+
+
+def format_waiting_time(seconds: t.Optional[int]) -> str:
+    """Formats an estimated waiting time to be shown to users
+
+    Input:
+        - seconds: estimated waiting time, None if unknown
+
+    Output:
+        - formatted waiting time
+    """
+    if seconds is None:
+        return 'unknown'
+    if seconds < 60:
+        return '< 1 min'
+    if seconds < 3600:
+        return f'~{round(seconds / 60)} min'
+
+    return f'~{round(seconds / 3600, 1)} h'
+
+
+def fetch_rq_job(job: Job) -> t.Optional[RQJob]:
+    """Fetches the rq job executing a job
+
+    Input:
+        - job: the job as stored in the SQL database
+
+    Output:
+        - the rq job OR
+        - None if the rq job does not exist (anymore)
+    """
+    try:
+        return RQJob.fetch(job.redis_id, connection=r)
+    except NoSuchJobError:
+        return None
+
+
+def invalidate_server_info() -> None:
+    """Removes the shared snapshot of the server information
+
+    Output:
+        - None, the next request for server information will query Redis
+            and the SQL database again
+
+    Called when a job starts or finishes, as the number of queued, running
+    and completed jobs changes at those moments.
+    """
+    r.delete(server_info_key)
 
 
 def generate_paths(job_id: str) -> t.Tuple[str, str, str]:
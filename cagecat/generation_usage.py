@@ -0,0 +1,192 @@
+"""Registration of the HMM database generations used by jobs
+
+A job registers the generations of the databases it searches when it
+starts, and releases them when it has finished. The session of a search
+refers to the databases it was created with, which are read by downstream
+jobs (e.g. extract_clusters) using the session. Therefore, jobs writing a
+session also register the generations referred to by the session, until
+the job expires (see job_retention_days). Downstream jobs register the
+generations referred to by the session of their parent job.
+
+Generations which are registered are not removed by
+hmm_database_creation/generations.py.
+
+This module only depends on Redis and the configuration, as it is also
+imported by the HMM database creation scripts.
+
+Author: Matthias van den Belt
+"""
+import os
+import time
+import typing as t
+
+from redis import Redis
+
+from config_files.config import job_retention_days
+from config_files.sensitive import finished_hmm_db_folder
+
+# the longest jobs time out after 8 hours (see classes.resource_profiles). A
+# registration expires afterwards, in case a job never released it
+generation_use_ttl = 28800 + 3600
+
+# sessions are kept as long as their job, plus a day as the removal of
+# expired jobs runs daily
+generation_reference_ttl = (job_retention_days + 1) * 86400
+
+# usage -> time in seconds after which a registration expires
+usage_ttls = {'jobs': generation_use_ttl,
+              'sessions': generation_reference_ttl}
+
+
+def get_generation_key(generation: str, usage: str = 'jobs') -> str:
+    """Returns the Redis key of the jobs using a generation
+
+    Input:
+        - generation: path to the generation
+        - usage: "jobs" for running jobs, "sessions" for jobs of which the
+            session refers to the generation
+
+    Output:
+        - Redis key of a sorted set (job ID -> expiry timestamp)
+    """
+    return f'cagecat:hmm_db:generation:{generation}:{usage}'
+
+
+def get_job_generations_key(job_id: str, usage: str = 'jobs') -> str:
+    """Returns the Redis key of the generations used by a job
+
+    Input:
+        - job_id: ID of the job
+        - usage: "jobs" for generations used while the job runs, "sessions"
+            for generations referred to by the session of the job
+
+    Output:
+        - Redis key of a set of generation paths
+    """
+    return f'cagecat:hmm_db:job:{job_id}:{usage}:generations'
+
+
+def get_generation_of(path: str) -> t.Optional[str]:
+    """Returns the generation a (resolved) database path belongs to
+
+    Input:
+        - path: path to a database file
+
+    Output:
+        - path to the generation OR
+        - None if the path is not part of a generation
+    """
+    generations_root = os.path.join(os.path.realpath(finished_hmm_db_folder),
+                                    'generations')
+    path = os.path.realpath(path)
+
+    if not path.startswith(generations_root + os.sep):
+        return None
+
+    return os.path.dirname(path)
+
+
+def get_generations_of(paths: t.List[str]) -> t.Set[str]:
+    """Returns the generations the (resolved) database paths belong to
+
+    Input:
+        - paths: paths to database files. Paths which are not part of a
+            generation are ignored
+
+    Output:
+        - paths to the generations
+    """
+    return {g for g in map(get_generation_of, paths) if g is not None}
+
+
+def mark_generations_in_use(redis_conn: Redis, job_id: str,
+                            generations: t.Set[str],
+                            usage: str = 'jobs') -> None:
+    """Registers the generations of the databases used by a job
+
+    Input:
+        - redis_conn: connection to Redis
+        - job_id: ID of the job
+        - generations: paths to the generations used by the job
+        - usage: "jobs" while the job runs (released by
+            release_generations), "sessions" for the generations referred
+            to by the session of the job (expire with the job)
+
+    Output:
+        - None, registered generations
+    """
+    if not generations:
+        return
+
+    ttl = usage_ttls[usage]
+
+    pipe = redis_conn.pipeline()
+    for generation in generations:
+        key = get_generation_key(generation, usage)
+        pipe.zadd(key, {job_id: time.time() + ttl})
+        pipe.expire(key, ttl)
+
+    job_key = get_job_generations_key(job_id, usage)
+    pipe.sadd(job_key, *generations)
+    pipe.expire(job_key, ttl)
+    pipe.execute()
+
+
+def get_referenced_generations(redis_conn: Redis, job_id: str) -> t.Set[str]:
+    """Returns the generations referred to by the session of a job
+
+    Input:
+        - redis_conn: connection to Redis
+        - job_id: ID of the job
+
+    Output:
+        - paths to the generations
+    """
+    return {g.decode() for g in redis_conn.smembers(
+        get_job_generations_key(job_id, 'sessions'))}
+
+
+def release_generations(redis_conn: Redis, job_id: str,
+                        usage: str = 'jobs') -> None:
+    """Removes the registrations of the generations used by a job
+
+    Input:
+        - redis_conn: connection to Redis
+        - job_id: ID of the job
+        - usage: "jobs" when the job has finished, "sessions" when the job
+            (and therefore its session) is removed
+
+    Output:
+        - None, removed registrations
+    """
+    job_key = get_job_generations_key(job_id, usage)
+    generations = redis_conn.smembers(job_key)
+    if not generations:
+        return
+
+    pipe = redis_conn.pipeline()
+    for generation in generations:
+        pipe.zrem(get_generation_key(generation.decode(), usage), job_id)
+    pipe.delete(job_key)
+    pipe.execute()
+
+
+def is_generation_in_use(redis_conn: Redis, generation: str) -> bool:
+    """Checks if a generation is used by any job
+
+    Input:
+        - redis_conn: connection to Redis
+        - generation: path to the generation
+
+    Output:
+        - True if a registration of a running job, or of a job of which the
+            session refers to the generation, has not expired yet
+    """
+    for usage in usage_ttls:
+        key = get_generation_key(generation, usage)
+        redis_conn.zremrangebyscore(key, '-inf', time.time())
+
+        if redis_conn.zcard(key) > 0:
+            return True
+
+    return False
@@ -0,0 +1,119 @@
+"""Catalogue of the available HMM databases, shared by all processes
+
+The catalogue (organism -> genus -> database information) is created by
+scanning the finished HMM databases folder, and stored in Redis together
+with a version number. Each process keeps a copy of the catalogue, which is
+only reloaded when the version in Redis has changed, so all processes show
+the same databases without scanning the filesystem.
+
+Author: Matthias van den Belt
+"""
+
+# package imports
+import datetime
+import json
+import os
+import typing as t
+
+# own project imports
+from cagecat import r
+from cagecat.const import hmm_database_organisms
+from config_files.sensitive import finished_hmm_db_folder
+
+catalogue_key = 'cagecat:hmm_db:catalogue'
+catalogue_version_key = 'cagecat:hmm_db:catalogue_version'
+local_catalogue = {'version': None, 'catalogue': {}}
+
+
+def scan_hmm_databases() -> t.Dict[str, t.Dict[str, t.Dict[str, t.Any]]]:
+    """Collects information on the databases in the HMM databases folder
+
+    Output:
+        - organism (capitalized) -> genus -> dict with the total size of the
+            database files in bytes ("size"), number of genomes ("genomes",
+            None if unknown) and moment of creation ("built")
+
+    Raises:
+        - ValueError: when an unknown organism folder is present
+    """
+    all_databases = {}
+
+    for organism_folder in sorted(os.listdir(finished_hmm_db_folder)):
+        if organism_folder in ('logs', 'generations') or \
+                organism_folder.endswith('.tmp'):
+            continue
+
+        if organism_folder not in hmm_database_organisms:
+            raise ValueError('Incorrect organism folder in HMM databases')
+
+        organism_path = os.path.join(finished_hmm_db_folder, organism_folder)
+        genera = {}
+        for file in os.listdir(organism_path):
+            genus = file.split('.')[0]
+            info = genera.setdefault(genus, {'size': 0, 'genomes': None,
+                                             'built': None})
+            stat = os.stat(os.path.join(organism_path, file))
+
+            if file.endswith('.manifest.json'):
+                # see hmm_database_creation/genus_manifests.py
+                with open(os.path.join(organism_path, file)) as inf:
+                    info['genomes'] = len(json.load(inf))
+                continue
+
+            info['size'] += stat.st_size
+            if file.endswith('.fasta'):
+                info['built'] = datetime.datetime.utcfromtimestamp(
+                    stat.st_mtime).strftime('%Y-%m-%d')
+
+        all_databases[organism_folder.capitalize()] = \
+            {genus: genera[genus] for genus in sorted(genera)}
+
+    return all_databases
+
+
+def update_hmm_database_catalogue() -> t.Dict[str, t.Dict[str, t.Dict[str, t.Any]]]:
+    """Scans the HMM databases and stores the catalogue in Redis
+
+    Output:
+        - the new catalogue. Other processes load it on their next call of
+            get_available_hmm_databases
+    """
+    catalogue = scan_hmm_databases()
+
+    pipe = r.pipeline()
+    pipe.set(catalogue_key, json.dumps(catalogue))
+    pipe.incr(catalogue_version_key)
+    _, version = pipe.execute()
+
+    local_catalogue['version'] = version
+    local_catalogue['catalogue'] = catalogue
+
+    return catalogue
+
+
+def get_available_hmm_databases() -> t.Dict[str, t.Dict[str, t.Dict[str, t.Any]]]:
+    """Returns the catalogue of available HMM databases
+
+    Output:
+        - organism (capitalized) -> genus -> database information (see
+            scan_hmm_databases). Genera are sorted alphabetically
+
+    Only the version of the catalogue is requested from Redis, unless this
+    process has an outdated copy. The catalogue is created when it was not
+    stored in Redis yet.
+    """
+    version = r.get(catalogue_version_key)
+
+    if version is None:
+        return update_hmm_database_catalogue()
+
+    version = int(version)
+    if version != local_catalogue['version']:
+        catalogue = r.get(catalogue_key)
+        if catalogue is None:
+            return update_hmm_database_catalogue()
+
+        local_catalogue['version'] = version
+        local_catalogue['catalogue'] = json.loads(catalogue)
+
+    return local_catalogue['catalogue']
@@ -0,0 +1,232 @@
+"""Model of the durations of jobs, used to estimate start and finish times
+
+The durations of finished jobs are recorded in Redis per job type, per
+combination of the parameters which influence the duration most (mode,
+database, hitlist size and number of queries) and per queue. Of each of
+these groups, the most recent durations are kept in a sliding window, from
+which the percentiles (P50/P90) are calculated.
+
+The groups a job belongs to are determined when the job is submitted, and
+stored in the meta data of its rq job.
+
+Author: Matthias van den Belt
+"""
+
+# package imports
+import datetime
+import os
+import typing as t
+
+# own project imports
+from cagecat import r
+from cagecat.const import fasta_extensions, genbank_extensions
+from config_files.config import duration_model_conf
+
+# typing imports
+import redis
+
+durations_prefix = 'cagecat:job_durations:'
+
+
+def get_size_bucket(size: int) -> int:
+    """Returns the bucket of a size, being the next power of two
+
+    Input:
+        - size: size to get the bucket of (e.g. the number of queries)
+
+    Output:
+        - smallest power of two not smaller than size
+    """
+    return 1 << max(size - 1, 0).bit_length()
+
+
+def count_queries(options: t.Mapping[str, str],
+                  file_path: t.Optional[str]) -> t.Optional[int]:
+    """Counts the number of query sequences of a search
+
+    Input:
+        - options: user submitted parameters via HTML form
+        - file_path: path to an uploaded file (or session file)
+
+    Output:
+        - number of query sequences OR
+        - None if the queries are not submitted by the user (e.g. for a
+            search in HMM mode)
+    """
+    if options.get('inputType') == 'ncbi_entries':
+        return len(options.get('ncbiEntriesTextArea', '').split())
+
+    if options.get('inputType') != 'file' or file_path is None or \
+            not os.path.exists(file_path):
+        return None
+
+    ext = '.' + file_path.split('.')[-1]
+    if ext in fasta_extensions:
+        start = '>'
+    elif ext in genbank_extensions:
+        start = '/protein_id='
+    else:
+        return None
+
+    with open(file_path) as inf:
+        return sum(1 for line in inf if line.strip().startswith(start))
+
+
+def get_duration_keys(job_type: str, options: t.Mapping[str, str],
+                      file_path: t.Optional[str] = None) -> t.List[str]:
+    """Returns the groups of which the durations are similar to the job
+
+    Input:
+        - job_type: the type of job
+        - options: user submitted parameters via HTML form
+        - file_path: path to an uploaded file (or session file)
+
+    Output:
+        - names of the groups, from most to least specific
+    """
+    parameters = []
+
+    mode = options.get('mode')
+    if mode:
+        parameters.append(f'mode={mode}')
+
+        if mode in ('hmm', 'combi_remote'):
+            parameters.append(f'database={options.get("selectedGenus")}')
+        else:
+            parameters.append(f'database={options.get("database_type")}')
+
+    if options.get('hitlist_size', '').isdigit():
+        parameters.append(
+            f'hitlist<={get_size_bucket(int(options["hitlist_size"]))}')
+
+    n_queries = count_queries(options, file_path)
+    if n_queries is not None:
+        parameters.append(f'queries<={get_size_bucket(n_queries)}')
+
+    keys = [':'.join([job_type] + parameters)] if parameters else []
+    if mode:
+        keys.append(f'{job_type}:mode={mode}')
+    keys.append(job_type)
+
+    return keys
+
+
+def get_queue_duration_key(queue_name: str) -> str:
+    """Returns the group of all jobs executed from a queue
+
+    Input:
+        - queue_name: name of the queue
+
+    Output:
+        - name of the group
+    """
+    return f'queue:{queue_name}'
+
+
+def record_job_duration(keys: t.List[str], seconds: float,
+                        redis_conn: redis.Redis = r) -> None:
+    """Adds the duration of a finished job to the groups it belongs to
+
+    Input:
+        - keys: names of the groups the job belongs to
+        - seconds: duration of the job
+        - redis_conn: connection to Redis
+
+    Output:
+        - None, stored durations. Only the duration_model_conf['window']
+            most recent durations of a group are kept
+    """
+    pipe = redis_conn.pipeline()
+    for key in keys:
+        pipe.lpush(f'{durations_prefix}{key}', round(seconds, 1))
+        pipe.ltrim(f'{durations_prefix}{key}', 0,
+                   duration_model_conf['window'] - 1)
+    pipe.execute()
+
+
+def get_percentile(durations: t.List[float], percentile: float) -> float:
+    """Returns a percentile of durations (nearest-rank method)
+
+    Input:
+        - durations: sorted durations
+        - percentile: percentile to return, between 0 and 100
+
+    Output:
+        - the percentile
+    """
+    rank = max(int(round(percentile / 100 * len(durations))), 1)
+    return durations[min(rank, len(durations)) - 1]
+
+
+def get_duration_percentiles(keys: t.List[str],
+                             redis_conn: redis.Redis = r) \
+        -> t.Optional[t.Dict[str, float]]:
+    """Returns the P50 and P90 of the durations of the most specific group
+
+    Input:
+        - keys: names of the groups, from most to least specific
+        - redis_conn: connection to Redis
+
+    Output:
+        - dict with the P50 and P90 in seconds, and the number of durations
+            ("samples") they are based on OR
+        - None if none of the groups has enough durations
+
+    Groups with less than duration_model_conf['min_samples'] durations are
+    skipped, as their percentiles would be unreliable.
+    """
+    pipe = redis_conn.pipeline()
+    for key in keys:
+        pipe.lrange(f'{durations_prefix}{key}', 0, -1)
+
+    for durations in pipe.execute():
+        if len(durations) < duration_model_conf['min_samples']:
+            continue
+
+        durations = sorted(float(d) for d in durations)
+        return {'p50': get_percentile(durations, 50),
+                'p90': get_percentile(durations, 90),
+                'samples': len(durations)}
+
+    return None
+
+
+def estimate_job_times(status: str, start_time: t.Optional[datetime.datetime],
+                       keys: t.List[str], position: t.Optional[int],
+                       queue_info: t.Optional[t.Dict[str, t.Any]]) \
+        -> t.Optional[t.Dict[str, datetime.datetime]]:
+    """Estimates when a queued or running job starts and finishes
+
+    Input:
+        - status: status of the job ("queued" or "running")
+        - start_time: moment the job has started (UTC), if running
+        - keys: names of the groups the job belongs to
+        - position: number of jobs before the job in its queue, if queued
+        - queue_info: information of the queue of the job (see
+            general_utils.get_queue_info)
+
+    Output:
+        - dict with the estimated start and the P50 and P90 of the finish
+            ("finish", "finish_late") in UTC OR
+        - None if not enough jobs have finished to estimate the times
+    """
+    percentiles = get_duration_percentiles(keys)
+    if percentiles is None:
+        return None
+
+    if status == 'running':
+        start = start_time
+    else:
+        if queue_info is None or position is None or \
+                not queue_info['workers'] or \
+                queue_info['typical_duration'] is None:
+            return None
+
+        start = datetime.datetime.utcnow() + datetime.timedelta(
+            seconds=position * queue_info['typical_duration'] /
+            queue_info['workers'])
+
+    return {'start': start,
+            'finish': start + datetime.timedelta(seconds=percentiles['p50']),
+            'finish_late': start + datetime.timedelta(
+                seconds=percentiles['p90'])}
@@ -0,0 +1,303 @@
+"""Tracks and publishes the execution stage of running jobs
+
+While a job is running, the output of the executed command is inspected
+line by line for the log descriptors of each execution stage. The current
+stage is stored in Redis and published on a per-job channel, so status
+requests do not have to read the log files of a job.
+
+Author: Matthias van den Belt
+"""
+
+# package imports
+import copy
+import json
+import logging
+import os
+import time
+import typing as t
+
+import redis.client
+
+# own project imports
+from cagecat import r
+from cagecat.const import execution_stages_front_end, \
+    execution_stages_log_descriptors
+from cagecat.general_utils import generate_paths
+
+progress_ttl = 172800  # 2 days; jobs time out long before that
+
+
+def get_progress_key(job_id: str) -> str:
+    """Returns the Redis key of the hash storing the progress of a job
+
+    Input:
+        - job_id: ID of the job
+
+    Output:
+        - Redis key
+    """
+    return f'cagecat:job:{job_id}:progress'
+
+
+def get_events_channel(job_id: str) -> str:
+    """Returns the Redis channel on which updates of a job are published
+
+    Input:
+        - job_id: ID of the job
+
+    Output:
+        - name of the Redis pub/sub channel
+    """
+    return f'cagecat:job:{job_id}:events'
+
+
+def read_command(job_id: str) -> str:
+    """Reads the logged command of a job
+
+    Input:
+        - job_id: ID of the job
+
+    Output:
+        - the command as written by log_command
+    """
+    log_base = generate_paths(job_id)[1]
+    with open(os.path.join(log_base, f'{job_id}_command.txt')) as inf:
+        return inf.read()
+
+
+def get_execution_stages_front_end(job_type: str, job_id: str,
+                                   command: t.Optional[str] = None) \
+        -> t.List[str]:
+    """Returns the execution stages of a job as shown to the user
+
+    Input:
+        - job_type: type of the job
+        - job_id: ID of the job
+        - command: executed command. Read from the logs if not given
+
+    Output:
+        - descriptions of the execution stages of the job
+    """
+    # TODO merge with get_execution_stages_log_descriptors
+    contents = read_command(job_id) if command is None else command
+
+    stages_front_end: list = copy.deepcopy(execution_stages_front_end[job_type])
+
+    if job_type == 'search':
+        if '--recompute' in contents:
+            stages_front_end: list = copy.deepcopy(execution_stages_front_end['recompute'])
+            index = 2
+        else:
+            index = 5
+
+        if '--intermediate_genes' in contents:
+            stages_front_end.insert(index, 'Fetching intermediate genes from NCBI')
+
+    elif job_type == 'extract_sequences':
+        if '--extract_sequences' in contents:
+            stages_front_end.insert(2, 'Fetch sequences from NCBI')
+
+    return stages_front_end
+
+
+def get_execution_stages_log_descriptors(job_type: str, job_id: str,
+                                         command: t.Optional[str] = None) \
+        -> t.List[str]:
+    """Returns the log messages indicating the execution stages of a job
+
+    Input:
+        - job_type: type of the job
+        - job_id: ID of the job
+        - command: executed command. Read from the logs if not given
+
+    Output:
+        - log descriptors of the execution stages of the job
+    """
+    # TODO merge with get_execution_stages_front_end
+    contents = read_command(job_id) if command is None else command
+
+    stages_log_descriptors: list = copy.deepcopy(execution_stages_log_descriptors[job_type])
+
+    if job_type == 'search':
+        if '--recompute' in contents:
+            stages_log_descriptors: list = copy.deepcopy(execution_stages_log_descriptors['recompute'])
+            index = 2
+        else:
+            index = 6
+
+        if '--intermediate_genes' in contents:
+            stages_log_descriptors.insert(index, 'Searching for intermediate genes')
+
+    elif job_type == 'extract_sequences':
+        if '--extract_sequences' in contents:
+            stages_log_descriptors.insert(2, 'Querying NCBI')
+
+    return stages_log_descriptors
+
+
+def publish_job_event(job_id: str, event: t.Dict[str, t.Any]) -> None:
+    """Publishes an update of a job on its Redis channel
+
+    Input:
+        - job_id: ID of the job
+        - event: contents of the update. Should contain an 'event' key
+            describing the type of update
+
+    Output:
+        - None, published message
+    """
+    r.publish(get_events_channel(job_id), json.dumps(event))
+
+
+def subscribe_to_job_events(job_id: str) -> redis.client.PubSub:
+    """Subscribes to the Redis channel of a job
+
+    Input:
+        - job_id: ID of the job
+
+    Output:
+        - subscription to the channel of the job. Should be closed by the
+            caller
+    """
+    pubsub = r.pubsub(ignore_subscribe_messages=True)
+    pubsub.subscribe(get_events_channel(job_id))
+
+    return pubsub
+
+
+def iterate_job_events(pubsub: redis.client.PubSub,
+                       timeout: float) -> t.Iterator[t.Dict[str, t.Any]]:
+    """Yields the updates of a job as soon as they are published
+
+    Input:
+        - pubsub: subscription as returned by subscribe_to_job_events
+        - timeout: number of seconds after which to stop listening
+
+    Output:
+        - published updates of the job
+
+    Blocks on the Redis subscription, so no resources are used while
+    waiting for updates.
+    """
+    deadline = time.monotonic() + timeout
+    remaining = timeout
+
+    while remaining > 0:
+        message = pubsub.get_message(timeout=remaining)
+
+        if message is not None:
+            yield json.loads(message['data'])
+
+        remaining = deadline - time.monotonic()
+
+
+def publish_stage(job_id: str, finished: int, total: int) -> None:
+    """Stores and publishes the current execution stage of a job
+
+    Input:
+        - job_id: ID of the job
+        - finished: index of the last finished stage (-1 if no stage has
+            been finished yet)
+        - total: total number of stages of the job
+
+    Output:
+        - None, stored progress in Redis and published update
+    """
+    key = get_progress_key(job_id)
+
+    pipe = r.pipeline()
+    pipe.hset(key, mapping={'finished': finished, 'total': total})
+    pipe.expire(key, progress_ttl)
+    pipe.execute()
+
+    publish_job_event(job_id, {'event': 'stage',
+                               'finished': finished,
+                               'total': total})
+
+
+def fetch_stage(job_id: str) -> t.Optional[t.Dict[str, int]]:
+    """Returns the stored execution stage of a job
+
+    Input:
+        - job_id: ID of the job
+
+    Output:
+        - dict with the index of the last finished stage and the total
+            number of stages OR
+        - None if no progress was stored for this job
+    """
+    progress = r.hgetall(get_progress_key(job_id))
+
+    if not progress:
+        return None
+
+    return {'finished': int(progress[b'finished']),
+            'total': int(progress[b'total'])}
+
+
+def create_stage_tracker(job_id: str, job_type: str,
+                         command: str) -> t.Optional['StageTracker']:
+    """Creates a StageTracker for a job which is about to be executed
+
+    Input:
+        - job_id: ID of the job
+        - job_type: type of the job
+        - command: command which will be executed
+
+    Output:
+        - StageTracker for the job OR
+        - None if no execution stages are known for this job type
+    """
+    if job_type not in execution_stages_log_descriptors:
+        return None
+
+    return StageTracker(job_id, get_execution_stages_log_descriptors(
+        job_type, job_id, command=command))
+
+
+class StageTracker:
+    """Detects execution stages in the output of a running job
+
+    Input:
+        - job_id: ID of the job that is running
+        - descriptors: log descriptors of the execution stages of the job
+
+    Each line of output is passed to feed(). When a line contains the
+    descriptor of a stage which was not encountered before, the new
+    progress is stored and published.
+    """
+
+    def __init__(self, job_id: str, descriptors: t.List[str]):
+        self.job_id = job_id
+        self.descriptors = descriptors
+        self.seen = set()
+
+        publish_stage(self.job_id, -1, len(self.descriptors))
+
+    def feed(self, line: str) -> None:
+        new_stages = [d for d in self.descriptors
+                      if d not in self.seen and d in line]
+
+        if new_stages:
+            self.seen.update(new_stages)
+            publish_stage(self.job_id, len(self.seen) - 1,
+                          len(self.descriptors))
+
+
+class StageTrackingHandler(logging.Handler):
+    """Logging handler passing log messages of a job to a StageTracker
+
+    Input:
+        - tracker: StageTracker of the job which is running
+
+    Used when a job is executed in-process instead of as a command.
+    """
+
+    def __init__(self, tracker: StageTracker):
+        super().__init__()
+        self.tracker = tracker
+        # descriptors such as "INFO - Done." include the log level
+        self.setFormatter(logging.Formatter('%(levelname)s - %(message)s'))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.tracker.feed(self.format(record))
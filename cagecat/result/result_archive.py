@@ -0,0 +1,182 @@
+"""Streams the files of a job as a zip archive when it is downloaded
+
+The archive is generated while it is sent to the client, so no archive has
+to be created when a job finishes, and nothing is written before the
+download starts. Small files and files which are already compressed are
+stored as is; other files (e.g. genomes) are compressed while they are
+streamed.
+
+The streamed archive of a finished job is also written to the results
+folder of the job, so repeated downloads are served from this cached
+archive.
+
+Author: Matthias van den Belt
+"""
+
+# package imports
+import io
+import os
+import typing as t
+import uuid
+import zipfile
+
+# own project imports
+from cagecat.const import precompressed_encodings
+from cagecat.general_utils import generate_paths
+from config_files.config import download_conf
+
+# extensions of files which are not compressed any further
+compressed_extensions = ('.gz', '.zip', '.bz2', '.xz', '.dmnd', '.png',
+                         '.jpg')
+
+
+class StreamBuffer(io.RawIOBase):
+    """Class to collect the bytes written by a ZipFile, to be streamed
+
+    Input:
+        - copy_to: file to which all written bytes are copied, if given
+
+    The buffer does not support seeking, so ZipFile writes the sizes of the
+    files after their contents (data descriptors).
+    """
+
+    def __init__(self, copy_to: t.Optional[t.BinaryIO] = None):
+        super().__init__()
+        self.chunks = []
+        self.copy_to = copy_to
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        data = bytes(b)
+        self.chunks.append(data)
+
+        if self.copy_to is not None:
+            self.copy_to.write(data)
+
+        return len(data)
+
+    def pop(self) -> bytes:
+        """Returns and removes all bytes written since the previous call
+
+        Output:
+            - written bytes
+        """
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def get_archive_path(job_id: str) -> str:
+    """Returns the path of the cached archive of a job
+
+    Input:
+        - job_id: ID corresponding to the job the archive belongs to
+
+    Output:
+        - path to the cached archive
+    """
+    return os.path.join(generate_paths(job_id)[2], f'{job_id}.zip')
+
+
+def list_job_files(job_id: str) -> t.List[t.Tuple[str, str]]:
+    """Lists the files of a job which are added to its archive
+
+    Input:
+        - job_id: ID corresponding to the job the files belong to
+
+    Output:
+        - (path, name in the archive) of all logs, results and uploads.
+            (Partial) cached archives and precompressed copies of files are
+            excluded
+    """
+    base = generate_paths(job_id)[0]
+    archive_name = os.path.basename(get_archive_path(job_id))
+
+    files = []
+    for root, _, file_names in os.walk(base):
+        for fn in sorted(file_names):
+            if fn == archive_name or fn.startswith(f'{archive_name}.'):
+                continue
+
+            # precompressed copies of plots (see workers_helpers.compress_plot)
+            if any(fn.endswith(ext) and fn[:-len(ext)] in file_names
+                   for _, ext in precompressed_encodings):
+                continue
+
+            path = os.path.join(root, fn)
+            files.append((path, os.path.relpath(path, base)))
+
+    return files
+
+
+def get_compress_type(path: str) -> int:
+    """Returns the compression method of a file in the archive
+
+    Input:
+        - path: path to the file
+
+    Output:
+        - zipfile.ZIP_STORED for small or already compressed files,
+            zipfile.ZIP_DEFLATED otherwise
+    """
+    if path.endswith(compressed_extensions) or \
+            os.path.getsize(path) < download_conf['store_below']:
+        return zipfile.ZIP_STORED
+
+    return zipfile.ZIP_DEFLATED
+
+
+def stream_archive(job_id: str, cache: bool) -> t.Iterator[bytes]:
+    """Yields the zip archive of the files of a job
+
+    Input:
+        - job_id: ID corresponding to the job to archive
+        - cache: whether the archive should be stored for later downloads.
+            Should only be done when the files of the job will not change
+            anymore
+
+    Output:
+        - chunks of the archive
+
+    The cached archive is written to a file unique to this download, which
+    is moved into place when the archive is complete. Therefore, incomplete
+    downloads and simultaneous downloads never result in a corrupt cached
+    archive.
+    """
+    archive_path = get_archive_path(job_id)
+    partial_path = f'{archive_path}.{uuid.uuid4().hex}.part'
+
+    copy_to = open(partial_path, 'wb') if cache else None
+    buffer = StreamBuffer(copy_to)
+    completed = False
+
+    try:
+        with zipfile.ZipFile(buffer, 'w', allowZip64=True) as archive:
+            for path, name in list_job_files(job_id):
+                info = zipfile.ZipInfo.from_file(path, name)
+                info.compress_type = get_compress_type(path)
+
+                with open(path, 'rb') as inf, \
+                        archive.open(info, 'w', force_zip64=True) as outf:
+                    while True:
+                        chunk = inf.read(download_conf['chunk_size'])
+                        if not chunk:
+                            break
+
+                        outf.write(chunk)
+                        yield buffer.pop()
+
+                yield buffer.pop()
+
+        yield buffer.pop()
+        completed = True
+    finally:
+        if copy_to is not None:
+            copy_to.close()
+
+            if completed:
+                os.replace(partial_path, archive_path)
+            else:
+                os.remove(partial_path)
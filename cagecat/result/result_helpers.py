@@ -3,12 +3,21 @@
 Author: Matthias van den Belt
 """
 
+import functools
 import os
 import typing as t
+from urllib.parse import quote
 
-from cagecat.const import failure_reasons, jobs_dir
-from cagecat.db_models import Job as dbJob
-from cagecat.general_utils import fetch_job_from_db
+import flask.wrappers
+from flask import Response, request, send_file
+
+from cagecat.const import failure_reasons, jobs_dir, time_format, module_to_tool, modules_with_plots, \
+    precompressed_encodings
+from cagecat import db, queues
+from cagecat.db_models import Job as dbJob, JobLink
+from cagecat.general_utils import fetch_rq_job, get_server_info
+from cagecat.job_durations import estimate_job_times
+from config_files.config import x_accel_conf
 
 
 def get_failure_reason(job_id: str, program: str) -> str:
@@ -17,29 +26,208 @@ def get_failure_reason(job_id: str, program: str) -> str:
     Input:
         - job_id: job id which has failed and the reason should be looked
             up for
+        - program: the program that was executed by the job
 
     Output:
         - user-friendly failure reason
+
+    Both the log of the program and the log written by run_command (which
+    records jobs killed for exceeding their resource limits) are searched.
     """
-    try:
-        with open(os.path.join(jobs_dir, job_id,
-                               "logs", f"{job_id}_{program}.log")) as inf:
-            logs = inf.readlines()
-
-        for l in logs:
-            for fail in failure_reasons:
-                if fail in l:
-                    return failure_reasons[fail]
-    except FileNotFoundError:
+    log_paths = [os.path.join(jobs_dir, job_id, "logs", fn)
+                 for fn in (f"{job_id}_{program}.log", f"{job_id}.log")]
+    log_paths = [p for p in log_paths if os.path.exists(p)]
+
+    if not log_paths:
         return 'Command construction failed (no log file).'
 
+    for log_path in log_paths:
+        with open(log_path) as inf:
+            for l in inf:
+                for fail in failure_reasons:
+                    if fail in l:
+                        return failure_reasons[fail]
+
     return 'Unknown failure reason.'
 
 
-def prepare_finished_result(job_id: str,
-                            module: str) -> \
-        t.Tuple[t.Union[str, None], str, t.Union[int, None]]:
-    """Returns HTML code of plots if applicable and appropriate program
+def get_time_estimates(job: dbJob) -> t.Optional[t.Dict[str, str]]:
+    """Returns the estimated start and finish times of a queued or running job
+
+    Input:
+        - job: queued or running job to estimate the times of
+
+    Output:
+        - dict with the name of the queue of the job ("queue"), and the
+            formatted estimated start ("start"), typical finish ("finish")
+            and late finish ("finish_late") times OR
+        - None if the times cannot be estimated (yet)
+    """
+    rq_job = fetch_rq_job(job)
+    if rq_job is None:
+        return None
+
+    queue_info = get_server_info()['queues'].get(rq_job.origin)
+    position = None
+    if job.status == 'queued' and rq_job.origin in queues:
+        position = queues[rq_job.origin].get_job_position(rq_job.id)
+
+    estimates = estimate_job_times(
+        job.status, job.start_time,
+        rq_job.meta.get('duration_keys', [job.job_type]), position,
+        queue_info)
+    if estimates is None:
+        return None
+
+    formatted = {key: f'{moment.strftime(time_format)} (UTC)'
+                 for key, moment in estimates.items()}
+    formatted['queue'] = rq_job.origin if queue_info is None else \
+        queue_info['label']
+
+    return formatted
+
+
+def get_precompressed_file(path: str) -> t.Tuple[str, t.Optional[str]]:
+    """Returns the precompressed copy of a file accepted by the client
+
+    Input:
+        - path: path to the uncompressed file
+
+    Output:
+        - path to the file to send, being the copy in the most preferred
+            encoding accepted by the client, or path itself if none is
+            accepted or present
+        - encoding of the file to send, None if not compressed
+    """
+    for encoding, extension in precompressed_encodings:
+        if request.accept_encodings[encoding] and \
+                os.path.exists(f'{path}{extension}'):
+            return f'{path}{extension}', encoding
+
+    return path, None
+
+
+def serve_job_file(path: str, mimetype: str,
+                   as_attachment: bool = False,
+                   precompressed: bool = False) -> flask.wrappers.Response:
+    """Sends a file of a job to the client
+
+    Input:
+        - path: path to the file, inside the jobs folder
+        - mimetype: MIME type of the file
+        - as_attachment: whether the client should save the file instead of
+            showing it
+        - precompressed: whether compressed copies of the file might be
+            present (see workers_helpers.compress_plot)
+
+    Output:
+        - response sending the file OR
+        - empty response (304) if the client already has the file
+
+    Should only be called after it has been checked that the client may
+    access the file. If x_accel_conf is enabled, the response is empty and
+    redirects nginx to the file in its internal location, so the file is
+    not sent by a uwsgi process. Otherwise, Flask sends the file itself.
+
+    Browsers revalidate the file they already have instead of downloading
+    it again. When Flask sends the file, the ETag and Last-Modified headers
+    are based on the modification time and size of the copy which is sent.
+    When nginx sends the file, nginx sets these headers for the copy it
+    sends and answers conditional requests itself.
+
+    Of a precompressed file, the copy in an encoding accepted by the client
+    is sent. When nginx sends the file, it selects the gzipped copy itself
+    (gzip_static, see config_files/cagecat).
+    """
+    encoding = None
+    if precompressed and not x_accel_conf['enabled']:
+        path, encoding = get_precompressed_file(path)
+
+    if not x_accel_conf['enabled']:
+        response = send_file(os.path.abspath(path), mimetype=mimetype,
+                             as_attachment=as_attachment, conditional=False)
+        if encoding is not None:
+            response.content_encoding = encoding
+
+        # of the copy which is sent, so each encoding has its own ETag
+        stat = os.stat(path)
+        response.set_etag(f'{int(stat.st_mtime):x}-{stat.st_size:x}')
+        response.last_modified = int(stat.st_mtime)
+    else:
+        relative_path = os.path.relpath(path, jobs_dir).replace(os.sep, '/')
+        response = Response(mimetype=mimetype)
+        response.headers['X-Accel-Redirect'] = \
+            f"{x_accel_conf['location']}{quote(relative_path)}"
+
+        if as_attachment:
+            response.headers['Content-Disposition'] = \
+                f'attachment; filename={os.path.basename(path)}'
+
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    if precompressed:
+        response.vary.add('Accept-Encoding')
+
+    if not x_accel_conf['enabled']:
+        response.make_conditional(request)
+
+    return response
+
+
+def get_program(module: str) -> str:
+    """Returns the program executed by a module
+
+    Input:
+        - module: module type of a job
+
+    Output:
+        - the program that was executed by jobs of this module
+    """
+    if module == "corason":
+        return "echo"  # TODO future: will be someting else later
+
+    if module in module_to_tool:
+        return module_to_tool[module]
+
+    raise NotImplementedError(
+        f"Module {module} has not been implemented yet in results")
+
+
+@functools.lru_cache(maxsize=1024)
+def get_plot_size(job_id: str) -> t.Optional[int]:
+    """Returns the size of the plot of a finished job
+
+    Input:
+        - job_id: ID corresponding to the job of the plot
+
+    Output:
+        - size of the plot in bytes OR
+        - None if the job has no plot
+
+    The plot of a finished job does not change anymore, so its size is
+    cached by each process.
+    """
+    try:
+        return os.stat(get_plot_path(job_id)).st_size
+    except FileNotFoundError:
+        return None
+
+
+def get_plot_path(job_id: str) -> str:
+    """Returns the path of the plot of a job
+
+    Input:
+        - job_id: ID corresponding to the job of the plot
+
+    Output:
+        - path to the plot
+    """
+    return os.path.join(jobs_dir, job_id, "results", f"{job_id}_plot.html")
+
+
+def prepare_finished_result(job_id: str, module: str) -> \
+        t.Tuple[str, t.Optional[int]]:
+    """Returns the metadata of the result of a finished job
 
     Input:
         - job_id: ID corresponding to the job the results are requested for
@@ -47,44 +235,16 @@ def prepare_finished_result(job_id: str,
             requested
 
     Output:
-        - plot_contents: HTML code of a plot
         - program: the program that was executed by this job
-        - size: size of the returned plot in bytes
+        - size: size of the plot in bytes, None if the module has no plot
+
+    The plot itself is not read: it is sent by the get_plot_contents route
+    when it is loaded by the results page.
     """
-    plot_path = os.path.join(jobs_dir, job_id,
-                             "results", f"{job_id}_plot.html")
-    size = None
-
-    if module == "extract_sequences" or module == "extract_clusters":
-        program = "cblaster"
-        plot_contents = None
-
-    elif module == "search" or module == "recompute" or module == "gne":
-        program = "cblaster"
-        with open(plot_path) as inf:
-            plot_contents = inf.read()
-        size = os.path.getsize(plot_path)
-
-    elif module == "corason":
-        program = "echo"  # TODO future: will be someting else later
-        plot_contents = None  # TODO future: for now
-
-    elif module == "clinker":
-        program = "clinker"
-        with open(plot_path) as inf:
-            plot_contents = inf.read()
-        size = os.path.getsize(plot_path)
-
-    elif module == "clinker_query":
-        program = "cblaster"  # as it uses plot_clusters functionality of cblaster
-        with open(plot_path) as inf:
-            plot_contents = inf.read()
-        size = os.path.getsize(plot_path)
-    else:
-        raise NotImplementedError(
-            f"Module {module} has not been implemented yet in results")
+    program = get_program(module)
+    size = get_plot_size(job_id) if module in modules_with_plots else None
 
-    return plot_contents, program, size
+    return program, size
 
 
 def get_connected_jobs(job: t.Optional[dbJob]) -> \
@@ -101,24 +261,31 @@ def get_connected_jobs(job: t.Optional[dbJob]) -> \
     Child jobs: jobs which use the output of preceding jobs as input
     Main search: job which was used to search (initial job)
     Depending: jobs on which the current job depends to start
-    """
-    connected_jobs = []
 
+    Connected jobs are loaded with a single query on the job_links table.
+    """
     if job.main_search_job == "null": # current job is an initial job (search of clinker)
         # go and look for child jobs
-        children = job.child_jobs
+        children = dbJob.query.join(JobLink, JobLink.child_id == dbJob.id) \
+            .filter(JobLink.parent_id == job.id,
+                    JobLink.link_type == 'main_search') \
+            .order_by(JobLink.id).all()
 
-        if children:  # empty string evaluates to False
-            for j_id in children.split(","):
-                child_job = fetch_job_from_db(j_id)
-                connected_jobs.append((child_job.id, child_job.title, child_job.job_type, child_job.status, "child"))
+        connected_jobs = [(child_job.id, child_job.title, child_job.job_type,
+                           child_job.status, "child")
+                          for child_job in children]
 
     else:
-        main_job = fetch_job_from_db(job.main_search_job)
-        connected_jobs.append((main_job.id, main_job.title, main_job.job_type, main_job.status, "main search"))
+        parents = db.session.query(JobLink.link_type, dbJob) \
+            .join(dbJob, JobLink.parent_id == dbJob.id) \
+            .filter(JobLink.child_id == job.id).all()
 
-        if job.depending_on != "null":
-            parent_job = fetch_job_from_db(job.depending_on)
-            connected_jobs.append((parent_job.id, parent_job.title, parent_job.job_type, parent_job.status, "depending"))
+        connection_types = {'main_search': 'main search',
+                            'depending': 'depending'}
+        connected_jobs = [(parent_job.id, parent_job.title,
+                           parent_job.job_type, parent_job.status,
+                           connection_types[link_type])
+                          for link_type, parent_job in
+                          sorted(parents, key=lambda p: p[0] != 'main_search')]
 
     return connected_jobs
@@ -4,17 +4,21 @@ Author: Matthias van den Belt
 """
 
 # package imports
-import copy
+import itertools
 import json
 
-from flask import Blueprint, request, url_for, send_file
+from flask import Blueprint, request, url_for, Response
 
 # own project imports
 from cagecat.routes.routes_helpers import format_size
-from cagecat.const import execution_stages_front_end, execution_stages_log_descriptors, modules_with_plots, downstream_modules, \
-    module_to_tool
+from cagecat.const import modules_with_plots, downstream_modules, module_to_tool
 from cagecat.general_utils import show_template, generate_paths, fetch_job_from_db
-from cagecat.result.result_helpers import prepare_finished_result, get_connected_jobs, get_failure_reason
+from cagecat.result.result_archive import get_archive_path, stream_archive
+from cagecat.result.result_helpers import prepare_finished_result, get_connected_jobs, get_failure_reason, \
+    get_time_estimates, serve_job_file, get_plot_path
+from cagecat.progress import get_execution_stages_front_end, get_execution_stages_log_descriptors, fetch_stage, \
+    subscribe_to_job_events, iterate_job_events
+from config_files.config import status_stream_conf, thresholds
 
 
 # other imports
@@ -53,9 +57,8 @@ def show_result(job_id: str, pj=None, store_job_id=False, j_type=None) -> str: #
 
         if status == "finished":
             module = job.job_type
-            plot_contents, program, size = prepare_finished_result(
-                job_id, module)
-            # plot contents is not used currently. left in for future purposes
+            program, size = prepare_finished_result(job_id, module)
+            # the plot is loaded by the page from get_plot_contents
             #
             # with open(os.path.join(ut.JOBS_DIR, job_id, "logs",
             #                        f"{job_id}_{program}.log")) as inf:
@@ -64,6 +67,8 @@ def show_result(job_id: str, pj=None, store_job_id=False, j_type=None) -> str: #
             return show_template("result_page.html", j_id=job_id,
                                  status=status,
                                  content_size=format_size(size),
+                                 load_plot_directly=size is None or
+                                 size <= thresholds['maximum_plot_size_autoload'],
                                  module=module,
                                  modules_with_plots=modules_with_plots,
                                  job_title=job.title,
@@ -106,6 +111,7 @@ def show_result(job_id: str, pj=None, store_job_id=False, j_type=None) -> str: #
                                  j_type=j_type,
                                  stat_code=302,
                                  stages=stages,
+                                 estimates=get_time_estimates(job),
                                  help_enabled=False)
 
         elif status == "waiting":
@@ -137,16 +143,24 @@ def return_user_download(job_id: str) -> flask.wrappers.Response:
         - Downloads zipped file to the client's side. Therefore, the files
             stored on the server are transferred to the client.
 
-    Currently only supports downloading of the .zip file.
+    The archive is streamed while it is generated (see result_archive.py).
+    Once a job has finished, its archive is cached, and served from the
+    cache (by nginx, see serve_job_file) on later downloads.
     """
+    job = fetch_job_from_db(job_id)
+    if job is None:
+        return show_template("job_not_found.html", job_id=job_id)
+
+    archive_path = get_archive_path(job_id)
+    if os.path.exists(archive_path):
+        return serve_job_file(archive_path, 'application/zip',
+                              as_attachment=True)
 
-    # TODO future: send_from_directory is a safer approach and should be used
-    # as Flask should not be serving files when deployed. Actually, NGINX should serve the files
-    # result_path =
-    path = f'{os.sep}'.join(generate_paths(job_id)[2].split(os.sep)[1:])
-    # take results path, and remove first cagecat occurrence as this is also
-    # pasted by the send_file function
-    return send_file(os.path.join(path, f"{job_id}.zip"))
+    return Response(stream_archive(job_id,
+                                   cache=job.status in ('finished', 'failed')),
+                    mimetype='application/zip',
+                    headers={'Content-Disposition':
+                             f'attachment; filename={job_id}.zip'})
 
 
 @result.route("/", methods=["GET", "POST"])
@@ -175,105 +189,137 @@ def result_from_job_id() -> t.Union[str, str]: # actual other Union return type
 
 
 @result.route("/stage/<job_id>")
-def get_execution_stage(job_id: str):
-    job = fetch_job_from_db(job_id)
-    # main_search_job = job.main_search_job
-    # print(job)
-    #
-    # job_type = job.job_type
-    # if job.job_type == 'search' and main_search_job != 'null':
-    #     job_type = 'recompute'
-    #     print('We changed it!')
-    #
-    # print('The new job_type is', job_type)
-    # print(main_search_job)
-    # print(type(main_search_job))
-    # print(main_search_job == 'null')
-    stages = get_execution_stages_log_descriptors(
-        job_type=job.job_type,
-        job_id=job.id
-    )
+def get_execution_stage(job_id: str) -> str:
+    """Returns the current execution stage of a job
 
-    log_base = generate_paths(job_id)[1]
-    log_fn = os.path.join(log_base, f'{job_id}.log')
+    Input:
+        - job_id: job ID for which the execution stage is requested
 
-    # queued situation
-    # running situation
-    with open(log_fn) as inf:
-        logs = inf.read()
+    Output:
+        - JSON with the index of the last finished stage ("finished") and
+            the total number of stages ("total")
 
-    data = {
-        'finished': -1,
-        'total': len(stages)
-    }
-    print(stages)
-    for stage in stages:
-        if stage in logs:
-            print(stage, 'is in contents')
-            data['finished'] += 1
+    The stage is published to Redis by the worker executing the job. Only
+    when no stage was published (e.g. for jobs started before stages were
+    published), the log file of the job is inspected.
+    """
+    data = fetch_stage(job_id)
+
+    if data is None:
+        data = get_execution_stage_from_logs(job_id)
 
     return json.dumps(data)
 
 
-@result.route("/plots/<job_id>")
-def get_plot_contents(job_id) -> str:
-    """Returns the HTML code of a plot as a string
+@result.route("/events/<job_id>")
+def stream_job_events(job_id: str) -> flask.wrappers.Response:
+    """Streams status and stage changes of a job as server-sent events
 
     Input:
-        - job_id: job ID for which the plot is requested
+        - job_id: job ID for which updates are requested
 
+    Output:
+        - event stream. The first event contains the current status (and
+            stage, if known) of the job, after which events are only sent
+            when the worker publishes a change
+
+    The stream is closed after status_stream_conf['timeout'] seconds, or
+    when the job has finished or failed. Browsers reconnect automatically.
+
+    In deployment, this route is served by a separate gevent uwsgi instance
+    (config_files/cagecat_events.ini), as an open stream would otherwise
+    occupy one of the threads serving the pages for the whole timeout.
     """
-    return prepare_finished_result(job_id, fetch_job_from_db(
-        job_id).job_type)[0]
+    # subscribe before reading the current state, so no update can be missed
+    pubsub = subscribe_to_job_events(job_id)
 
-# Helper functions
-def get_execution_stages_front_end(job_type: str, job_id: str):
-    # TODO merge with get_execution_stages_log_descriptors
-    log_base = generate_paths(job_id)[1]
-    cmd_fp = os.path.join(log_base, f'{job_id}_command.txt')
-    with open(cmd_fp) as inf:
-        contents = inf.read()
+    job = fetch_job_from_db(job_id)
+    if job is None:
+        pubsub.close()
+        return Response(status=404)
 
-    stages_front_end: list = copy.deepcopy(execution_stages_front_end[job_type])
+    status = job.status
+    initial_events = [{'event': 'status', 'status': status}]
+    stage = fetch_stage(job_id)
+    if stage is not None:
+        initial_events.append(dict(event='stage', **stage))
 
-    if job_type == 'search':
-        if '--recompute' in contents:
-            stages_front_end: list = copy.deepcopy(execution_stages_front_end['recompute'])
-            index = 2
-        else:
-            index = 5
+    def generate_events() -> t.Iterator[str]:
+        try:
+            yield f'retry: {status_stream_conf["reconnect_ms"]}\n\n'
 
-        if '--intermediate_genes' in contents:
-            stages_front_end.insert(index, 'Fetching intermediate genes from NCBI')
+            events = initial_events
+            if status not in ('finished', 'failed'):
+                events = itertools.chain(initial_events, iterate_job_events(
+                    pubsub, status_stream_conf['timeout']))
 
-    elif job_type == 'extract_sequences':
-        if '--extract_sequences' in contents:
-            stages_front_end.insert(2, 'Fetch sequences from NCBI')
+            for event in events:
+                yield f'event: {event["event"]}\ndata: {json.dumps(event)}\n\n'
 
-    return stages_front_end
+                if event['event'] == 'status' and \
+                        event['status'] in ('finished', 'failed'):
+                    break
+        finally:
+            pubsub.close()
 
+    return Response(generate_events(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache',
+                             'X-Accel-Buffering': 'no'})
 
-def get_execution_stages_log_descriptors(job_type: str, job_id: str):
-    # TODO merge with get_execution_stages_front_end
-    log_base = generate_paths(job_id)[1]
-    cmd_fp = os.path.join(log_base, f'{job_id}_command.txt')
-    with open(cmd_fp) as inf:
-        contents = inf.read()
 
-    stages_log_descriptors: list = copy.deepcopy(execution_stages_log_descriptors[job_type])
+@result.route("/plots/<job_id>")
+def get_plot_contents(job_id) -> flask.wrappers.Response:
+    """Returns the HTML code of a plot
+
+    Input:
+        - job_id: job ID for which the plot is requested
 
-    if job_type == 'search':
-        if '--recompute' in contents:
-            stages_log_descriptors: list = copy.deepcopy(execution_stages_log_descriptors['recompute'])
-            index = 2
-        else:
-            index = 6
+    Output:
+        - the plot, sent by nginx if configured (see serve_job_file) OR
+        - empty response (304) if the browser already has the plot OR
+        - not found page if the job has no plot
+    """
+    job = fetch_job_from_db(job_id)
+    plot_path = get_plot_path(job_id)
+
+    if job is None or job.status != "finished" or \
+            job.job_type not in modules_with_plots or \
+            not os.path.exists(plot_path):
+        return show_template("job_not_found.html", job_id=job_id,
+                             stat_code=404)
+
+    return serve_job_file(plot_path, 'text/html', precompressed=True)
+
+
+# Helper functions
+def get_execution_stage_from_logs(job_id: str) -> t.Dict[str, int]:
+    """Determines the current execution stage of a job from its log file
+
+    Input:
+        - job_id: job ID for which the execution stage is requested
+
+    Output:
+        - dict with the index of the last finished stage ("finished") and
+            the total number of stages ("total")
+    """
+    job = fetch_job_from_db(job_id)
+    stages = get_execution_stages_log_descriptors(
+        job_type=job.job_type,
+        job_id=job.id
+    )
 
-        if '--intermediate_genes' in contents:
-            stages_log_descriptors.insert(index, 'Searching for intermediate genes')
+    log_base = generate_paths(job_id)[1]
+    log_fn = os.path.join(log_base, f'{job_id}.log')
 
-    elif job_type == 'extract_sequences':
-        if '--extract_sequences' in contents:
-            stages_log_descriptors.insert(2, 'Querying NCBI')
+    with open(log_fn) as inf:
+        logs = inf.read()
+
+    data = {
+        'finished': -1,
+        'total': len(stages)
+    }
+    for stage in stages:
+        if stage in logs:
+            data['finished'] += 1
 
-    return stages_log_descriptors
+    return data
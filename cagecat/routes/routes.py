@@ -9,20 +9,20 @@ from flask import url_for, redirect, request
 import os
 
 # own project imports
-from cagecat.const import submit_url, extract_clusters_options, jobs_dir, hmm_database_organisms
+from cagecat.const import submit_url, extract_clusters_options, jobs_dir
 from cagecat.docs.help_texts import help_texts
 from cagecat.general_utils import show_template, get_server_info, fetch_job_from_db
 
 from cagecat import app
 from cagecat.classes import CAGECATJob
+from cagecat.hmm_databases import update_hmm_database_catalogue
+from cagecat.workers.search_cache import get_search_cache_statistics
 from cagecat.forms.forms import CblasterSearchBaseForm, CblasterRecomputeForm, CblasterSearchForm, CblasterGNEForm, CblasterExtractSequencesForm, \
     CblasterExtractClustersForm, CblasterVisualisationForm, ClinkerBaseForm, ClinkerDownstreamForm, ClinkerInitialForm, CblasterSearchHMMForm
 from cagecat.routes.submit_job_helpers import validate_full_form, generate_job_id, create_directories, prepare_search, get_previous_job_properties, \
     save_file, enqueue_jobs
 from config_files.config import cagecat_version
-from config_files.sensitive import finished_hmm_db_folder
 
-global available_hmm_databases
 # route definitions
 
 @app.route('/cagecat')
@@ -81,29 +81,28 @@ def get_server_status():
     return get_server_info()
 
 
-@app.route('/update-hmm-databases')
-def update_hmm_databases():
-    global available_hmm_databases
-    # Doesn't have to return anything, only trigger
-    all_databases = {}
+@app.route('/status/search-cache')
+def get_search_cache_status():
+    """Returns the hit/miss counters of the cblaster search result cache
 
-    for organism_folder in os.listdir(finished_hmm_db_folder):
-        genera = set()
-        if organism_folder == 'logs':
-            continue
-
-        if organism_folder not in hmm_database_organisms:
-            return 'Incorrect organism folder in HMM databases'
-
-        organism_path = os.path.join(finished_hmm_db_folder, organism_folder)
-        for file in os.listdir(organism_path):
-            genus = file.split('.')[0]
+    Output:
+        - dict with counters of the search cache
+    """
+    return get_search_cache_statistics()
 
-            genera.add(genus)
 
-        all_databases[organism_folder.capitalize()] = sorted(list(genera))
+@app.route('/update-hmm-databases')
+def update_hmm_databases():
+    """Rescans the available HMM databases for all processes
 
-    available_hmm_databases = all_databases
+    Output:
+        - '1' if the catalogue of HMM databases was updated successfully
+    """
+    # Doesn't have to return anything, only trigger
+    try:
+        update_hmm_database_catalogue()
+    except ValueError as e:
+        return str(e)
 
     return '1'  # indicating everything went well
 
@@ -127,10 +126,6 @@ def invalid_method():
     return redirect(url_for("home_page"))
 
 
-update_hmm_databases()
-# within routes.py to prevent circular import (as it was first in const.py).
-# Additionally, this variable does not have to be updated manually, and
-# is therefore left out of const.py
 @app.route(submit_url, methods=["POST"])
 def submit_job() -> str:
     """Handles job submissions by putting it onto the Redis queue
@@ -10,12 +10,14 @@ import werkzeug.datastructures
 import werkzeug.utils
 
 from flask import request
+from rq.job import JobStatus
 
-from cagecat import q, db
+from cagecat import queues, r, db
 from cagecat.classes import CAGECATJob
-from cagecat.general_utils import fetch_job_from_db
+from cagecat.general_utils import fetch_job_from_db, invalidate_server_info
 from cagecat.const import jobs_dir, folders_to_create
-from cagecat.db_models import Job as dbJob
+from cagecat.db_models import Job as dbJob, JobLink
+from cagecat.job_durations import get_duration_keys
 
 
 def prepare_search(job_id: str, job_type: str) -> t.Tuple[str, str]:
@@ -72,64 +74,132 @@ def get_previous_job_properties(job_id: str, job_type: str,
 
 
 def enqueue_jobs(new_jobs: t.List[CAGECATJob]) -> str:
-    """Enqueues jobs on the Redis queue
+    """Enqueues jobs on the Redis queues of their job types
 
     Input:
-        - new_jobs: list of CAGECAT jobs that should be enqueued
+        - new_jobs: list of CAGECAT jobs that should be enqueued. A job with
+            depends_on_job_id set depends on the job preceding it in the list
 
     Output:
         - last_job_id: job ID of the last added job. Used to show appropriate
             results page and fetch a job which this job depends on, if
             applicable
+
+    The complete job graph is built before anything is stored. All database
+    entries (including the links to connected jobs) are committed in a
+    single transaction. The rq jobs are prepared in a
+    Redis transaction, which is only executed after the database commit
+    succeeded, so a worker never starts a job without a database entry.
+    If the database commit fails, the prepared rq jobs are discarded; if
+    enqueueing fails, the committed database entries are removed again.
+
+    Each job is enqueued on the queue it was routed to (see
+    classes.get_queue_name). A dependent job is enqueued on its own queue
+    once its dependency has finished.
     """
     if len(new_jobs) == 0:
         raise IOError("Submitted a job, but no job added to the list")
 
-    created_redis_jobs_ids = []
+    parent_jobs = get_parent_jobs(new_jobs)
 
+    redis_jobs = []
+    db_jobs = []
+    db_links = []
     for i, cc_job in enumerate(new_jobs):  # cc_job = cagecat_job (CAGECATJob)
         create_directories(cc_job.job_id)
         save_settings(cc_job.options, cc_job.job_id)
 
         depending_on = None if cc_job.depends_on_job_id is None else \
-            created_redis_jobs_ids[i-1][1]
-
-        job = q.enqueue(cc_job.function,
-                        args=(cc_job.job_id, ),
-                        kwargs={'options': cc_job.options,
-                                'file_path': cc_job.file_path},
-                        depends_on=depending_on,
-                        result_ttl=86400)
-
-        main_search_job_id = add_parent_search_and_child_jobs_to_db(cc_job, i == len(new_jobs)-1)
-
-        j = dbJob(id=cc_job.job_id,
-                  status="queued" if depending_on is None else "waiting",  # for parent job to finish
-                  job_type=cc_job.job_type,
-                  redis_id=job.id,
-                  depending_on='null' if depending_on is None else cc_job.depends_on_job_id,
-                  main_search_job=main_search_job_id,
-                  title=cc_job.title,
-                  email=cc_job.email)
-
-        db.session.add(j)
+            redis_jobs[i-1]
+
+        queue = queues[cc_job.queue_name]
+        redis_job = queue.create_job(cc_job.function,
+                                     args=(cc_job.job_id, ),
+                                     kwargs={'options': cc_job.options,
+                                             'file_path': cc_job.file_path},
+                                     depends_on=depending_on,
+                                     job_timeout=cc_job.resource_profile.get_job_timeout(),
+                                     result_ttl=86400,
+                                     meta={'duration_keys': get_duration_keys(
+                                         cc_job.job_type, cc_job.options,
+                                         cc_job.file_path)})
+
+        main_search_job_id = get_main_search_job_id(cc_job, parent_jobs[i])
+        db_links.extend(create_job_links(cc_job.job_id, main_search_job_id,
+                                         cc_job.depends_on_job_id))
+
+        db_jobs.append(dbJob(id=cc_job.job_id,
+                             status="queued" if depending_on is None else "waiting",  # for parent job to finish
+                             job_type=cc_job.job_type,
+                             redis_id=redis_job.id,
+                             depending_on='null' if depending_on is None else cc_job.depends_on_job_id,
+                             main_search_job=main_search_job_id,
+                             title=cc_job.title,
+                             email=cc_job.email))
+        redis_jobs.append(redis_job)
+
+    pipe = r.pipeline()
+    for redis_job in redis_jobs:
+        if redis_job.dependency_ids:
+            # its dependency is part of the same transaction, and therefore
+            # never finished yet: defer it until its dependency has finished
+            redis_job.set_status(JobStatus.DEFERRED, pipeline=pipe)
+            redis_job.register_dependency(pipeline=pipe)
+            redis_job.save(pipeline=pipe)
+        else:
+            queues[redis_job.origin].enqueue_job(redis_job, pipeline=pipe)
+
+    db.session.add_all(db_jobs)
+    db.session.add_all(db_links)
+    try:
         db.session.commit()
+    except Exception:
+        db.session.rollback()
+        pipe.reset()  # rq jobs were not sent to Redis yet
+        raise
+
+    try:
+        pipe.execute()
+    except Exception:
+        for j in db_links + db_jobs:
+            db.session.delete(j)
+        db.session.commit()
+        raise
 
-        created_redis_jobs_ids.append((cc_job.job_id, job.id))
-        last_job_id = cc_job.job_id
+    invalidate_server_info()  # number of queued jobs has changed
+    return new_jobs[-1].job_id
 
-    return last_job_id
 
+def get_parent_jobs(new_jobs: t.List[CAGECATJob]) \
+        -> t.List[t.Union[str, dbJob, None]]:
+    """Fetches the parent jobs of all jobs to be enqueued in a single query
 
-def add_parent_search_and_child_jobs_to_db(new_job: CAGECATJob,
-                                           is_last_job: bool) -> str:
-    """Adds the main search job and its children to the new_job in db
+    Input:
+        - new_jobs: list of CAGECAT jobs that should be enqueued
+
+    Output:
+        - per job: 'null' if the job has no parent job, the parent Job
+            instance, or None if the parent job was not found
+    """
+    parent_ids = [get_parent_job_id(cc_job, i == len(new_jobs)-1)
+                  for i, cc_job in enumerate(new_jobs)]
+
+    ids_to_fetch = {p_id for p_id in parent_ids if p_id != 'null'}
+    fetched = {} if not ids_to_fetch else \
+        {j.id: j for j in dbJob.query.filter(dbJob.id.in_(ids_to_fetch))}
+
+    return ['null' if p_id == 'null' else fetched.get(p_id)
+            for p_id in parent_ids]
+
+
+def get_main_search_job_id(new_job: CAGECATJob,
+                           parent_job: t.Union[str, dbJob, None]) -> str:
+    """Determines the main search job of a new job
 
     Input:
-        - new_job: a CAGECAT job of which the connected jobs should be
-            added to the SQL db
-        - is_last_job: indicates if this is the last job being added to the
-            queue (used in enqueue_jobs())
+        - new_job: a CAGECAT job of which the main search job is asked for
+        - parent_job: the job the new job depends on, as returned by
+            get_parent_jobs
 
     Output:
         - job id of the main search job
@@ -137,26 +207,44 @@ def add_parent_search_and_child_jobs_to_db(new_job: CAGECATJob,
     if new_job.get_job_type() == 'search':
         main_search_job_id = "null"
     else:
-        old_job = get_parent_job(new_job, is_last_job)
-
-        if old_job == 'null':
+        if parent_job == 'null':
             main_search_job_id = 'null'
-        elif old_job.job_type == "search":
-            main_search_job_id = old_job.id
-            main_search_job = fetch_job_from_db(main_search_job_id)
-
-            sep = "" if not main_search_job.child_jobs else ","
-            main_search_job.child_jobs += f"{sep}{new_job.job_id}"
-            # empty string for the first child job
+        elif parent_job.job_type == "search":
+            main_search_job_id = parent_job.id
         else:
-            main_search_job_id = old_job.main_search_job
+            main_search_job_id = parent_job.main_search_job
 
     return main_search_job_id
 
 
-def get_parent_job(new_job: CAGECATJob,
-                   is_last_job: bool) -> t.Union[str, dbJob, None]:
-    """Gets the parent job of a job (i.e. the job this job depends on)
+def create_job_links(job_id: str, main_search_job_id: str,
+                     depending_on: t.Optional[str]) -> t.List[JobLink]:
+    """Creates the links of a new job to the jobs it is connected to
+
+    Input:
+        - job_id: ID of the new job
+        - main_search_job_id: ID of the main search job of the new job, or
+            'null' if there is none
+        - depending_on: ID of the job the new job depends on, if applicable
+
+    Output:
+        - links to be added to the SQL db
+    """
+    links = []
+
+    if main_search_job_id != 'null':
+        links.append(JobLink(parent_id=main_search_job_id, child_id=job_id,
+                             link_type='main_search'))
+
+    if depending_on is not None:
+        links.append(JobLink(parent_id=depending_on, child_id=job_id,
+                             link_type='depending'))
+
+    return links
+
+
+def get_parent_job_id(new_job: CAGECATJob, is_last_job: bool) -> str:
+    """Gets the ID of the parent job of a job (i.e. the job this job depends on)
 
     Input:
         - new_job: a CAGECAT job of which the parent job should be fetched
@@ -164,9 +252,12 @@ def get_parent_job(new_job: CAGECATJob,
             queue (used in enqueue_jobs())
 
     Output:
-        - parent Job instance
+        - parent job ID, or 'null' if the job has no parent job
     """
     j_type = new_job.get_job_type()
+    if j_type == 'search':
+        return 'null'
+
     if j_type in ("recompute", "gne", "clinker"):
         # are modules which use the prev_session macro to get the previous session ID
         # might change in the future
@@ -186,8 +277,7 @@ def get_parent_job(new_job: CAGECATJob,
     else:
         key = "prev_job_id"
 
-    return fetch_job_from_db(
-        new_job.options[key] if is_last_job else new_job.file_path.split(os.sep)[2])
+    return new_job.options[key] if is_last_job else new_job.file_path.split(os.sep)[2]
 
 
 def validate_full_form(form_type, request_form):
@@ -4,24 +4,26 @@ var jobIDPattern = "^([A-Z]\\d{3}){3}[A-Z]\\d{2}$"
 var months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"];
 var checkmarkPath = 'https://cagecat.bioinformatics.nl/static/images/checkmark.svg'
 
+function showJobExecutionStage(data){
+    if (data['finished'] === data['total'] - 1){
+        redirect(window.location.href);
+    }
+
+    for (let i = 1; i < (data['finished']+1); i++){
+        let elem = document.getElementById('stage' + i.toString());
+        elem.src = checkmarkPath;
+        elem.style.width = '25px';
+    }
+
+    let percentage = Math.round(data['finished'] / data['total'] * 100)
+    // document.getElementById('progress').innerText = percentage.toString() + '%';
+    // console.log(percentage);
+}
+
 function updateJobExecutionStage(url){
     $.ajax(url, {
         dataType: 'json',
-        success: function(data){
-            if (data['finished'] === data['total'] - 1){
-                redirect(window.location.href);
-            }
-
-            for (let i = 1; i < (data['finished']+1); i++){
-                let elem = document.getElementById('stage' + i.toString());
-                elem.src = checkmarkPath;
-                elem.style.width = '25px';
-            }
-
-            let percentage = Math.round(data['finished'] / data['total'] * 100)
-            // document.getElementById('progress').innerText = percentage.toString() + '%';
-            // console.log(percentage);
-        },
+        success: showJobExecutionStage,
         error: function(data){
             console.log('Error fetching stage. Returned:' + data);
         }
@@ -29,11 +31,33 @@ function updateJobExecutionStage(url){
 }
 
 function startJobExecutionStageUpdater(job_id){
-    let url = 'https://cagecat.bioinformatics.nl/results/stage/' + job_id
-    updateJobExecutionStage(url);
-    setInterval(updateJobExecutionStage, 5000, url)
+    if (typeof(EventSource) === 'undefined'){  // fall back to polling
+        let url = 'https://cagecat.bioinformatics.nl/results/stage/' + job_id
+        updateJobExecutionStage(url);
+        setInterval(updateJobExecutionStage, 5000, url)
+        return;
+    }
+
+    // status and stage changes are pushed by the server
+    let initialStatus = null;
+    let source = new EventSource('/results/events/' + job_id);
 
+    source.addEventListener('status', function(event){
+        let status = JSON.parse(event.data)['status'];
 
+        if (initialStatus === null){
+            initialStatus = status;
+        }
+
+        if (status !== initialStatus){  // e.g. queued -> running or finished
+            source.close();
+            redirect(window.location.href);
+        }
+    });
+
+    source.addEventListener('stage', function(event){
+        showJobExecutionStage(JSON.parse(event.data));
+    });
 }
 
 function enableOrDisableOption(id, enable) {
@@ -750,6 +774,17 @@ function postLoadingIFrame(){
     document.getElementById("loadingImage").classList.add('no-display');
 }
 
+function loadPlot(button){
+    // large plots are only loaded when requested by the user
+    let frame = document.getElementById("newWindow");
+    frame.setAttribute('onload', frame.dataset.onload);
+    frame.src = frame.dataset.src;
+
+    button.remove();
+    document.getElementById("resultLoadedMessage").innerText = 'Result is being loaded..';
+    document.getElementById("loadingImage").classList.remove('no-display');
+}
+
 function storeJobId(id, j_type, j_title){
     let maxToShow = 250;
 
@@ -878,6 +913,13 @@ setInterval(function(){
             $('#status_running')[0].innerText = data['running'];
             $('#status_queued')[0].innerText = data['queued'];
             $('#status_completed')[0].innerText = data['completed'];
+
+            for (const [name, queue] of Object.entries(data['queues'])) {
+                let element = $(`#status_queue_${name}`)[0];
+                if (element !== undefined) {
+                    element.innerText = `${queue['queued']} (${queue['estimated_wait_text']})`;
+                }
+            }
         },
         error: function (data){
             console.log('Unable to fetch server status')
@@ -10,7 +10,7 @@ from flask import Blueprint, request
 from cagecat.tools.tools_helpers import read_headers, parse_selected_cluster_numbers
 from cagecat.forms.forms import CblasterSearchForm, CblasterGNEForm, CblasterExtractSequencesForm, \
     CblasterExtractClustersForm, CblasterVisualisationForm, ClinkerDownstreamForm, ClinkerInitialForm
-from cagecat.routes.routes import available_hmm_databases
+from cagecat.hmm_databases import get_available_hmm_databases
 from cagecat.general_utils import show_template, fetch_job_from_db
 from cagecat.const import tool_explanations, clinker_modules, genbank_extensions, fasta_extensions, clust_number_with_score_pattern, \
     clust_number_with_clinker_score_pattern
@@ -65,7 +65,7 @@ def cblaster_search(prev_run_id: str = None) -> str:
                          prev_run_id=prev_run_id,
                          module_to_show=module_to_show,
                          headers=headers,
-                         organism_databases=available_hmm_databases,
+                         organism_databases=get_available_hmm_databases(),
                          query_file_extensions=','.join(fasta_extensions + genbank_extensions),
                          show_examples='cblaster_search')
 
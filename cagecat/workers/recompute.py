@@ -0,0 +1,339 @@
+"""In-process recomputation of cblaster search sessions
+
+Recompute jobs apply new filtering and clustering thresholds to the session
+of a previous search. Instead of starting a new cblaster process (which has
+to parse the full session file again), the parsed session of a parent job
+is kept in memory by the worker, so users iterating on thresholds only pay
+for the filtering itself.
+
+As no child process is started, the limits of the recompute resource
+profile cannot be set with setrlimit (they would apply to the worker
+itself). Instead, they are checked between the stages of a recompute, and
+sessions too large to be recomputed within the memory limit are recomputed
+by cblaster in a limited child process (see run_command).
+
+Author: Matthias van den Belt
+"""
+
+# package imports
+import copy
+import logging
+import os
+import time
+import typing as t
+from collections import OrderedDict
+
+from cblaster import context
+from cblaster.classes import Session
+from cblaster.intermediate_genes import find_intermediate_genes
+from cblaster.plot import plot_session
+
+# own project imports
+from cagecat.const import resource_limits_exceeded
+from cagecat.general_utils import generate_paths
+from cagecat.progress import create_stage_tracker, StageTrackingHandler
+from config_files.config import recompute_conf
+
+# typing imports
+from werkzeug.datastructures import ImmutableMultiDict
+
+LOG = logging.getLogger(__name__)
+
+# parent job ID -> (modification time of session file, parsed session)
+loaded_sessions = OrderedDict()
+
+binary_key_functions = {'len': len, 'max': max, 'sum': sum}
+
+# defaults of cblaster search, used for thresholds which are not submitted
+# (HMM mode) and the number of plotted clusters (--max_plot_clusters)
+default_thresholds = {'min_identity': 30.0, 'min_coverage': 50.0,
+                      'max_evalue': 0.01}
+max_plot_clusters = 50
+
+
+class ResourceLimitsExceeded(Exception):
+    """Raised when an in-process recompute exceeds its resource profile"""
+
+
+class ResourceGuard:
+    """Class to check the usage of a recompute against its resource profile
+
+    Input:
+        - profile: resource profile of recompute jobs
+
+    The wall-clock and CPU time are counted from the creation of the guard.
+    The memory limit is compared with the resident memory of the worker, as
+    the address space of the worker also contains memory which is not used.
+    """
+
+    def __init__(self, profile):
+        self.profile = profile
+        self.start = time.monotonic()
+        self.start_cpu_time = time.process_time()
+
+    def check(self) -> None:
+        """Checks whether the recompute is still within its limits
+
+        Output:
+            - None, raised ResourceLimitsExceeded if a limit was exceeded
+        """
+        elapsed = time.monotonic() - self.start
+        if elapsed > self.profile.timeout:
+            raise ResourceLimitsExceeded(f'timeout: {self.profile.timeout}s')
+
+        cpu_time = time.process_time() - self.start_cpu_time
+        if self.profile.cpu_time is not None and \
+                cpu_time > self.profile.cpu_time:
+            raise ResourceLimitsExceeded(
+                f'CPU time: {self.profile.cpu_time}s')
+
+        if self.profile.memory is not None and \
+                get_resident_memory() > self.profile.memory:
+            raise ResourceLimitsExceeded(
+                f'memory: {self.profile.memory} bytes')
+
+
+def get_resident_memory() -> int:
+    """Returns the resident memory of the current process
+
+    Output:
+        - resident memory in bytes
+    """
+    with open('/proc/self/statm') as inf:
+        resident_pages = int(inf.read().split()[1])
+
+    return resident_pages * os.sysconf('SC_PAGE_SIZE')
+
+
+def get_recompute_profile():
+    """Returns the resource profile of recompute jobs
+
+    Output:
+        - ResourceProfile of recompute jobs
+    """
+    # imported here, as classes imports the workers module
+    from cagecat.classes import resource_profiles
+
+    return resource_profiles['recompute']
+
+
+def fits_in_process(session_path: str) -> bool:
+    """Determines whether a session can be recomputed in-process
+
+    Input:
+        - session_path: path to the session file of the parent job
+
+    Output:
+        - True if the parsed session (and its copy) are expected to stay
+            within the memory limit of recompute jobs. Larger sessions are
+            recomputed by cblaster, in a child process with the limits set
+    """
+    memory = get_recompute_profile().memory
+    if memory is None:
+        return True
+
+    return os.path.getsize(session_path) * \
+        recompute_conf['session_memory_factor'] <= memory
+
+
+def load_parent_session(session_path: str) -> Session:
+    """Returns a copy of the parsed session of a parent job
+
+    Input:
+        - session_path: path to the session file of the parent job. Has the
+            following structure: "cagecat/jobs/{job_id}/results/
+            {job_id}_session.json"
+
+    Output:
+        - session: copy of the parsed session, which can be filtered without
+            affecting the memoized session
+
+    Parsed sessions are memoized per parent job ID. The least recently used
+    sessions are discarded when more than recompute_conf
+    ['max_cached_sessions'] sessions are stored.
+    """
+    parent_job_id = session_path.split(os.sep)[-3]
+    mtime = os.path.getmtime(session_path)
+
+    if parent_job_id in loaded_sessions and \
+            loaded_sessions[parent_job_id][0] == mtime:
+        loaded_sessions.move_to_end(parent_job_id)
+    else:
+        loaded_sessions[parent_job_id] = (mtime,
+                                          Session.from_file(session_path))
+
+        while len(loaded_sessions) > recompute_conf['max_cached_sessions']:
+            loaded_sessions.popitem(last=False)
+
+    return copy.deepcopy(loaded_sessions[parent_job_id][1])
+
+
+def recompute_session(job_id: str, options: ImmutableMultiDict,
+                      session_path: str, command: str) -> int:
+    """Filters the session of a parent job with new thresholds
+
+    Input:
+        - job_id: ID of the submitted recompute job
+        - options: user submitted parameters via HTML form
+        - session_path: path to the session file of the parent job
+        - command: equivalent cblaster command, used to determine the
+            execution stages of the job
+
+    Output:
+        - return_code: 0 if the session was recomputed successfully. Written
+            are the same output files as "cblaster search --recompute"
+            would write (session, summary, binary table and plot)
+
+    Log messages are written in the same format as cblaster's, and are
+    passed to a StageTracker to publish the execution stages of the job.
+
+    The limits of the recompute resource profile are checked between the
+    stages (see ResourceGuard). A recompute exceeding them is stopped, and
+    recorded in the log of the job, so the failure reason can be shown to
+    the user.
+    """
+    _, log_path, results_path = generate_paths(job_id)
+
+    handler = logging.FileHandler(os.path.join(log_path, f'{job_id}.log'),
+                                  mode='w')
+    handler.setFormatter(logging.Formatter(
+        '[%(asctime)s] %(levelname)s - %(message)s', datefmt='%H:%M:%S'))
+    handlers = [handler]
+
+    tracker = create_stage_tracker(job_id, 'recompute', command)
+    if tracker is not None:
+        handlers.append(StageTrackingHandler(tracker))
+
+    loggers = (LOG, logging.getLogger('cblaster'))
+    for logger in loggers:
+        logger.setLevel(logging.INFO)
+        for h in handlers:
+            logger.addHandler(h)
+
+    guard = ResourceGuard(get_recompute_profile())
+
+    try:
+        LOG.info('Loading session(s) %s', session_path)
+        session = load_parent_session(session_path)
+        guard.check()
+
+        LOG.info('Filtering session with new thresholds')
+        arguments = get_filtering_arguments(options)
+        context.filter_session(session, **arguments)
+        update_session_params(session, arguments)
+        guard.check()
+
+        if 'intermediate_genes' in options:
+            find_intermediate_genes(
+                session,
+                int(options['intermediate_max_distance']),
+                int(options['intermediate_max_clusters']))
+            guard.check()
+
+        recomputed_path = os.path.join(results_path,
+                                       f'{job_id}_session.json')
+        LOG.info('Writing recomputed session to %s', recomputed_path)
+        with open(recomputed_path, 'w') as outf:
+            session.to_json(outf)
+        guard.check()
+
+        write_outputs(job_id, options, session, results_path)
+        LOG.info('Done.')
+        return_code = 0
+    except (ResourceLimitsExceeded, MemoryError) as e:
+        LOG.error('%s (%s)', resource_limits_exceeded, e)
+        return_code = 1
+    finally:
+        for logger in loggers:
+            for h in handlers:
+                logger.removeHandler(h)
+        handler.close()
+
+    return return_code
+
+
+def get_filtering_arguments(options: ImmutableMultiDict) \
+        -> t.Dict[str, t.Union[int, float, t.List[str], None]]:
+    """Converts submitted thresholds to arguments of cblaster's filtering
+
+    Input:
+        - options: user submitted parameters via HTML form
+
+    Output:
+        - keyword arguments for cblaster.context.filter_session
+
+    Mirrors the options added to the command line in cblaster_search.
+    """
+    arguments = {'gap': int(options['max_intergenic_gap']),
+                 'unique': int(options['min_unique_query_hits']),
+                 'min_hits': int(options['min_hits_in_clusters']),
+                 'percentage': int(options['percentageQueryGenes']),
+                 'require': None}
+
+    if options['mode'] != 'hmm':
+        arguments.update({'max_evalue': float(options['max_evalue']),
+                          'min_identity': float(options['min_identity']),
+                          'min_coverage': float(options['min_query_coverage'])})
+
+    if options['requiredSequences']:
+        arguments['require'] = [query.strip().split()[0] for query in
+                                options['requiredSequences'].split(';')]
+
+    return arguments
+
+
+def update_session_params(session: Session,
+                          arguments: t.Dict[str, t.Any]) -> None:
+    """Stores the new thresholds in the parameters of a recomputed session
+
+    Input:
+        - session: filtered session
+        - arguments: keyword arguments passed to
+            cblaster.context.filter_session
+
+    Output:
+        - None, updated session.params. As cblaster search --recompute does,
+            so the recomputed session does not report the thresholds of the
+            parent job
+    """
+    for key, default in default_thresholds.items():
+        session.params[key] = arguments.get(key, default)
+
+    session.params['require'] = arguments['require']
+
+
+def write_outputs(job_id: str, options: ImmutableMultiDict,
+                  session: Session, results_path: str) -> None:
+    """Writes the summary, binary table and plot of a recomputed session
+
+    Input:
+        - job_id: ID of the submitted recompute job
+        - options: user submitted parameters via HTML form
+        - session: filtered session
+        - results_path: path to the results folder of the job
+
+    Output:
+        - None, written summary, binary table and plot
+    """
+    sort_clusters = 'sortClusters' in options
+
+    with open(os.path.join(results_path, f'{job_id}_summary.txt'), 'w') as outf:
+        session.format('summary', fp=outf,
+                       hide_headers='searchSumTableHideHeaders' in options,
+                       delimiter=options['searchSumTableDelim'] or None,
+                       decimals=int(options['searchSumTableDecimals']),
+                       sort_clusters=sort_clusters)
+
+    with open(os.path.join(results_path, f'{job_id}_binary.txt'), 'w') as outf:
+        session.format('binary', fp=outf,
+                       hide_headers='searchBinTableHideHeaders' in options,
+                       delimiter=options['searchBinTableDelim'] or None,
+                       decimals=int(options['searchBinTableDecimals']),
+                       key=binary_key_functions[options['keyFunction']],
+                       attr=options.get('hitAttribute', 'identity'),
+                       sort_clusters=sort_clusters)
+
+    plot_session(session,
+                 output=os.path.join(results_path, f'{job_id}_plot.html'),
+                 sort_clusters=sort_clusters,
+                 max_clusters=max_plot_clusters)
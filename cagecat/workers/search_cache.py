@@ -0,0 +1,273 @@
+"""Result cache for cblaster searches
+
+Identical searches (same query sequences and same result-affecting options)
+are answered by reusing the result files of an earlier job instead of
+running a new remote search. Cache entries are stored in Redis and point to
+the job of which the results can be reused.
+
+Author: Matthias van den Belt
+"""
+
+# package imports
+import hashlib
+import json
+import os
+import shutil
+import time
+import typing as t
+
+# own project imports
+from cagecat import r
+from cagecat.const import fasta_extensions
+from cagecat.general_utils import generate_paths
+from config_files.config import search_cache_conf, job_retention_days
+
+# typing imports
+from werkzeug.datastructures import ImmutableMultiDict
+
+# options which do not influence the results of a search
+options_excluded_from_key = ('job_title', 'mail_address', 'job_type',
+                             'submit', 'csrf_token',
+                             'requiredSequencesSelector')
+
+# result files (suffixes after the job ID) which are reused. Files which are
+# not always generated (e.g. when no intermediate genes were requested) are
+# only reused when they are present
+cached_result_files = ('_session.json', '_summary.txt', '_binary.txt',
+                       '_plot.html')
+optional_cached_result_files = ('_blasthits.txt', '_ipg.txt')
+
+entry_prefix = 'cagecat:search_cache:entry:'
+job_prefix = 'cagecat:search_cache:job:'
+index_key = 'cagecat:search_cache:index'
+stats_key = 'cagecat:search_cache:stats'
+
+
+def get_cache_ttl() -> int:
+    """Returns the time-to-live of cache entries in seconds
+
+    Output:
+        - ttl: seconds a cache entry remains valid. Never exceeds the
+            period after which results of a job are deleted from the server
+    """
+    ttl_days = min(search_cache_conf['ttl_days'], job_retention_days - 1)
+    return ttl_days * 86400
+
+
+def canonicalize_query_file(file_path: str) -> str:
+    """Returns a canonical representation of an uploaded query file
+
+    Input:
+        - file_path: path to the uploaded query file (FASTA or GenBank)
+
+    Output:
+        - canonical representation of the query sequences
+
+    For FASTA files, only the identifier and the (uppercase) sequence are
+    used, so differences in descriptions, line wrapping or line endings do
+    not result in a different cache key.
+    """
+    ext = '.' + file_path.split('.')[-1]
+
+    with open(file_path) as inf:
+        lines = [line.strip() for line in inf]
+
+    if ext not in fasta_extensions:
+        return '\n'.join(lines)
+
+    records = []
+    for line in lines:
+        if line.startswith('>'):
+            records.append([line[1:].split()[0] if line[1:].split() else '', ''])
+        elif line and records:
+            records[-1][1] += ''.join(line.split()).upper().rstrip('*')
+
+    return '\n'.join(f'>{header}\n{seq}' for header, seq in records)
+
+
+def compute_search_cache_key(options: ImmutableMultiDict,
+                             file_path: t.Union[str, None],
+                             database_args: t.List[str]) -> str:
+    """Computes the key under which the results of a search are cached
+
+    Input:
+        - options: user submitted parameters via HTML form
+        - file_path: path to an uploaded query file, if applicable
+        - database_args: database arguments as forged by
+            forge_database_args
+
+    Output:
+        - hexadecimal SHA-256 hash of the queries and normalized options
+    """
+    normalized_options = sorted(
+        (key, str(value).strip()) for key, value in options.items()
+        if key not in options_excluded_from_key)
+
+    if options.get('inputType') == 'file' and file_path is not None:
+        queries = canonicalize_query_file(file_path)
+    elif options.get('inputType') == 'ncbi_entries':
+        queries = '\n'.join(options['ncbiEntriesTextArea'].split())
+    else:
+        queries = ''
+
+    # local (HMM) databases are rebuilt periodically, after which previous
+    # results should not be reused anymore
+    database_versions = [os.path.getmtime(arg) if os.path.exists(arg) else
+                         None for arg in database_args[1:]]
+
+    contents = json.dumps({'options': normalized_options,
+                           'queries': queries,
+                           'databases': database_args[1:],
+                           'database_versions': database_versions})
+
+    return hashlib.sha256(contents.encode()).hexdigest()
+
+
+def fetch_cached_search(cache_key: str) -> t.Optional[str]:
+    """Looks up a job of which the results can be reused
+
+    Input:
+        - cache_key: key as computed by compute_search_cache_key
+
+    Output:
+        - job ID of the earlier job with identical input OR
+        - None if no (still available) results are present in the cache
+
+    Updates the hit/miss counters of the cache.
+    """
+    source_job_id = r.get(f'{entry_prefix}{cache_key}')
+
+    if source_job_id is not None:
+        source_job_id = source_job_id.decode()
+        results_path = generate_paths(source_job_id)[2]
+
+        if all(os.path.exists(os.path.join(results_path,
+                                           f'{source_job_id}{suffix}'))
+               for suffix in cached_result_files):
+            r.hincrby(stats_key, 'hits', 1)
+            return source_job_id
+
+        # results have been removed in the meantime
+        forget_cached_searches([source_job_id])
+
+    r.hincrby(stats_key, 'misses', 1)
+    return None
+
+
+def restore_cached_search(source_job_id: str, job_id: str) -> None:
+    """Places the results of an earlier job in the results folder of a job
+
+    Input:
+        - source_job_id: ID of the job of which the results are reused
+        - job_id: ID of the job to place the results in
+
+    Output:
+        - None, result files hard-linked (or copied if hard-linking is not
+            possible) to the results folder of job_id. Files are renamed to
+            match the new job ID
+    """
+    source_results = generate_paths(source_job_id)[2]
+    _, log_path, results_path = generate_paths(job_id)
+
+    for suffix in cached_result_files + optional_cached_result_files:
+        source = os.path.join(source_results, f'{source_job_id}{suffix}')
+        if not os.path.exists(source):
+            continue
+
+        destination = os.path.join(results_path, f'{job_id}{suffix}')
+        try:
+            os.link(source, destination)
+        except OSError:  # e.g. different file systems
+            shutil.copy2(source, destination)
+
+    with open(os.path.join(log_path, f'{job_id}.log'), 'w') as outf:
+        outf.write(f'Reused results of job {source_job_id} as it was '
+                   f'submitted with identical input\nINFO - Done.\n')
+
+
+def cache_search_result(cache_key: str, job_id: str) -> None:
+    """Stores a successfully finished search in the cache
+
+    Input:
+        - cache_key: key as computed by compute_search_cache_key
+        - job_id: ID of the finished job of which the results can be reused
+
+    Output:
+        - None, cache entry stored in Redis. Oldest entries are evicted
+            when the cache exceeds its maximum number of entries
+
+    The job referred to by an entry can be looked up by its job ID (see
+    forget_cached_searches). These reverse lookups are removed together
+    with the entry when it is evicted or replaced.
+    """
+    ttl = get_cache_ttl()
+    now = time.time()
+    replaced_job_id = r.get(f'{entry_prefix}{cache_key}')
+
+    pipe = r.pipeline()
+    if replaced_job_id is not None and replaced_job_id.decode() != job_id:
+        pipe.delete(f'{job_prefix}{replaced_job_id.decode()}')
+    pipe.set(f'{entry_prefix}{cache_key}', job_id, ex=ttl)
+    pipe.set(f'{job_prefix}{job_id}', cache_key, ex=ttl)
+    pipe.zadd(index_key, {cache_key: now})
+    pipe.zremrangebyscore(index_key, '-inf', now - ttl)  # already expired
+    pipe.hincrby(stats_key, 'stored', 1)
+    pipe.execute()
+
+    excess = r.zcard(index_key) - search_cache_conf['max_entries']
+    if excess > 0:
+        evicted = [f'{entry_prefix}{key.decode()}'
+                   for key, _ in r.zpopmin(index_key, excess)]
+        evicted_job_ids = [job_id for job_id in r.mget(evicted)
+                           if job_id is not None]
+
+        pipe = r.pipeline()
+        pipe.delete(*evicted)
+        for evicted_job_id in evicted_job_ids:
+            pipe.delete(f'{job_prefix}{evicted_job_id.decode()}')
+        pipe.hincrby(stats_key, 'evicted', len(evicted))
+        pipe.execute()
+
+
+def forget_cached_searches(job_ids: t.Iterable[str]) -> None:
+    """Removes cache entries referring to the given jobs
+
+    Input:
+        - job_ids: IDs of jobs of which the results should not be reused
+            anymore (e.g. as they are deleted from the server)
+
+    Output:
+        - None, removed cache entries
+    """
+    for job_id in job_ids:
+        cache_key = r.get(f'{job_prefix}{job_id}')
+        if cache_key is None:
+            continue
+
+        cache_key = cache_key.decode()
+        r.delete(f'{job_prefix}{job_id}')
+
+        cached_job_id = r.get(f'{entry_prefix}{cache_key}')
+        if cached_job_id is not None and cached_job_id.decode() == job_id:
+            # otherwise, the entry already refers to a more recent job
+            pipe = r.pipeline()
+            pipe.zrem(index_key, cache_key)
+            pipe.delete(f'{entry_prefix}{cache_key}')
+            pipe.execute()
+
+
+def get_search_cache_statistics() -> t.Dict[str, int]:
+    """Returns the counters of the search cache
+
+    Output:
+        - dict with the number of cache hits, misses, stored and evicted
+            entries, and the current number of entries
+    """
+    stats = {key.decode(): int(value) for key, value in
+             r.hgetall(stats_key).items()}
+
+    return {'hits': stats.get('hits', 0),
+            'misses': stats.get('misses', 0),
+            'stored': stats.get('stored', 0),
+            'evicted': stats.get('evicted', 0),
+            'entries': r.zcard(index_key)}
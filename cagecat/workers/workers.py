@@ -8,9 +8,12 @@ import os.path
 
 # own project imports
 from cagecat.workers.workers_helpers import *
+from cagecat.workers.search_cache import compute_search_cache_key, \
+    fetch_cached_search, restore_cached_search, cache_search_result
+from cagecat.workers.recompute import recompute_session, fits_in_process
 
 ### redis-queue functions
-from config_files.config import thresholds
+from config_files.config import thresholds, search_cache_conf
 from config_files.sensitive import pfam_db_folder
 
 
@@ -41,7 +44,8 @@ def cblaster_search(job_id: str, options: ImmutableMultiDict = None,
                "--blast_file", os.path.join(RESULTS_PATH, f"{job_id}_blasthits.txt"),
                "--mode", options["mode"]]
 
-        cmd.extend(forge_database_args(options))
+        database_args = forge_database_args(options)
+        cmd.extend(database_args)
 
         # add input options
         if options['mode'] in ('remote', 'combi_remote'):
@@ -92,6 +96,12 @@ def cblaster_search(job_id: str, options: ImmutableMultiDict = None,
 
         cmd.extend(["--session_file", session_path])
 
+        # a recomputed session refers to the databases of its parent session
+        register_generations(job_id, database_args[1:],
+                             parent_session_path=file_path if recompute
+                             else None,
+                             writes_session=True)
+
         # add filtering options
         if options['mode'] != 'hmm':
             cmd.extend(["--max_evalue", options["max_evalue"],
@@ -142,7 +152,46 @@ def cblaster_search(job_id: str, options: ImmutableMultiDict = None,
                     "--maximum_clusters", options["intermediate_max_clusters"],
                     "--ipg_file", os.path.join(RESULTS_PATH, f"{job_id}_ipg.txt")])
 
+        if recompute:
+            log_command(cmd, LOG_PATH, job_id)
+            return_code = None
+
+            if fits_in_process(session_path):
+                try:
+                    return_code = recompute_session(job_id, options,
+                                                    session_path,
+                                                    " ".join(cmd))
+                except Exception as e:  # intentionally broad except clause
+                    print('In-process recompute failed, using cblaster:', e)
+
+            if return_code is None:
+                return_code = run_command(cmd, LOG_PATH, job_id)
+
+            post_job_formalities(job_id, return_code)
+            return
+
+        cache_key = None
+        if search_cache_conf['enabled']:
+            cache_key = compute_search_cache_key(options, file_path,
+                                                 database_args)
+            source_job_id = fetch_cached_search(cache_key)
+
+            if source_job_id is not None:
+                log_command(cmd, LOG_PATH, job_id)
+                restore_cached_search(source_job_id, job_id)
+
+                rq_job = get_current_job()
+                if rq_job is not None:  # see record_duration
+                    rq_job.meta['cache_hit'] = True
+                    rq_job.save_meta()
+                post_job_formalities(job_id, 0)
+                return
+
         return_code = run_command(cmd, LOG_PATH, job_id)
+
+        if cache_key is not None and return_code == 0:
+            cache_search_result(cache_key, job_id)
+
         post_job_formalities(job_id, return_code)
     except Exception as e:  # intentionally broad except clause
         print('Exception occurred:', e)
@@ -204,6 +253,7 @@ def cblaster_extract_sequences(job_id: str,
     This function forges and executes a cblaster command.
     """
     pre_job_formalities(job_id)
+    register_generations(job_id, [], parent_session_path=file_path)
     _, LOG_PATH, RESULTS_PATH = generate_paths(job_id)
 
     extension = "txt"
@@ -244,6 +294,7 @@ def cblaster_extract_clusters(job_id: str,
     This function forges and executes a cblaster command.
     """
     pre_job_formalities(job_id)
+    register_generations(job_id, [], parent_session_path=file_path)
     _, LOG_PATH, RESULTS_PATH = generate_paths(job_id)
 
     if log_threshold_exceeded(int(options["maxclusters"]),
@@ -336,6 +387,7 @@ def clinker_query(job_id: str, options: ImmutableMultiDict=None,
     This function forges and executes a cblaster command.
     """
     pre_job_formalities(job_id)
+    register_generations(job_id, [], parent_session_path=file_path)
     _, LOG_PATH, RESULTS_PATH = generate_paths(job_id)
 
     if log_threshold_exceeded(int(options['maxclusters']),
@@ -4,19 +4,34 @@ Author: Matthias van den Belt
 """
 
 # package imports
+import gzip
+import shutil
+import signal
 import subprocess
 import os
+import threading
 
 # own project imports
 from datetime import datetime
 
 from flask_sqlalchemy import SQLAlchemy
+from rq import get_current_job
 
-from cagecat.general_utils import fetch_job_from_db, generate_paths, send_email
-from cagecat import db
-from config_files.config import cagecat_version, domain
+from cagecat.general_utils import fetch_job_from_db, generate_paths, send_email, invalidate_server_info
+from cagecat import db, r
+from config_files.config import cagecat_version, domain, plot_compression_conf
 from cagecat.db_models import Job, Statistic
-from cagecat.const import genbank_extensions, fasta_extensions
+from cagecat.const import genbank_extensions, fasta_extensions, time_format, \
+    resource_limits_exceeded, precompressed_encodings
+from cagecat.progress import create_stage_tracker, publish_job_event
+from cagecat.job_durations import record_job_duration, get_queue_duration_key
+from cagecat.generation_usage import get_generations_of, \
+    get_referenced_generations, mark_generations_in_use, release_generations
+
+try:  # optional: only gzipped copies of plots are written without it
+    import brotli
+except ImportError:
+    brotli = None
 
 # typing imports
 from werkzeug.datastructures import ImmutableMultiDict
@@ -103,7 +118,7 @@ def create_summary_table_commands(
 
 
 def run_command(cmd: t.List[str], log_base: str, job_id: str,
-                log_output: bool = True) -> int:
+                log_output: bool = True, cwd: t.Optional[str] = None) -> int:
     """Executes a command on the command line
 
     Input:
@@ -112,25 +127,75 @@ def run_command(cmd: t.List[str], log_base: str, job_id: str,
         - log_base: base directory for logging. Has the following structure:
             "cagecat/jobs/{job_id}/logs/"
         - job_id: ID corresponding to the job the function is called for
+        - log_output: whether the output of the command should be logged
+        - cwd: directory to execute the command in. Defaults to the current
+            working directory
 
     Output:
         - return_code: exit code of the executed command. A non-zero exit
             code indicates something went wrong. An exit code of 0 indicates
             the command has executed without any problems.
 
+    When the output is logged, each line is also passed to a StageTracker,
+    which publishes the execution stage of the job as soon as it changes.
+
+    Logged commands are executed with the resource profile of the job type
+    (see classes.resource_profiles): the limits and niceness are set on the
+    child process, and the command is killed together with the processes it
+    started (its process group) when it exceeds the wall-clock timeout. A
+    killed command is recorded in the log of the job, so the failure reason
+    can be shown to the user.
     """
     if log_output:
+        # imported here, as classes imports the workers module
+        from cagecat.classes import resource_profiles
+
+        job_type = fetch_job_from_db(job_id).job_type
+        profile = resource_profiles[job_type]
+
         log_command(cmd, log_base, job_id)
+        tracker = create_stage_tracker(job_id, job_type, " ".join(cmd))
 
         with open(os.path.join(log_base, f"{job_id}.log"), "w") as outf:
             try:
-                res = subprocess.run(cmd, stderr=outf, stdout=outf, text=True)
-                return_code = res.returncode
+                with subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                                      stderr=subprocess.STDOUT, text=True,
+                                      bufsize=1, cwd=cwd,
+                                      preexec_fn=profile.apply) as process:
+                    timed_out = threading.Event()
+                    timer = threading.Timer(
+                        profile.timeout,
+                        lambda: (timed_out.set(), kill_process_group(process)))
+                    timer.start()
+
+                    try:
+                        for line in process.stdout:
+                            outf.write(line)
+                            outf.flush()
+
+                            if tracker is not None:
+                                tracker.feed(line)
+                    finally:
+                        timer.cancel()
+
+                    if process.wait() != 0:
+                        # processes started by the command (e.g. DIAMOND)
+                        # could still be running
+                        kill_process_group(process)
+
+                return_code = process.returncode
+
+                if timed_out.is_set() or \
+                        return_code in (-signal.SIGXCPU, -signal.SIGKILL):
+                    outf.write(f"{resource_limits_exceeded} (timeout: "
+                               f"{profile.timeout}s, exit code: "
+                               f"{return_code})\n")
+                    return_code = 1
             except:  # purposely broad except clause to catch all exceptions
                 return_code = 1
     else:
         try:
-            res = subprocess.run(cmd)
+            res = subprocess.run(cmd, cwd=cwd)
             return_code = res.returncode
         except:  # purposely broad except clause to catch all exceptions
             return_code = 1
@@ -138,30 +203,49 @@ def run_command(cmd: t.List[str], log_base: str, job_id: str,
     return return_code
 
 
-def zip_results(job_id: str) -> None:
-    """Zips all files belonging to a job (logs, results, uploads)
+def kill_process_group(process: subprocess.Popen) -> None:
+    """Kills a command and all processes started by it
 
     Input:
-        - job_id: ID corresponding to the job the function is called for
+        - process: process started with ResourceProfile.apply as preexec_fn,
+            so it leads its own process group
 
     Output:
-        - None
-        - A .zip file containing all files which are part of a job
-
-    We change directories to the {job_id} folder, which contains 3 folders:
-    1. logs; 2. results; 3. uploads; Therefore, the paths used in this
-    function are relative to the {job_id} folder.
+        - None, killed processes
     """
-    base, log_dir, results_dir = generate_paths(job_id)
-    os.chdir(base)  # go 1 level up
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:  # all processes have exited already
+        pass
 
-    cmd = ["zip", "-r", os.path.join("results", f"{job_id}.zip"), "."]
-    # all files and folders in the current directory
-    # (cagecat/jobs/{job_id}/ under the base folder
 
-    run_command(cmd, "logs", job_id, log_output=False)
-    # invalid path: 'logs/U812J131P392S71_zip.txt/U812J131P392S71_cmd.txt'
-    # something is going wrong
+def register_generations(job_id: str, database_paths: t.List[str],
+                         parent_session_path: t.Optional[str] = None,
+                         writes_session: bool = False) -> None:
+    """Registers the HMM database generations used by a job
+
+    Input:
+        - job_id: ID corresponding to the job the function is called for
+        - database_paths: paths to the databases searched by the job
+        - parent_session_path: path to the session file of the parent job,
+            if the job uses it. Has the following structure:
+            "cagecat/jobs/{job_id}/results/{job_id}_session.json"
+        - writes_session: whether the job writes a session, which refers to
+            the same databases
+
+    Output:
+        - None, registered generations (see generation_usage.py). The
+            generations are kept while the job runs, and as long as the job
+            is kept if it writes a session
+    """
+    generations = get_generations_of(database_paths)
+    if parent_session_path is not None:
+        parent_job_id = parent_session_path.split(os.sep)[-3]
+        generations |= get_referenced_generations(r, parent_job_id)
+
+    mark_generations_in_use(r, job_id, generations)
+    if writes_session:
+        mark_generations_in_use(r, job_id, generations, 'sessions')
 
 
 def log_command(cmd: t.List[str], log_base: str, job_id: str) -> None:
@@ -210,7 +294,7 @@ def send_notification_email(job: Job) -> None:
     """
     contents = f'''Dear researcher,
     
-The job (type: {job.job_type}) you submitted on {job.post_time} has finished running on {job.finish_time}.'''
+The job (type: {job.job_type}) you submitted on {job.post_time.strftime(time_format)} has finished running on {job.finish_time.strftime(time_format)} (UTC).'''
 
     contents += f'''
 
@@ -238,6 +322,45 @@ def log_cagecat_version(job_id: str) -> None:
         outf.write(f'CAGECAT_version={cagecat_version}')
 
 
+def compress_plot(job_id: str) -> None:
+    """Writes compressed copies of the plot of a job next to the plot
+
+    Input:
+        - job_id: ID of job of which the plot should be compressed
+
+    Output:
+        - None, written {job_id}_plot.html.gz (and .br if brotli is
+            installed), if the job has a plot
+
+    The compressed copies are sent to browsers accepting the encoding (see
+    result_helpers.serve_job_file), so the plot does not have to be
+    compressed on every request. Copies are written to a temporary file
+    first, so a partially written copy is never served.
+    """
+    plot_path = os.path.join(generate_paths(job_id)[2], f"{job_id}_plot.html")
+    if not os.path.exists(plot_path):
+        return
+
+    for encoding, extension in precompressed_encodings:
+        compressed_path = f"{plot_path}{extension}"
+        tmp_path = f"{compressed_path}.tmp"
+
+        if encoding == 'gzip':
+            with open(plot_path, 'rb') as inf, \
+                    gzip.open(tmp_path, 'wb',
+                              compresslevel=plot_compression_conf['gzip_level']) as outf:
+                shutil.copyfileobj(inf, outf)
+        elif encoding == 'br' and brotli is not None:
+            with open(plot_path, 'rb') as inf, open(tmp_path, 'wb') as outf:
+                outf.write(brotli.compress(
+                    inf.read(), mode=brotli.MODE_TEXT,
+                    quality=plot_compression_conf['brotli_quality']))
+        else:
+            continue
+
+        os.replace(tmp_path, compressed_path)
+
+
 def post_job_formalities(job_id: str, return_code: int) -> None:
     """Wrapper function for functions to be executed post-job execution
 
@@ -253,12 +376,16 @@ def post_job_formalities(job_id: str, return_code: int) -> None:
             outputs
     """
     log_cagecat_version(job_id)
-    zip_results(job_id)
+    if return_code == 0:
+        compress_plot(job_id)
+    release_generations(r, job_id)
 
     j = fetch_job_from_db(job_id)
 
     add_time_to_db(job_id, "finish", db)
     mutate_status(job_id, "finish", db, return_code=return_code)
+    if return_code == 0:
+        record_duration(j)
     if j.email:
         send_notification_email(j)
 
@@ -266,6 +393,32 @@ def post_job_formalities(job_id: str, return_code: int) -> None:
     db.session.commit()
 
 
+def record_duration(job: Job) -> None:
+    """Adds the duration of a successfully finished job to the duration model
+
+    Input:
+        - job: a job entry in the SQL database, of which the start and finish
+            times have been stored
+
+    Output:
+        - None, recorded duration (see job_durations.py)
+
+    The groups of the job were stored in the meta data of its rq job when it
+    was submitted. Durations are not recorded outside an rq worker, nor for
+    searches of which the results were restored from the search cache, as
+    these would make the estimates of real searches too optimistic.
+    """
+    rq_job = get_current_job()
+    if rq_job is None or job.start_time is None or \
+            rq_job.meta.get('cache_hit'):
+        return
+
+    keys = rq_job.meta.get('duration_keys', [job.job_type]) + \
+        [get_queue_duration_key(rq_job.origin)]
+    record_job_duration(
+        keys, (job.finish_time - job.start_time).total_seconds())
+
+
 def store_query_sequences_headers(log_path: str, input_type: str, data: str):
     """Saves the submitted query headers to a .csv file
 
@@ -313,7 +466,10 @@ def forge_database_args(options: ImmutableMultiDict) -> t.List[str]:
         organism = splitted[0].lower()
         genus_fasta = f'{splitted[1]}.fasta'
 
-        base.append(os.path.join(finished_hmm_db_folder, organism, genus_fasta))
+        # resolved, so the job keeps using the same generation of databases
+        # when a new generation is activated while it runs
+        base.append(os.path.realpath(
+            os.path.join(finished_hmm_db_folder, organism, genus_fasta)))
 
     if options['mode'] in ('remote', 'combi_remote'):
         if 'database_type' in options:
@@ -376,11 +532,11 @@ def add_time_to_db(job_id: str, time_type: str, db: SQLAlchemy) -> None:
     """
     job = fetch_job_from_db(job_id)
 
-    formatted_time = datetime.utcnow().strftime('%B %d %Y - %H:%M:%S')
+    current_time = datetime.utcnow()
     if time_type == "start":
-        job.start_time = formatted_time
+        job.start_time = current_time
     elif time_type == "finish":
-        job.finish_time = formatted_time
+        job.finish_time = current_time
     else:
         raise IOError("Invalid time type")
 
@@ -401,7 +557,8 @@ def mutate_status(job_id: str, stage: str, db: SQLAlchemy,
 
     Output:
         - None
-        - Mutated job status in the SQL database
+        - Mutated job status in the SQL database, which is also published
+            on the Redis channel of the job
 
     Raises:
         - IOError: when the given stage is invalid
@@ -427,6 +584,9 @@ def mutate_status(job_id: str, stage: str, db: SQLAlchemy,
     job.status = new_status
     db.session.commit()
 
+    invalidate_server_info()
+    publish_job_event(job_id, {'event': 'status', 'status': new_status})
+
 
 def remove_email_from_db(db_job: Job):
     if db_job.email != '':
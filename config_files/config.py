@@ -2,6 +2,8 @@
 
 Author: Matthias van den Belt
 """
+import os
+
 cagecat_version = '2.0'
 
 # jobs to persist on server (i.e. example outputs)
@@ -19,16 +21,105 @@ domain = 'https://cagecat.bioinformatics.nl/'
 NCBI_ftp_base_url = 'ftp.ncbi.nlm.nih.gov'
 
 
-hmm_db_creation_conf = {'sleeping_time': 60,
-                          'cpus': '10',
-                          'batch_size': '30'}
+# number of days the data of a job is kept on the server
+job_retention_days = 31
+
+# removal of expired jobs: number of job directories deleted in parallel,
+# number of jobs removed from the database per transaction, and number of
+# days between sweeps for job directories without a job in the database
+expiry_conf = {'workers': 8,
+               'batch_size': 200,
+               'orphan_sweep_days': 7}
+
+# reuse of results of identical cblaster searches. Entries expire after
+# ttl_days (should stay below job_retention_days, as the results of the
+# original job are deleted after that period) or when more than max_entries
+# searches have been cached
+search_cache_conf = {'enabled': True,
+                     'ttl_days': 7,
+                     'max_entries': 1000}
+
+# parsed sessions of parent jobs kept in memory by each worker to speed up
+# recompute jobs. Sessions of which the file size times session_memory_factor
+# exceeds the memory limit of recompute jobs are recomputed by cblaster
+recompute_conf = {'max_cached_sessions': 5,
+                  'session_memory_factor': 10}
+
+# a status page keeps a stream of status updates open for this number of
+# seconds, after which the browser reconnects. Streams are held by the gevent
+# uwsgi instance (config_files/cagecat_events.ini), which holds
+# processes x gevent streams at once; timeout should stay below nginx's
+# uwsgi_read_timeout for /results/events/
+status_stream_conf = {'timeout': 25,
+                      'reconnect_ms': 1000}
+
+# number of seconds the server status (shown on every page) is cached within
+# a single uwsgi process (local_ttl) and between processes (shared_ttl)
+server_info_cache_conf = {'local_ttl': 5,
+                          'shared_ttl': 15}
+
+# files of jobs (plots, cached archives) are sent by nginx instead of by the
+# uwsgi processes: Flask only checks the request and redirects nginx to the
+# file in the internal location (see config_files/cagecat). Only enabled when
+# the CAGECAT_X_ACCEL environment variable is 1 (set in cagecat.ini), so Flask
+# sends the files itself when CAGECAT is not served behind nginx (e.g. local
+# development)
+x_accel_conf = {'enabled': os.environ.get('CAGECAT_X_ACCEL') == '1',
+                'location': '/protected_jobs/'}
+
+# compression levels of the precompressed copies of plots, written once
+# when a job has finished. Brotli is only used when the brotli package is
+# installed
+plot_compression_conf = {'gzip_level': 9,
+                         'brotli_quality': 11}
+
+# downloads of the results of a job, which are zipped while they are
+# streamed. Files smaller than store_below bytes are not compressed, and
+# files are read in chunks of chunk_size bytes
+download_conf = {'chunk_size': 1048576,
+                 'store_below': 65536}
+
+# model of job durations (see cagecat/job_durations.py). The durations of the
+# most recent window jobs of a group are kept, and estimates are only made
+# for groups with at least min_samples durations
+duration_model_conf = {'window': 200,
+                       'min_samples': 5}
+
+# fetching of the FTP paths of genomes from NCBI's E-utilities. page_size
+# document summaries are requested at once
+eutils_conf = {'base_url': 'https://eutils.ncbi.nlm.nih.gov/entrez/eutils/',
+               'page_size': 5000,
+               'requests_per_second': 3}
+
+# downloading of genomes from NCBI's FTP server for the HMM databases.
+# concurrency: number of simultaneous downloads (and open connections),
+# requests_per_second: limit over all connections, as requested by NCBI
+hmm_db_download_conf = {'host': NCBI_ftp_base_url,
+                        'port': 21,
+                        'concurrency': 4,
+                        'requests_per_second': 3,
+                        'retries': 3,
+                        'blocksize': 33554432}
+
+# building of the HMM databases. Genera are built in shards of shard_size
+# genomes, which are merged afterwards. Builds of shards run simultaneously as
+# long as their cpus fit in the cpu_budget. A failed shard is attempted
+# max_attempts times
+hmm_db_creation_conf = {'cpu_budget': 30,
+                        'cpus': '10',
+                        'batch_size': '30',
+                        'shard_size': 100,
+                        'max_attempts': 3,
+                        'poll_interval': 5}
 
 thresholds = {
     'maximum_clusters_to_extract': 150,
     'maximum_gne_samples': 300,
     'max_clusters_to_plot': 75,
     "prokaryotes_min_number_of_genomes": 50,
-    'fungi_min_number_of_genomes': 10
+    'fungi_min_number_of_genomes': 10,
+    # plots larger than this number of bytes are only loaded on request
+    'maximum_plot_size_autoload': 20000000
 }
 
 email_footer_msg = f'''Thank you for using our service. 
@@ -2,748 +2,51 @@
 
 Author: Matthias van den Belt
 """
-import datetime
-
-
-def main():
-
-    # if m.Statistic.query.filter_by(name="finished").first() is None:
-    #     stats = [m.Statistic(name="finished"),
-    #              m.Statistic(name="failed")]
-    # iterate over entries
-    total_skipped = 0
-    all_deltas = {}
-
-    for entry in everything.split('\n'):
-        splitted = entry.split('\t')
-        # for i, val in enumerate(splitted):
-
-        job_type = splitted[job_type_index]
-        job_status = splitted[job_status_index]
-        start_time = splitted[start_index]
-        stop_time = splitted[stop_index]
 
-        # skip failed jobs / jobs without finished time
-        if job_status != 'finished' or stop_time == 'null' or stop_time == '':
-
-            datetime.datetime.now()
-            total_skipped += 1
-            continue
+# package imports
+import datetime
+from sys import argv
 
-        # print(entry)
-        # print(start_time)
-        # print(stop_time)
-        # exit()
+from sqlalchemy import func
 
-        # calculate timedelta between start and finish time
-        start_time = datetime.datetime.strptime(start_time, pattern)
-        stop_time = datetime.datetime.strptime(stop_time, pattern)
-        delta = stop_time - start_time
+# own project imports
+from cagecat import db
+from cagecat.db_models import Job
 
-        if job_type == 'search' and delta < datetime.timedelta(minutes=1):
-            job_type = 'recompute'
 
-        if job_type not in all_deltas:
-            all_deltas[job_type] = [delta]
-        else:
-            all_deltas[job_type].append(delta)
-        # all_deltas.append(delta)  # TODO
-    print(all_deltas)
-    # calculate average over all jobs
+def calculate_average_job_times(since: datetime.datetime = None) -> None:
+    """Prints the average execution time of finished jobs per job type
 
-    for job_type, deltas in all_deltas.items():
+    Input:
+        - since: only include jobs posted after this moment. All finished
+            jobs are included if not given
 
-        average_timedelta = sum(deltas, datetime.timedelta(0)) / len(deltas)
+    Output:
+        - None, printed average times
 
-    # average_timedelta = 2
-        print(job_type, 'average time:', average_timedelta, f'({len(deltas)} entries)')
-        # print('With', len(deltas), 'entries')
+    The averages are calculated by the database using the indexes on the
+    status, job_type and post_time columns.
+    """
+    duration = (func.julianday(Job.finish_time) -
+                func.julianday(Job.start_time)) * 86400  # in seconds
 
-    # print('We skipped', total_skipped, 'entries')
+    query = db.session.query(Job.job_type, func.avg(duration),
+                             func.count(Job.id)) \
+        .filter(Job.status == 'finished',
+                Job.start_time.isnot(None),
+                Job.finish_time.isnot(None))
 
-            # print(i, val)
+    if since is not None:
+        query = query.filter(Job.post_time >= since)
 
-        # exit()
-        # print(entry)
+    for job_type, average, count in query.group_by(Job.job_type):
+        print(job_type, 'average time:',
+              datetime.timedelta(seconds=round(average)),
+              f'({count} entries)')
 
-    # TODO: calculate average time per job type
 
 if __name__ == '__main__':
-    # 0 Z245X621C756D63
-    # 1 search
-    # 2 7be275a7-c1e5-4dc7-8c49-c51f33f84d54
-    # 3 failed
-    # 4 hirsutella
-    # 5 cameron.gilchrist@research.uwa.edu.au
-    # 6 null
-    # 7
-    # 8 null
-    # 9 2021-06-24 09:02:46.122746
-    # 10 2021-06-24 09:02:46.486771
-    # 11 2021-06-24 09:04:21.334904
-
-    # 2021-07-14 06:33:27.843877
-    pattern = '%Y-%m-%d %H:%M:%S.%f'
-
-    job_type_index = 1
-    job_status_index = 3
-    start_index = 10
-    stop_index = 11
-
-    everything = """Q379W565R078L81	search	0775a073-7c18-46a2-874f-890581e9d9de	finished		clara.woodcraft@research.uwa.edu.au	null		null	2021-08-06 05:11:01.578397	2021-08-06 05:11:01.851846	2021-08-06 05:12:50.121125
-S767N944W820P92	clinker	0c15a5ac-f66b-44c1-a7ab-976af046e0b5	finished			null		null	2021-08-06 06:55:29.349105	2021-08-06 06:55:29.628075	2021-08-06 06:55:36.157170
-K969V573Q370W93	search	9481c377-a9da-40c6-b45a-87f5f465dadd	finished	10.2 PKS Cluster	22234468@student.uwa.edu.au	null	F164O419Q603I03,Z530J232D163O11	null	2021-08-06 06:59:55.511978	2021-08-06 06:59:55.787085	2021-08-06 07:01:21.453764
-F164O419Q603I03	extract_clusters	b5baffa8-c6e7-45dd-a2e9-ec76bf95d19f	finished			K969V573Q370W93		null	2021-08-06 07:20:52.155808	2021-08-06 07:20:52.424178	2021-08-06 07:20:52.896007
-Z530J232D163O11	clinker	af44e9df-0006-438a-9eab-ba12e3c53450	finished			K969V573Q370W93		F164O419Q603I03	2021-08-06 07:20:52.177221	2021-08-06 07:20:53.206728	2021-08-06 07:20:53.602742
-W967G761M481H51	clinker	41163e97-dfa5-4455-acbc-b9b03e28de8a	finished			null		null	2021-08-06 07:47:28.025354	2021-08-06 07:47:28.319310	2021-08-06 07:47:29.390285
-D797C921M476R60	search	dc426d43-f01d-45ec-bc53-83b9f1261ba3	finished	Example input (Burnettramic Acids)	22234468@student.uwa.edu.au	null	C081X281Y652L02	null	2021-08-06 08:05:28.716115	2021-08-06 08:05:28.996817	2021-08-06 08:10:56.344128
-G268V799T476C91	search	c7162a8f-26fc-4c32-a92f-0b4a9b815dfb	finished	5.2NRPS	22234468@student.uwa.edu.au	null		null	2021-08-06 09:03:53.584305	2021-08-06 09:03:53.857387	2021-08-06 09:07:35.816028
-C081X281Y652L02	gne	10976aa8-33d8-4221-bcd8-9e8f570d59c8	finished		22234468@student.uwa.edu.au	D797C921M476R60		null	2021-08-06 09:20:26.615305	2021-08-06 09:20:26.886708	2021-08-06 09:20:34.436623
-F981U679I314O19	search	f00e18eb-e546-40be-a21d-7a685730cd2a	finished			null		null	2021-08-06 14:09:02.388115	2021-08-06 14:09:02.661401	2021-08-06 14:10:51.470146
-B295V998L092Y43	clinker	a080baf6-65c9-40ce-9562-a8a70af8daf6	finished	Example visualization input (BA)		null		null	2021-08-06 16:11:43.596160	2021-08-06 16:11:44.469460	2021-08-06 16:11:48.239109
-C450A417O943D79	search	66f723b8-7dc8-4695-80c9-3d2948551355	finished	Example input (Burnettramic Acids)		null		null	2021-08-06 19:41:11.860728	2021-08-06 19:41:12.390383	2021-08-06 19:45:38.236481
-H725U049F631W82	clinker	9b279422-db27-4bb5-bfaa-a374cd5b96cd	finished			null		null	2021-08-08 02:36:34.319227	2021-08-08 02:36:34.649779	2021-08-08 02:36:36.155040
-C993P536X282H02	search	9d26c100-2fb2-4933-a4e8-b4210fdfc601	finished			null	U219U694U100J12,N217W812B798R41	null	2021-08-08 05:50:28.626563	2021-08-08 05:50:28.901740	2021-08-08 05:52:49.739802
-U219U694U100J12	extract_clusters	ed529749-2eda-454b-bf87-dbcc0e6164dd	finished			C993P536X282H02		null	2021-08-08 05:54:37.943823	2021-08-08 05:54:38.217049	2021-08-08 05:54:38.932114
-N217W812B798R41	clinker	8abc53cf-797a-4c1a-b008-42b49c9b1be4	finished			C993P536X282H02		U219U694U100J12	2021-08-08 05:54:37.963857	2021-08-08 05:54:39.232725	2021-08-08 05:54:39.710605
-F488W742R759W95	search	303f363e-ace3-472e-97f3-9c6902431c56	finished			null		null	2021-08-08 09:10:13.297828	2021-08-08 09:10:13.576622	2021-08-08 09:12:03.403170
-D200W444B185W07	search	9bd0e1ed-9fa0-4708-85a8-31f77a89930c	finished	10.2 PKS Cluster	22234468@student.uwa.edu.au	null		null	2021-08-09 04:22:58.572409	2021-08-09 04:22:58.845856	2021-08-09 04:27:10.701171
-O103R901K528P78	search	48f4b35d-d185-479b-8ba4-115b0b0116ce	finished		22234468@student.uwa.edu.au	null		null	2021-08-09 04:37:51.450494	2021-08-09 04:37:51.721623	2021-08-09 04:37:52.777009
-B471N132K525Z66	search	05f5b7c1-b8aa-45af-84e1-40c107c17c78	finished	5.2NRPScluster	22234468@student.uwa.edu.au	null		null	2021-08-09 05:16:49.882576	2021-08-09 05:16:50.154373	2021-08-09 05:21:19.321184
-L715Y637Y425A89	search	6d63f91f-f7a1-455e-88d3-d337304e8da0	finished	5.2NRPS	22234468@student.uwa.edu.au	null		null	2021-08-09 05:23:33.714856	2021-08-09 05:23:33.996919	2021-08-09 05:28:12.730280
-O021J938R341W19	search	3270fcaf-d42e-444a-aae1-4bb22939433e	finished	5.2NRPScluster	22234468@student.uwa.edu.au	null		null	2021-08-09 05:33:57.074609	2021-08-09 05:33:57.353351	2021-08-09 05:40:38.614744
-K653G630C066O38	search	70193426-f1cb-499a-8b5f-9c8ac462325b	finished	kumbrin	clara.woodcraft@research.uwa.edu.au	null		null	2021-08-09 07:05:03.422627	2021-08-09 07:05:03.700557	2021-08-09 07:14:50.585596
-P802N018G361Z81	search	f8bf311a-5325-4ff4-a3d7-27a03e61f926	finished	k2	clara.woodcraft@research.uwa.edu.au	null		null	2021-08-09 07:16:43.040238	2021-08-09 07:16:43.309516	2021-08-09 07:26:23.312756
-F697N133O248C98	search	a11038f7-7103-46e8-a6e9-8fcf7c11e60e	finished	kumbrin-3	clara.woodcraft@research.uwa.edu.au	null		null	2021-08-09 08:14:34.314694	2021-08-09 08:14:34.584298	2021-08-09 08:20:47.559736
-F848P381O969B55	search	38819573-ff36-45b7-988c-0d9e810c769d	finished	Example input (Burnettramic Acids)		null	D537Q292V539C50,S937J372A229T71	null	2021-08-10 00:52:18.822784	2021-08-10 00:52:19.100450	2021-08-10 01:05:32.057029
-D537Q292V539C50	extract_clusters	e75ad945-07d9-462e-8536-fe3c6028877e	finished			F848P381O969B55		null	2021-08-10 01:08:54.071589	2021-08-10 01:08:54.345830	2021-08-10 01:09:07.364625
-M200Y716L754J11	clinker	ddccb6cb-e271-4270-8631-f8899cbeb3d9	finished			F848P381O969B55		null	2021-08-10 01:10:06.803941	2021-08-10 01:10:07.062235	2021-08-10 01:10:23.129739
-S937J372A229T71	gne	52f87e65-6e6c-4f87-8c22-8f5e7611f553	finished			F848P381O969B55		null	2021-08-10 03:59:23.579435	2021-08-10 03:59:23.851079	2021-08-10 03:59:40.689379
-G084J361X680N33	search	9d960130-5076-4a6a-a920-e9cc98c7a789	finished			null		null	2021-08-10 04:10:11.236835	2021-08-10 04:10:11.500101	2021-08-10 04:10:23.311483
-H650X950V735H78	search	5c707dd4-fd91-4489-9c06-c1538d884ec5	finished			null		null	2021-08-10 04:18:23.056202	2021-08-10 04:18:23.336991	2021-08-10 04:18:30.725313
-Q254G915O893W41	search	e4e5a214-628d-4912-9679-f04af4a3f6c0	finished		reynaldi.darma@anu.edu.au	null	O534G281X138D01,M653N004C747L70	null	2021-08-10 04:22:20.261921	2021-08-10 04:22:20.530874	2021-08-10 04:28:59.729275
-Y199K192H639Y61	search	1e0df136-af08-43da-8bc7-d1e53b718cef	finished			null	L326N124J401X83	null	2021-08-10 04:30:11.516574	2021-08-10 04:30:11.785426	2021-08-10 04:30:13.188268
-L326N124J401X83	clinker_query	5109c9ec-6bf0-401d-b4d4-2e6b96d52a6f	finished			Y199K192H639Y61		null	2021-08-10 04:49:23.722620	2021-08-10 04:49:23.981618	2021-08-10 04:49:24.759829
-C333N936M414F43	clinker	9eaa06fb-5ca8-4303-a584-b8873837928f	finished	asdf		null		null	2021-08-11 02:52:07.244949	2021-08-11 02:52:07.566236	2021-08-11 02:52:10.430293
-M289C756D583R10	clinker	4f530545-38c5-4a7f-b4d4-c70a4c3238f7	finished			null		null	2021-08-11 03:13:53.073243	2021-08-11 03:13:53.634249	2021-08-11 03:13:58.798399
-B583V253R108O96	clinker	d1f34f22-bd7a-46bc-913e-8e0277a8a812	finished	asdf		null		null	2021-08-11 03:45:41.325457	2021-08-11 03:45:41.648195	2021-08-11 03:45:45.051417
-B078J898P851U28	search	99c6c8d3-fd77-472e-aa29-fa4ca8bcb503	finished	MT 	indra.roux@research.uwa.edu.au	null		null	2021-08-11 05:04:25.632098	2021-08-11 05:04:26.087070	2021-08-11 05:06:11.619018
-U310W417O764G67	search	0a3eda28-8cbf-4b36-a35e-2e6708c98120	finished		haochen.wei@anu.edu.au	null	Q446D855M814C12,C954A876H549R57,X055F170O584M32	null	2021-08-11 08:26:12.000289	2021-08-11 08:26:12.280718	2021-08-11 08:34:45.825365
-Q446D855M814C12	extract_clusters	5bfe1bd6-f815-4de2-83ce-0e6f6c08a706	finished			U310W417O764G67		null	2021-08-11 08:38:56.663384	2021-08-11 08:38:56.958788	2021-08-11 08:39:02.638831
-C954A876H549R57	clinker	b81ba0b4-e558-4c92-a697-082880fd55ae	finished			U310W417O764G67		Q446D855M814C12	2021-08-11 08:38:56.685601	2021-08-11 08:39:02.950629	2021-08-11 08:39:06.282679
-X055F170O584M32	extract_sequences	fb9e58f0-92db-4ad2-a198-a0c6a603fca4	finished			U310W417O764G67		null	2021-08-11 08:43:48.412634	2021-08-11 08:43:48.857116	2021-08-11 08:43:50.726222
-S949Y202O659F85	search	b2728467-b60e-493e-8002-2b9e9c2b655e	finished			null		null	2021-08-11 09:04:19.834429	2021-08-11 09:04:20.253691	2021-08-11 09:10:29.986357
-R260E927I501V46	search	a4a27d96-d026-48a7-a225-7453bab740d0	finished		malanjary@gmail.com	null		null	2021-08-11 12:50:06.879570	2021-08-11 12:50:07.166929	2021-08-11 12:53:56.327516
-E325U760L453U80	search	d3ffde6b-6c67-4fe9-abe8-9e1c3abbf9cc	finished	Example input (Burnettramic Acids)		null		null	2021-08-12 14:15:04.701994	2021-08-12 14:15:04.980760	2021-08-12 14:20:11.074961
-X045X547I181A96	search	ed70b8d1-66cd-4c98-86c2-91e920e64b78	finished	Example input (Burnettramic Acids)	stefanhaannl@gmail.com	null	N210J349H669E77	null	2021-08-12 18:23:36.120553	2021-08-12 18:23:36.403561	2021-08-12 18:25:33.993109
-N210J349H669E77	extract_clusters	ea43224b-70a4-42ae-bc81-8fb01f40ba05	finished	extractring	stefanhaannl@gmail.com	X045X547I181A96		null	2021-08-12 18:27:30.827846	2021-08-12 18:27:31.126888	2021-08-12 18:27:40.286496
-D700E007I990A06	clinker	f962ad5e-03ac-4556-b16f-16556c1e6924	finished			X045X547I181A96		null	2021-08-12 18:30:43.600737	2021-08-12 18:30:43.876947	2021-08-12 18:30:50.750140
-T543O819Z324S50	gne	aef7ce74-4c81-49e8-9b8f-9256b7a8cb40	finished			Y736N982T834D20		null	2021-08-12 18:35:43.203082	2021-08-12 18:35:43.474419	2021-08-12 18:35:44.280812
-I699W492X461R76	extract_clusters	33ddeb4e-83d2-4dc5-8862-a018e6c2497f	finished			Y736N982T834D20		null	2021-08-12 18:38:39.619266	2021-08-12 18:38:39.894166	2021-08-12 18:40:15.644417
-M693J462H340C99	corason	68f91f74-edd3-4e85-9acc-3aec173375cc	finished			Y736N982T834D20		I699W492X461R76	2021-08-12 18:38:39.646354	2021-08-12 18:40:15.954997	2021-08-12 18:40:16.003808
-L280U295U118S93	search	a7540936-9b4b-48d6-870f-ab1a23fc145d	finished	Tm_Cluster024	yitheng.chooi@uwa.edu.au	null		null	2021-08-13 04:12:08.208242	2021-08-13 04:12:08.485611	2021-08-13 04:19:41.404029
-M427K046T386F21	search	3f6b1da1-146a-419b-9230-044cf179d0a5	finished		alexsz1985@gmail.com	null		null	2021-08-14 05:37:44.316711	2021-08-14 05:37:44.629037	2021-08-14 05:52:47.994535
-E981V918B084J41	search	5cc1a294-7562-4ac4-af41-1c0effb9b04d	finished	Cluster 24	roaa.arishi@hotmail.com	null	Q330C184F918D82,N759R790P631G47,G051T677F266I96,B297O117F778A48,D369A559G411O34	null	2021-08-14 08:38:45.568877	2021-08-14 08:38:45.850689	2021-08-14 08:45:32.449307
-Y740E192N325N11	search	05f2f6f3-a7f6-4fcb-bee2-7645d1ab809e	finished	Cluster 10	roaa.arishi@hotmail.com	null	G732G342I960I68,B351U931N365N99,O189U749A008D92	null	2021-08-14 09:28:47.563311	2021-08-14 09:28:47.875323	2021-08-14 09:38:07.978809
-G815P274B249I31	search	284b17de-c2bb-4fc4-8c21-f5df99acadab	finished	cluster 19	roaa.arishi@hotmail.comr	null		null	2021-08-14 10:01:15.039264	2021-08-14 10:01:15.351175	2021-08-14 10:09:35.757326
-N323B880K955I76	search	d17060e3-cea3-4dc2-935b-6b7f7d7577ba	finished			null		null	2021-08-14 11:36:27.977111	2021-08-14 11:36:28.285162	2021-08-14 11:47:32.850477
-R296U479H350K52	search	7638928c-381e-40da-9a42-786787291cd7	finished	cluster27	roaa.arishi@hotmail.comr	null		null	2021-08-14 12:59:51.889206	2021-08-14 12:59:52.182580	2021-08-14 13:07:48.093414
-G732G342I960I68	clinker_query	7c3d8bd7-57f2-4a33-92de-6a3ad8d74f1e	finished	Cluster 10	roaa.arishi@hotmail.comr	Y740E192N325N11		null	2021-08-14 16:30:19.389465	2021-08-14 16:30:19.660178	2021-08-14 16:30:20.242030
-Q330C184F918D82	clinker_query	2b4feebe-0f0d-42a2-b534-a22e5f781573	finished	Cluster 24	roaa.arishi@hotmail.com	E981V918B084J41		null	2021-08-14 16:39:19.278940	2021-08-14 16:39:19.553721	2021-08-14 16:39:20.249902
-A905M696Q203H38	search	0017a2e4-0ac8-4f8b-9082-3189c517a263	finished	cluster 19	roaa.arishi@hotmail.com	null	F600X668Q201H39,W686X940Q533D57,C907X752O983E56,O047H900E299X33,P164W677H408L01	null	2021-08-14 16:45:36.354411	2021-08-14 16:45:36.629899	2021-08-14 16:52:05.695128
-F600X668Q201H39	extract_clusters	5186f153-a94d-4822-9631-152f057f045b	finished			A905M696Q203H38		null	2021-08-14 16:56:19.297903	2021-08-14 16:56:19.571504	2021-08-14 16:56:35.197119
-W686X940Q533D57	clinker	c3daee95-8f89-4de2-b523-b487450ba634	finished	cluster 19		A905M696Q203H38		F600X668Q201H39	2021-08-14 16:56:19.316106	2021-08-14 16:56:35.508786	2021-08-14 16:57:18.741046
-R388N923T015E61	search	0f3375ab-eec2-4d51-a3fc-32e173b3186f	finished	amr1_PKS	3mro2008@windowslive.com	null		null	2021-08-15 08:48:33.184366	2021-08-15 08:48:33.463696	2021-08-15 08:50:19.244258
-B776V186T950F05	search	e7b6b175-3834-4851-ba2f-50efcad9b43f	finished	cluster 17	roaa.arishi@hotmail.com	null		null	2021-08-15 08:56:22.937552	2021-08-15 08:56:23.219136	2021-08-15 09:09:24.463051
-C907X752O983E56	clinker_query	3396f874-ee57-4f80-b252-f750fc765dcb	finished			A905M696Q203H38		null	2021-08-15 09:03:22.744994	2021-08-15 09:03:23.020559	2021-08-15 09:03:23.680668
-O534G281X138D01	extract_clusters	92682b8e-965c-47a9-96e0-82d6910a6218	finished		reynaldi.darma@anu.edu.au	Q254G915O893W41		null	2021-08-16 12:26:29.360189	2021-08-16 12:26:29.704985	2021-08-16 12:26:38.942908
-Z388D925M603V34	clinker	56f48c7a-ac76-4099-92f9-c99227396548	finished			Q254G915O893W41		null	2021-08-16 12:28:51.432753	2021-08-16 12:28:51.718019	2021-08-16 12:29:03.531952
-M653N004C747L70	extract_clusters	a1d4b55f-da01-4378-9bcd-4f8de354e29f	finished			Q254G915O893W41		null	2021-08-16 12:35:00.437076	2021-08-16 12:35:00.712724	2021-08-16 12:35:09.057012
-R588A775K972E13	clinker	4268542e-ae9a-47e6-b381-3b32bdd05664	finished			Q254G915O893W41		null	2021-08-16 12:36:57.350457	2021-08-16 12:36:57.628551	2021-08-16 12:37:09.242807
-B267X843P863Z11	clinker	a82ac13b-8b11-4008-a39b-f25521cba3f4	finished			null		null	2021-08-18 03:55:53.538938	2021-08-18 03:55:53.898240	2021-08-18 03:56:00.548027
-B872D514F943Z50	clinker	b38f592d-6281-4fa7-b008-94a1ac97e430	finished			null		null	2021-08-18 03:57:44.612610	2021-08-18 03:57:44.892133	2021-08-18 03:57:45.402879
-A305A006U402B03	clinker	f381ce89-a061-491a-ba1e-36f97b505975	finished			null		null	2021-08-18 04:17:34.324368	2021-08-18 04:17:34.599748	2021-08-18 04:17:35.752874
-Y721Y708I177J23	clinker	03d5c0ca-358a-486c-8cb2-03064993fe69	finished			null		null	2021-08-18 04:17:45.790856	2021-08-18 04:17:46.055937	2021-08-18 04:17:48.171839
-A457F868W742J83	clinker	6084199b-334e-4331-9419-7d8997c7ae4c	finished			null		null	2021-08-18 04:20:48.192164	2021-08-18 04:20:48.477248	2021-08-18 04:20:50.663286
-I547R430X541X06	clinker	e13e6220-31c1-429c-9b9b-ca344751bb0e	finished			null		null	2021-08-18 04:21:00.393220	2021-08-18 04:21:00.670934	2021-08-18 04:21:02.812180
-O161S364X404T04	clinker	8baca5ed-4995-48c0-b2ed-d2abf220b5b2	finished			null		null	2021-08-18 04:23:15.241577	2021-08-18 04:23:15.517708	2021-08-18 04:23:17.716835
-T994J613N935A53	clinker	0c855efb-720d-4ee3-ab98-95d14a8d0a83	finished			null		null	2021-08-18 04:23:18.566106	2021-08-18 04:23:18.845187	2021-08-18 04:23:21.021553
-U011G483I854T41	search	b666da21-490d-4192-af8f-a1e8a8daf7b5	finished	Example input (Burnettramic Acids)	dick.deridder@wur.nl	null	G629W556L111H56,S466I213Y722S66,I748G730N134D36,Y938I485P840L50,E784O031A958N29	null	2021-08-18 06:58:16.297532	2021-08-18 06:58:16.575696	2021-08-18 07:04:54.870693
-G629W556L111H56	gne	0136779c-d2d4-4f51-87f7-18748f60137b	finished		dick.deridder@wur.nl	U011G483I854T41		null	2021-08-18 07:06:50.385023	2021-08-18 07:06:50.716055	2021-08-18 07:06:59.401071
-S466I213Y722S66	extract_clusters	6edaf9db-44ae-4506-9522-6f337cf60d2d	finished			U011G483I854T41		null	2021-08-18 07:07:04.753626	2021-08-18 07:07:05.032371	2021-08-18 07:08:30.238608
-Y938I485P840L50	extract_clusters	a23e7b9f-3b45-4f8e-9414-e4e5f7358ab8	finished			U011G483I854T41		null	2021-08-18 07:10:25.276836	2021-08-18 07:10:25.551213	2021-08-18 07:11:38.177338
-Q561A665U578F56	clinker	d5cb5693-17eb-48af-9bcf-daf0608104f4	finished		3mro2008@windowslive.com	null		null	2021-08-18 11:00:40.065244	2021-08-18 11:00:40.339907	2021-08-18 11:00:40.767247
-Z196B147W711N81	clinker	e3a38fb3-e0cc-48ed-b222-f12756bdeab4	finished			null		null	2021-08-19 04:15:55.280042	2021-08-19 04:15:55.562548	2021-08-19 04:15:57.638533
-N759R790P631G47	extract_clusters	71a9f1a2-9224-44d5-a81c-213682a13db5	finished			E981V918B084J41		null	2021-08-19 04:35:41.689517	2021-08-19 04:35:41.954948	2021-08-19 04:35:52.300151
-G051T677F266I96	clinker	527c5c72-2690-4e91-a646-6dcc126b7653	finished			E981V918B084J41		N759R790P631G47	2021-08-19 04:35:41.714537	2021-08-19 04:35:52.627313	2021-08-19 04:36:13.447398
-X840K723F614O49	search	2584c10c-e142-4dc8-a248-cd20498d1dbf	finished	o63560 c27	roaa.arishi@hotmail.com	null	I203U916X863S27	null	2021-08-19 05:30:19.842200	2021-08-19 05:30:20.120130	2021-08-19 05:38:04.302485
-I203U916X863S27	clinker_query	87f2e069-5b14-42ba-b2b8-24c67b37e49d	finished			X840K723F614O49		null	2021-08-19 05:39:02.522731	2021-08-19 05:39:02.848139	2021-08-19 05:39:03.886480
-R055W723B624J44	search	5b79cda8-b2a6-48c2-a97b-d63b17976a5a	finished			null		null	2021-08-21 12:26:36.502056	2021-08-21 12:26:36.781177	2021-08-21 12:35:48.500327
-O056I918X578C27	search	240b510e-4cd5-4099-be72-2d5bd34d456c	finished			null	D777O694V180Z83	null	2021-08-21 23:21:33.144073	2021-08-21 23:21:33.425337	2021-08-21 23:32:52.175886
-D777O694V180Z83	clinker_query	10792c86-dfb6-4167-a52d-711a3d1445e1	finished			O056I918X578C27		null	2021-08-21 23:43:13.176774	2021-08-21 23:43:13.451927	2021-08-21 23:43:14.145214
-R207T518S411Y15	search	14b2f2f0-d213-4c55-9daa-fa3c51f10754	finished			null		null	2021-08-22 19:30:20.961149	2021-08-22 19:30:21.240506	2021-08-22 19:32:28.723375
-J906U464Y115G20	clinker	b811b33c-2336-401d-b7cf-3d0608720f8f	finished			null		null	2021-08-27 17:48:49.338748	2021-08-27 17:48:49.709814	2021-08-27 17:48:50.417095
-X748M862A921F68	clinker	be53fe53-1b6c-4d98-ba7b-283ccff7fa9a	finished			null		null	2021-08-27 17:49:32.992301	2021-08-27 17:49:33.349351	2021-08-27 17:49:33.914465
-U203L901P226R81	search	5b36827f-6fb2-4d5c-b0f2-5ecc9d6f4561	finished			null	F672H050J447X12,X721M454K275O15	null	2021-08-27 17:52:09.909185	2021-08-27 17:52:10.213428	2021-08-27 17:56:09.791505
-F672H050J447X12	extract_clusters	9a129867-7b11-42bd-ac9a-ac7306cc32f8	finished			U203L901P226R81		null	2021-08-27 17:57:19.954186	2021-08-27 17:57:20.278929	2021-08-27 17:57:36.542421
-X721M454K275O15	clinker	b889973d-0e13-4507-a11d-3406d3b87cf3	finished			U203L901P226R81		F672H050J447X12	2021-08-27 17:57:19.973047	2021-08-27 17:57:36.894091	2021-08-27 17:57:51.475643
-P418Q538C440Q79	search	151ab4ff-84e9-48c9-82e0-3f1292f00958	finished			null		null	2021-08-27 18:03:02.695255	2021-08-27 18:03:03.017258	2021-08-27 18:10:47.072462
-O483P377K069F71	search	3de189db-a242-4eec-9ea8-04214be9f5d8	finished			null	U114I696I471O37,I848F690L060N07,S663Y206V138U06,H103P013A088C92,Q148B610U967X44,T995H274C717U05,Q411Y193C531D54,J035M128M397W00,H629R521T442T52,S247M219S582G34,E495T881D604O84,C152R443K117T68,N285Z992D398R64,M196E792Z632M15,P285J769P378O30,U283F145R139C53,I125J587Z003M19,R925J983X147T08,T941S374T993M83,A433N717A659N87,W514X823G089A71,O554B022M001H17,M148E992C704X27,F308Q616F604L47,S750Q528V832P52	null	2021-08-27 18:11:36.887811	2021-08-27 18:11:37.243844	2021-08-27 18:16:29.801143
-U114I696I471O37	clinker_query	4391d460-1f69-47fc-8bd8-a4b8cb022916	finished			O483P377K069F71		null	2021-08-27 18:26:02.104563	2021-08-27 18:26:02.408185	2021-08-27 18:26:03.150034
-I848F690L060N07	gne	a0099786-1d4d-4c78-b5bf-f803da14dde7	finished			O483P377K069F71		null	2021-08-27 18:27:09.305519	2021-08-27 18:27:09.615556	2021-08-27 18:27:13.082331
-S663Y206V138U06	clinker_query	54b53d38-dba0-453c-b2a9-650064ffea28	finished			O483P377K069F71		null	2021-08-27 18:29:08.772268	2021-08-27 18:29:09.082593	2021-08-27 18:29:09.813250
-H103P013A088C92	clinker_query	a8f105d7-4633-456d-a11c-209a97fddf44	finished			O483P377K069F71		null	2021-08-27 18:30:45.028540	2021-08-27 18:30:45.352947	2021-08-27 18:30:46.101432
-Q148B610U967X44	clinker_query	140c7916-8526-46d8-be57-c325f49fee17	finished			O483P377K069F71		null	2021-08-27 18:31:40.780740	2021-08-27 18:31:41.080345	2021-08-27 18:31:41.777632
-T995H274C717U05	extract_clusters	a3957cf6-c1b1-4e7f-9528-616063c50cc6	finished			O483P377K069F71		null	2021-08-27 18:32:19.013414	2021-08-27 18:32:19.324850	2021-08-27 18:32:33.340604
-Q411Y193C531D54	clinker	68da87ed-e018-42b9-8672-27f23af6c8f3	finished			O483P377K069F71		T995H274C717U05	2021-08-27 18:32:19.031690	2021-08-27 18:32:33.677530	2021-08-27 18:32:48.280034
-J035M128M397W00	clinker_query	b98786a5-0a12-474f-8685-545e2c312431	finished			O483P377K069F71		null	2021-08-27 18:36:02.324887	2021-08-27 18:36:02.628118	2021-08-27 18:36:03.296739
-H629R521T442T52	clinker_query	02cf8102-1773-4359-8fec-71c75aa22985	finished			O483P377K069F71		null	2021-08-27 18:36:42.569531	2021-08-27 18:36:42.892218	2021-08-27 18:36:43.584962
-S247M219S582G34	clinker_query	e547ce16-c7dc-4ed0-9d58-bc5079921258	finished			O483P377K069F71		null	2021-08-27 18:37:21.378727	2021-08-27 18:37:21.693845	2021-08-27 18:37:22.456795
-E495T881D604O84	clinker_query	b1afc5c6-d4f7-437b-bce0-0e650f47aa5e	finished			O483P377K069F71		null	2021-08-27 18:37:36.386309	2021-08-27 18:37:36.718544	2021-08-27 18:37:37.518312
-C152R443K117T68	clinker_query	e1041e88-4b16-4acf-b4d2-c821d727afe6	finished			O483P377K069F71		null	2021-08-27 18:38:28.360384	2021-08-27 18:38:28.668496	2021-08-27 18:38:29.424854
-N285Z992D398R64	clinker_query	d427c36c-5657-4c64-a3f6-271b63ee7c69	finished			O483P377K069F71		null	2021-08-27 18:39:24.396838	2021-08-27 18:39:24.717490	2021-08-27 18:39:25.426475
-M196E792Z632M15	clinker_query	ae776cba-7715-45fb-ac68-f7ffcf6f10a2	finished			O483P377K069F71		null	2021-08-27 18:39:52.247975	2021-08-27 18:39:52.622548	2021-08-27 18:39:53.362239
-P285J769P378O30	extract_clusters	6c0bf975-d7a1-4e03-8f0b-aa56ab3ccece	finished			O483P377K069F71		null	2021-08-27 18:40:19.235434	2021-08-27 18:40:19.549399	2021-08-27 18:40:32.958520
-U283F145R139C53	clinker	ceb6f5c7-7700-46b6-a73a-d5512d8a8c3c	finished			O483P377K069F71		P285J769P378O30	2021-08-27 18:40:19.262988	2021-08-27 18:40:33.306866	2021-08-27 18:40:47.585752
-I125J587Z003M19	clinker_query	893af56a-cd4a-43a5-b72e-08cc44439da4	finished			O483P377K069F71		null	2021-08-27 18:41:46.635179	2021-08-27 18:41:46.948967	2021-08-27 18:41:47.553948
-R925J983X147T08	clinker_query	4d33fbb7-4bb8-48ba-ac94-d6a40bb93eca	finished			O483P377K069F71		null	2021-08-27 18:53:17.176877	2021-08-27 18:53:17.496360	2021-08-27 18:53:18.199109
-T941S374T993M83	clinker_query	0001c087-bbbd-4140-9c98-4a29e780b393	finished			O483P377K069F71		null	2021-08-27 18:53:35.916055	2021-08-27 18:53:36.305474	2021-08-27 18:53:37.035236
-A433N717A659N87	clinker_query	9d9206e7-e3ed-41db-8aa3-7015fb5cdc90	finished			O483P377K069F71		null	2021-08-27 18:54:20.315383	2021-08-27 18:54:20.638220	2021-08-27 18:54:21.307012
-W514X823G089A71	clinker_query	bbaa67a8-14fb-4ec0-a8ca-574d33601d49	finished			O483P377K069F71		null	2021-08-27 18:54:36.163283	2021-08-27 18:54:36.471077	2021-08-27 18:54:37.199408
-O554B022M001H17	clinker_query	bd92dbd0-7814-42a2-b640-b39a0fcf5637	finished			O483P377K069F71		null	2021-08-27 18:54:55.901183	2021-08-27 18:54:56.213127	2021-08-27 18:54:56.846944
-M148E992C704X27	clinker_query	af3d066a-c66b-432d-8bd5-9b6fcc7a3f32	finished			O483P377K069F71		null	2021-08-27 18:55:43.294287	2021-08-27 18:55:43.621074	2021-08-27 18:55:44.466108
-F308Q616F604L47	clinker_query	61dd4ed3-4b2d-4738-b219-b176ed0198ee	finished			O483P377K069F71		null	2021-08-27 18:56:05.349589	2021-08-27 18:56:05.705683	2021-08-27 18:56:06.452915
-S750Q528V832P52	clinker_query	fd165045-5898-4e24-b490-b03f2d9f0432	finished			O483P377K069F71		null	2021-08-27 18:56:25.445662	2021-08-27 18:56:25.803006	2021-08-27 18:56:26.510842
-Q534T674G290Y84	search	6058afce-d958-4fe5-b0a9-e525ba7ed002	finished			null		null	2021-08-27 19:00:38.911752	2021-08-27 19:00:39.243582	2021-08-27 19:23:28.371502
-D042G752K410H75	search	b3691733-aa9a-4baa-ab90-a7aa272372e8	finished			null		null	2021-08-27 19:12:49.234335	2021-08-27 19:12:49.566214	2021-08-27 19:15:10.631345
-E098O268Z427U27	search	27100586-ac30-4c58-9484-b251c7d9ead3	finished			null		null	2021-08-27 19:16:00.655168	2021-08-27 19:16:00.963481	2021-08-27 19:23:53.785912
-R736D221P435X91	search	4fea578b-bc5d-4186-a2b5-83d6d0d5fb3d	finished			null		null	2021-08-27 19:21:04.318915	2021-08-27 19:21:04.641605	2021-08-27 19:30:31.007413
-Y426Y020W114L17	search	8b72b0be-95d8-4f1d-955c-3134d9bd8218	finished			null		null	2021-08-27 19:25:26.418860	2021-08-27 19:25:26.738461	2021-08-27 19:28:04.089478
-E007K845T577Y48	clinker	ceade4d7-bc18-4164-8971-befbab6209fb	finished			null		null	2021-08-30 04:21:33.661352	2021-08-30 04:21:33.932055	2021-08-30 04:21:34.304109
-M234G514V620Z29	clinker	d950e10a-dfc0-46c5-8f42-bd0637ce18d8	finished			null		null	2021-08-30 04:21:43.230066	2021-08-30 04:21:43.508243	2021-08-30 04:21:43.909579
-R862Q679Z405E19	search	10e9f1af-9b3f-4529-ad7e-16b718d6d83d	finished			null		null	2021-08-30 04:24:58.568928	2021-08-30 04:24:58.843048	2021-08-30 04:35:25.141411
-B577S384T990F07	clinker	94f68001-afae-4cee-b64e-f3fb78e5e411	finished			null		null	2021-08-30 04:28:38.130847	2021-08-30 04:28:38.410020	2021-08-30 04:28:38.889085
-P556Y562V911Q26	clinker	846c0aa3-9c0b-446f-9e27-b18d7a07a67c	finished	Example visualization input (BA)		null		null	2021-08-30 04:30:11.676828	2021-08-30 04:30:11.949039	2021-08-30 04:30:12.465804
-F925Q076O952B82	clinker	1cc14b9d-96e2-48b7-9521-7df43c4b665b	finished			null		null	2021-08-30 05:27:04.142499	2021-08-30 05:27:04.423610	2021-08-30 05:27:04.979590
-S465Y494U190I23	clinker	c02ef6ac-15be-4b45-b6af-da9e7b4ba0a4	finished			null		null	2021-08-30 05:28:12.711626	2021-08-30 05:28:12.994011	2021-08-30 05:28:13.526100
-N795S500N476I82	search	509b78ed-a632-40ba-8a5b-5683307e1cc1	finished	PNBA	hang.li@uwa.edu.au	null		null	2021-08-30 12:33:49.946313	2021-08-30 12:33:50.220561	2021-08-30 12:37:13.665890
-A537Z041R006O50	search	2f45bb54-2dcc-438d-8738-5e34b11ae1d1	finished			null		null	2021-08-30 12:38:49.760729	2021-08-30 12:38:50.036194	2021-08-30 13:09:59.239674
-A279G462Y090H56	search	fb52bcf7-e237-42cc-806d-37fd606a3550	finished	PNBA	hang.li@uwa.edu.au	null		null	2021-08-31 01:58:36.090606	2021-08-31 01:58:36.382037	2021-08-31 02:03:30.214213
-P383G880B254V03	clinker	6fdc8423-af25-4d89-bfe5-50c5177baf6d	finished	Example visualization input (BA)		null		null	2021-09-06 15:06:18.560180	2021-09-06 15:06:18.973958	2021-09-06 15:07:09.002047
-H811L856A802A27	clinker	dcb6b9a4-0160-4cdf-975c-8832bbd2586d	finished	1		null		null	2021-09-07 01:22:35.644351	2021-09-07 01:22:35.925110	2021-09-07 01:23:18.240305
-O126B325H629S08	search	4e839091-927e-45e8-b652-6ca3cfcf66ab	finished	3D7 PKs9 Cluster	22234468@student.uwa.edu.au	null		null	2021-09-07 05:23:30.755900	2021-09-07 05:23:31.036896	2021-09-07 05:28:20.519099
-V884I860U833T26	clinker	bc12ee79-6914-4b8e-a16c-4ec9c3d84352	finished			null		null	2021-09-09 01:40:28.148626	2021-09-09 01:40:28.427861	2021-09-09 01:40:31.317273
-K066U484C453Z63	clinker	464bfabb-7e07-448a-b190-8dddad0cca5b	finished			null		null	2021-09-09 01:41:03.516356	2021-09-09 01:41:03.786698	2021-09-09 01:41:07.176557
-R960U366R618C67	clinker	ff2f662a-722d-441c-ac10-3b511e3e5dbc	finished			null		null	2021-09-09 01:42:41.203504	2021-09-09 01:42:41.469791	2021-09-09 01:42:43.093366
-Z398T052R704O82	search	57b63a56-045a-4a9d-9f0c-0006bb62f51a	finished	ltb	yitheng.chooi@uwa.edu.au	null		null	2021-09-11 05:48:58.705208	2021-09-11 05:48:58.983342	2021-09-11 05:51:28.972896
-K876H717S341Y32	search	ede77b14-f46f-4a2f-bde9-ad67aebc64fd	finished	ltb2	yitheng.chooi@uwa.edu.au	null		null	2021-09-11 05:51:50.335963	2021-09-11 05:51:50.607334	2021-09-11 05:54:45.413074
-W099K567Q021K39	clinker	fa2bc984-753f-4a32-94a1-ac77aef97a0a	finished			null		null	2021-09-12 05:24:55.373840	2021-09-12 05:24:55.652216	2021-09-12 05:25:12.847979
-Q783Q620T705Q80	clinker	da67b941-8780-4157-9ca1-f441f5bcd9db	finished			null		null	2021-09-12 05:32:18.137110	2021-09-12 05:32:18.401679	2021-09-12 05:32:28.698726
-B297O117F778A48	extract_clusters	6c3798a4-0059-426d-b34d-eccdc6fb1214	finished			E981V918B084J41		null	2021-09-13 05:32:39.329664	2021-09-13 05:32:39.605733	2021-09-13 05:32:51.410261
-D369A559G411O34	clinker	2325b101-f64e-4093-92f8-03fc146794c8	finished			E981V918B084J41		B297O117F778A48	2021-09-13 05:32:39.347327	2021-09-13 05:32:51.717104	2021-09-13 05:33:11.755949
-O047H900E299X33	extract_clusters	8202d712-2f84-48fc-bd1f-8510069d3469	finished			A905M696Q203H38		null	2021-09-13 05:43:28.206813	2021-09-13 05:43:28.468793	2021-09-13 05:43:46.387313
-P164W677H408L01	clinker	0b7dc61d-941e-4a75-bb19-2a9b655be6bb	finished			A905M696Q203H38		O047H900E299X33	2021-09-13 05:43:28.224390	2021-09-13 05:43:46.690507	2021-09-13 05:44:28.446154
-B351U931N365N99	extract_clusters	0e3a59ed-de7d-4f94-9948-46c0e62c099e	finished			Y740E192N325N11		null	2021-09-13 06:11:09.030123	2021-09-13 06:11:09.291671	2021-09-13 06:11:15.257261
-O189U749A008D92	clinker	bc3b7ffd-6374-480f-a809-a595251818d8	finished			Y740E192N325N11		B351U931N365N99	2021-09-13 06:11:09.043812	2021-09-13 06:11:15.559790	2021-09-13 06:11:22.660544
-V990R439Y640N82	search	777f4e03-2cce-4fd0-95af-404271a71ecf	finished		roaa.arishi@hotmail.com	null	U000O519I786G04,A043N035G350B97	null	2021-09-13 09:23:50.507680	2021-09-13 09:23:50.786184	2021-09-13 09:34:47.691154
-U000O519I786G04	extract_clusters	96af4e4d-9e9d-483e-9f5d-f9a8a8ecbd3d	finished			V990R439Y640N82		null	2021-09-13 09:46:46.845248	2021-09-13 09:46:47.120103	2021-09-13 09:47:09.258785
-A043N035G350B97	clinker	3f947d87-e0bc-4dd6-aa75-3c6d457dfa3a	finished			V990R439Y640N82		U000O519I786G04	2021-09-13 09:46:46.859813	2021-09-13 09:47:09.561952	2021-09-13 09:48:18.299404
-R978F313Y121Z77	search	516347fa-c37b-47dc-a3c6-1f5e05d70567	finished			null		null	2021-09-14 04:51:58.488688	2021-09-14 04:51:58.755873	2021-09-14 04:55:58.781725
-Y942L975D358A02	search	d52a5c23-ce34-45aa-8fad-8896ffb10070	finished			null		null	2021-09-14 07:19:55.679583	2021-09-14 07:19:55.948443	2021-09-14 07:21:50.769894
-B938M295L928Y59	search	4dd135b0-1995-4c4f-8251-33ec40655953	finished	Example input (Burnettramic Acids)		null		null	2021-09-15 11:06:11.513106	2021-09-15 11:06:11.789872	2021-09-15 11:15:39.385120
-O922B117Q043B57	clinker	230f93ae-1fd1-4620-83b8-abe74401a231	finished			null		null	2021-09-21 02:57:46.426780	2021-09-21 02:57:46.702584	2021-09-21 02:57:47.381131
-R313L486E782B36	clinker	e3d32c25-8f8c-49fc-9f5d-0312b4f634a1	finished			null		null	2021-09-21 03:07:38.443636	2021-09-21 03:07:38.716817	2021-09-21 03:07:39.387957
-T570D839M737Q31	extract_clusters	c270abd0-219c-48d2-9ed6-320ce3cf302e	finished			Y736N982T834D20		null	2021-09-21 04:14:07.802222	2021-09-21 04:14:08.066025	2021-09-21 04:15:53.340749
-T795I078E237K77	search	e5af30c4-68bc-45fa-8641-9edc5817de1a	finished			null	Y506S323V707Q96,F246Z404E813C02	null	2021-09-21 05:07:03.933848	2021-09-21 05:07:04.202194	2021-09-21 05:10:26.863145
-W667S039R771H09	search	f5171b53-4853-48d9-b7ba-ae8dfb46a6eb	finished	Dapdiamide_gene_cluster_092021	eliz653@gmail.com	null		null	2021-09-21 05:08:13.266297	2021-09-21 05:08:13.538038	2021-09-21 05:16:58.669303
-Y506S323V707Q96	extract_clusters	4f6bb28f-32e7-4ecd-b09b-e18d7cdbded7	finished			T795I078E237K77		null	2021-09-21 05:13:18.191091	2021-09-21 05:13:18.460050	2021-09-21 05:13:47.187863
-F246Z404E813C02	clinker	f482b816-78dc-467b-83ae-48b18358cd79	finished			T795I078E237K77		Y506S323V707Q96	2021-09-21 05:13:18.209056	2021-09-21 05:13:47.490204	2021-09-21 05:16:17.506092
-F620T015I754Y40	search	d4439c99-5c80-4bed-8dc4-9d436192770e	finished			null		null	2021-09-21 05:25:20.612783	2021-09-21 05:25:20.883218	2021-09-21 05:26:57.463766
-P474W929U539J52	search	ef48b7fa-8a3d-4c0c-b386-27eb470a53c2	finished	Dapdiamide_cluster_0920221_Aspergillus	eliz653@gmail.com	null		null	2021-09-21 05:38:58.718189	2021-09-21 05:38:58.986643	2021-09-21 05:43:45.446993
-H369A147R511J90	search	a83e851c-9439-4c30-8241-82641d1e7971	finished			null		null	2021-09-21 05:43:16.375468	2021-09-21 05:43:16.650970	2021-09-21 05:49:10.504958
-S272K979L519T10	search	0b4ac4e0-f13f-4ea3-996c-62771186b160	finished			null	N597F572W944Q63,V542Q552S965J61	null	2021-09-21 05:47:27.229460	2021-09-21 05:47:27.493303	2021-09-21 05:52:17.176655
-E298N294R604V00	search	1d08af89-309d-4be7-b1e5-c8ea019d0469	finished	Dapdiamide_cluster_0920221_Aspergillus	eliz653@gmail.com	null		null	2021-09-21 05:52:46.960155	2021-09-21 05:52:47.221218	2021-09-21 06:00:19.330404
-N597F572W944Q63	extract_clusters	36d41ac5-1d91-4564-a531-7e9f34d308a1	finished			S272K979L519T10		null	2021-09-21 05:54:19.451134	2021-09-21 05:54:19.712972	2021-09-21 05:54:27.987538
-V542Q552S965J61	clinker	4a020e3f-3eb4-4e73-8f0f-d0f635dc37e9	finished			S272K979L519T10		N597F572W944Q63	2021-09-21 05:54:19.468336	2021-09-21 05:54:28.305055	2021-09-21 05:54:29.199364
-H859I749E464R89	search	96ae4cc6-9522-4265-abe2-54536699d8a7	finished			null		null	2021-09-21 05:59:11.795965	2021-09-21 05:59:12.058417	2021-09-21 05:59:12.725818
-M115M273J037Z49	search	f65a1714-a8a0-4f91-a6ad-9ec9f39e1c25	finished			null		null	2021-09-21 06:03:24.044630	2021-09-21 06:03:24.312571	2021-09-21 06:19:48.688830
-P916V168L421Q45	search	297fa564-e029-40f7-a5b6-de7df772e4bd	finished	ddac	eliz653@gmail.com	null		null	2021-09-21 06:32:00.399908	2021-09-21 06:32:00.663722	2021-09-21 06:37:43.814934
-N504V247E178X59	search	d2bfb412-07a6-4c79-9bed-d7fab60197fd	finished			null		null	2021-09-21 16:11:13.899952	2021-09-21 16:11:14.221487	2021-09-21 16:12:10.026049
-I052T382P823R60	search	ca0ec631-c55d-45f8-a2ff-e760c01e7181	finished	Psub		null	O421V302G739R37,P440R013J747M62,L167D818U740R07,Q907L292I261E32	null	2021-09-21 16:12:40.442516	2021-09-21 16:12:40.794732	2021-09-21 16:18:51.585614
-J608W936V068R77	search	197d7cf3-a8e3-4c12-bd3b-7cc51a9d0b12	finished			null		null	2021-09-21 16:13:04.642917	2021-09-21 16:13:04.943109	2021-09-21 16:13:05.732787
-O421V302G739R37	extract_clusters	81bd4782-ccd2-47e7-b0ab-fd2ad4a57e3a	finished			I052T382P823R60		null	2021-09-21 19:33:57.797127	2021-09-21 19:33:58.124102	2021-09-21 19:34:05.786214
-P440R013J747M62	clinker	304c5ec3-57eb-4f89-8e67-3c84186496b0	finished			I052T382P823R60		O421V302G739R37	2021-09-21 19:33:57.811917	2021-09-21 19:34:06.129091	2021-09-21 19:34:10.455576
-L167D818U740R07	clinker_query	5e1d0d09-4f7a-47de-9095-d56a21a1006d	finished			I052T382P823R60		null	2021-09-21 19:35:41.473468	2021-09-21 19:35:41.797475	2021-09-21 19:35:42.865184
-Q907L292I261E32	clinker_query	6501c581-9a18-4116-944d-921abfba4425	finished			I052T382P823R60		null	2021-09-21 19:38:34.760308	2021-09-21 19:38:35.059559	2021-09-21 19:38:36.150334
-L625P559O586C42	search	83f35a82-e011-4c18-b058-cb94803ff9aa	finished			null		null	2021-09-21 23:14:46.810385	2021-09-21 23:14:47.176005	2021-09-21 23:17:17.161667
-W046O401Y317Q35	search	71d444b5-77ea-449f-9124-154cbe3761f6	finished	tal	zyl2021ucla@gmail.com	null		null	2021-09-21 23:23:22.741264	2021-09-21 23:23:23.068688	2021-09-21 23:26:35.812538
-G985E569T961P03	search	93083332-7455-494a-83ff-4f26dac01e93	finished	tal2	zyl2021ucla@gmail.com	null		null	2021-09-21 23:29:40.990805	2021-09-21 23:29:41.319285	2021-09-21 23:31:52.301436
-P801T253A571N16	search	c0b269b1-9fac-4a26-9cec-0bb23a572a4e	finished			null		null	2021-09-22 01:27:29.671240	2021-09-22 01:27:29.985372	2021-09-22 01:30:38.733985
-Z685K921J807Q20	search	692513a2-034c-476b-9f49-eac153da319b	finished			null		null	2021-09-22 01:48:24.670659	2021-09-22 01:48:25.072264	2021-09-22 01:49:12.955583
-N672E939Z047T00	search	cef74a98-9735-4ca7-99fe-2c57d8b3c1e9	finished			null	O144Z694V351U61	null	2021-09-22 01:50:31.963655	2021-09-22 01:50:32.284811	2021-09-22 01:53:08.397066
-M564D191Z428Q27	clinker	d6161cde-3fff-42a4-813e-4d36a7146f63	finished	Example visualization input (BA)		null		null	2021-09-22 02:03:41.847286	2021-09-22 02:03:42.189586	2021-09-22 02:03:44.865433
-O144Z694V351U61	extract_sequences	ce30195f-69ea-42ca-98dd-ded2f76b694e	finished			N672E939Z047T00		null	2021-09-22 02:08:39.400643	2021-09-22 02:08:39.714904	2021-09-22 02:08:40.449368
-F124C621E574D66	search	6fe92c76-cc60-40be-b46b-5d9b8acdec73	finished	K	zyl2021ucla@gmail.com	null		null	2021-09-22 23:48:31.402821	2021-09-22 23:48:31.769867	2021-09-22 23:51:21.829486
-S068V806D602F01	search	ced865b5-1a11-4bba-88de-8d1199c88196	finished	P	zyl2021ucla@gmail.com	null		null	2021-09-22 23:54:58.675339	2021-09-22 23:54:59.026186	2021-09-22 23:57:19.939674
-I442J847I408O73	search	f34b38b9-731c-42f4-81a2-7981aed4add6	finished	TOP1	zyl2021ucla@gmail.com	null		null	2021-09-23 00:13:15.520881	2021-09-23 00:13:15.893555	2021-09-23 00:18:49.660556
-K406U692C462Q41	search	c14ec3c1-39a7-47bf-9577-0ae4e4778b1b	finished	G	zyl2021ucla@gmail.com	null		null	2021-09-23 00:45:31.325117	2021-09-23 00:45:31.673808	2021-09-23 00:47:30.752828
-F536H066Q194Q77	search	356e8e1d-0dac-44de-85a7-614d42122ec0	finished	G2	zyl2021ucla@gmail.com	null		null	2021-09-23 00:52:00.482213	2021-09-23 00:52:00.800372	2021-09-23 01:09:05.547586
-V596D531S575D70	search	9250bc84-348f-42a6-8988-226553d42197	finished	A1	zyl2021ucla@gmail.com	null		null	2021-09-23 01:17:20.062786	2021-09-23 01:17:20.372203	2021-09-23 01:31:39.811551
-Q047U878X735M26	search	9afd9b87-06cc-4b42-991b-01a4bfb4fa71	finished	A2	zyl2021ucla@gmail.com	null		null	2021-09-23 01:22:56.704600	2021-09-23 01:22:57.017783	2021-09-23 01:31:22.723219
-E117L702N883Q04	search	cd2b1a57-ca6c-47b1-b270-1a0c797f5baa	finished	Tflav_cluster_blast	eliz653@gmail.com	null		null	2021-09-23 03:23:59.971811	2021-09-23 03:24:00.305402	2021-09-23 03:28:38.407222
-C309W027O753R73	search	9488199b-093f-4d40-8a48-57cdd02ef18f	finished	C1	zyl2021ucla@gmail.com	null		null	2021-09-23 04:22:27.220592	2021-09-23 04:22:27.521860	2021-09-23 04:24:22.019645
-G482M725Y573L03	search	b9db3a24-e561-4689-817d-a26e69d11ea3	finished	C2	zyl2021ucla@gmail.com	null		null	2021-09-23 04:24:11.605689	2021-09-23 04:24:11.910246	2021-09-23 04:34:08.148661
-F037H072Y983G50	search	fb91ea7e-f7de-43d9-9605-da1fcd59a67d	finished	D1	zyl2021ucla@gmail.com	null		null	2021-09-23 04:42:23.847037	2021-09-23 04:42:24.147946	2021-09-23 04:44:54.957248
-I662I480T712U63	search	50d6d5e1-7a16-48bc-9bc3-88316aada65a	finished	D2	zyl2021ucla@gmail.com	null		null	2021-09-23 04:43:43.247266	2021-09-23 04:43:43.572220	2021-09-23 04:49:00.676425
-M322G765D413V09	search	1aaa25e8-4037-4b91-9d0d-05baaeec4ed7	finished	H1	zyl2021ucla@gmail.com	null		null	2021-09-23 04:56:07.307671	2021-09-23 04:56:07.654180	2021-09-23 05:11:50.715612
-V443H002P424V73	search	cad4f93a-ca46-47ad-a012-deeb7de0d397	finished	H2	zyl2021ucla@gmail.com	null		null	2021-09-23 04:56:30.156643	2021-09-23 04:56:30.476629	2021-09-23 05:17:33.065298
-N902I172S857D31	search	bced3674-e61a-4d1c-83e1-87b5dbc2e219	finished	I1	zyl2021ucla@gmail.com	null		null	2021-09-23 05:20:55.553078	2021-09-23 05:20:55.846544	2021-09-23 05:23:11.314675
-C168Q134N126H47	search	3a5eca26-2e7e-4d7a-8c6f-59d437ccc4d6	finished	I2	zyl2021ucla@gmail.com	null		null	2021-09-23 05:21:22.222605	2021-09-23 05:21:22.555345	2021-09-23 05:28:58.602167
-Q989S321Y735L38	search	ea37ded8-2e63-42d7-9980-b5e9bbf095c4	finished	pyrrol_09232021	eliz653@gmail.com	null	Z793J115V696T50,X068O063D367I75,B491S577G415G24,V606D053P323Y35	null	2021-09-23 07:26:53.078734	2021-09-23 07:26:53.390167	2021-09-23 07:32:25.978300
-Z793J115V696T50	extract_clusters	b5c8737b-f585-4ae9-84c1-2b0c43d40a22	finished			Q989S321Y735L38		null	2021-09-23 07:49:40.184440	2021-09-23 07:49:40.506518	2021-09-23 07:49:52.543042
-X068O063D367I75	clinker	fb636776-92de-4bd1-96b6-39821213ea4c	finished	pyrrol_09232021		Q989S321Y735L38		Z793J115V696T50	2021-09-23 07:49:40.207995	2021-09-23 07:49:52.890006	2021-09-23 07:49:57.869514
-B491S577G415G24	extract_clusters	d1cb8642-554c-4ef0-8319-c16bd78e2b66	finished			Q989S321Y735L38		null	2021-09-23 15:36:50.424404	2021-09-23 15:36:50.715095	2021-09-23 15:37:01.955727
-V606D053P323Y35	clinker	2a86f306-eb92-4f5a-9952-5a8154edc5a0	finished			Q989S321Y735L38		B491S577G415G24	2021-09-23 15:36:50.445650	2021-09-23 15:37:02.296649	2021-09-23 15:37:07.246286
-F249R777L549Z47	search	ee3c1f91-8871-4676-8cde-fd78301d6712	finished	Azeae_09232021		null		null	2021-09-23 15:39:40.317958	2021-09-23 15:39:40.603201	2021-09-23 15:43:44.061313
-O187D341O769G55	search	4855e713-2192-41e6-99cb-335f6d81bb27	finished	Afulv_7-1_asp_09232021	eliz653@gmail.com	null		null	2021-09-23 17:17:14.837157	2021-09-23 17:17:15.162708	2021-09-23 17:21:00.246041
-L788R147C318V45	search	d4572c17-9fa7-4689-9d5e-9088268ce6fb	finished	Afulv_6.2	eliz653@gmail.com	null		null	2021-09-23 17:31:25.123303	2021-09-23 17:31:25.436967	2021-09-23 17:34:07.253768
-D089P032T926F27	search	47206c92-a96b-4cf6-b9bf-b85d607ba5ee	finished	A_fulv_39.1	eliz653@gmail.com	null		null	2021-09-23 17:38:18.856109	2021-09-23 17:38:19.208780	2021-09-23 17:45:13.571006
-J537Q896F831G18	search	aef5c3db-f29e-4e6e-8e35-dfe6d85d9f9a	finished	A_fulv_39.2_mod_asp		null		null	2021-09-23 18:10:44.380606	2021-09-23 18:10:44.694059	2021-09-23 18:18:18.754593
-W481S056G295E96	search	58bb2fe7-ba19-4458-bf45-5d9d4ba147c5	finished	apimo	dayee@g.ucla.edu	null		null	2021-09-24 00:12:30.603482	2021-09-24 00:12:30.902356	2021-09-24 00:18:05.518904
-X415M969F925Q68	search	f7951eec-64e2-474d-9928-a5fce4c24571	finished	apimo2		null		null	2021-09-24 01:21:24.801571	2021-09-24 01:21:25.111523	2021-09-24 01:23:25.699128
-F531R102M786F01	search	93612330-d702-4ea5-9814-4374f92e08e3	finished	Example input (Burnettramic Acids)		null		null	2021-09-24 09:20:12.991834	2021-09-24 09:20:13.344278	2021-09-24 09:26:36.926942
-W428G515O369O11	search	9100ace7-0cb2-4879-a60f-4ba14bddc5bb	finished	Tflav_search_09242021	eliz653@gmail.com	null		null	2021-09-24 17:55:58.363450	2021-09-24 17:55:58.671620	2021-09-24 17:59:04.829581
-X231P905H517H01	search	910402fc-682b-469d-8ae4-dc32e86e55f2	finished	karsti	dayee@g.ucla.edu	null		null	2021-09-24 19:19:06.120877	2021-09-24 19:19:06.433600	2021-09-24 19:21:05.287552
-W576P927L206A25	search	195bc29d-74c2-4af9-ae29-f2ff4f4faeca	finished			null		null	2021-09-24 19:22:24.990169	2021-09-24 19:22:25.310439	2021-09-24 19:22:26.033252
-X882O753Q135W69	search	39cafd83-de59-46c2-8a95-fa58f5e56ebf	finished			null		null	2021-09-24 19:25:02.312706	2021-09-24 19:25:02.622105	2021-09-24 19:26:57.346445
-A389H758Q231B66	search	c27d7dcc-241b-4684-8a8d-d7f69bf420be	finished	MT	zyl2021ucla@gmail.com	null		null	2021-09-25 01:37:21.258198	2021-09-25 01:37:21.592949	2021-09-25 01:39:24.322602
-Y053H228G572Y80	search	1599aa3d-7e42-48a5-98b0-f36d7aebe3ec	finished	DUF	zyl2021ucla@gmail.com	null		null	2021-09-26 03:00:03.947798	2021-09-26 03:00:04.224228	2021-09-26 03:02:22.378326
-W732Q177D075N58	search	29059971-702d-4e94-b6e1-eaf8f34f15e3	finished	DUF2	zyl2021ucla@gmail.com	null		null	2021-09-26 03:06:09.150628	2021-09-26 03:06:09.433912	2021-09-26 03:08:21.111203
-F763V569Z404O39	search	ea7bc173-ccb1-4f85-956d-55412919d791	finished	DUF3	zyl2021ucla@gmail.com	null		null	2021-09-26 03:11:14.565668	2021-09-26 03:11:14.843507	2021-09-26 03:15:31.019045
-L744Z345B184Y80	search	8f5e1a6a-6727-4f10-8dcc-9885c625d9ab	finished	DUF4	zyl2021ucla@gmail.com	null		null	2021-09-26 03:11:46.165151	2021-09-26 03:11:46.441331	2021-09-26 03:16:49.886479
-R597V189W780Z17	search	5dbb4532-ef26-4bb5-bde6-e986ed315e27	finished			null	N868D162C831T11,Z776C592Q333Q91	null	2021-09-26 06:53:45.213464	2021-09-26 06:53:45.492750	2021-09-26 06:56:19.814449
-N868D162C831T11	extract_clusters	c1a2c444-65f3-4180-8df7-3f05abec4d62	finished			R597V189W780Z17		null	2021-09-26 07:08:04.971193	2021-09-26 07:08:05.233181	2021-09-26 07:08:21.358943
-Z776C592Q333Q91	clinker	4d02c40b-23ab-4a51-b4a7-852cf9379b18	finished			R597V189W780Z17		N868D162C831T11	2021-09-26 07:08:04.988799	2021-09-26 07:08:21.663945	2021-09-26 07:08:23.230679
-B279V045L251U24	search	4b77c80b-d598-4eeb-a65a-fe8946d9a909	finished	TC	zyl2021ucla@gmail.com	null		null	2021-09-27 21:23:20.882619	2021-09-27 21:23:21.307122	2021-09-27 21:25:21.688621
-A256C192Z348F61	search	2b26d4ce-5d85-4b1c-86ba-03fff56ef654	finished	ATR	zyl2021ucla@gmail.com	null		null	2021-09-28 00:38:58.402989	2021-09-28 00:38:58.672523	2021-09-28 00:41:02.241574
-J649G460C896D30	search	5f07578d-c892-4625-977b-bb83b046671d	finished	ATR2	zyl2021ucla@gmail.com	null		null	2021-09-28 00:43:39.439156	2021-09-28 00:43:39.706801	2021-09-28 00:48:32.557782
-J623H254R224W76	search	5f6da4c5-b8ac-40f6-9c34-d595199f7770	finished	ART3	zyl2021ucla@gmail.com	null		null	2021-09-28 00:53:55.375329	2021-09-28 00:53:55.637902	2021-09-28 00:55:47.661096
-V147C589X500N29	search	17471d7e-bcc1-4832-9500-e1e8d7b5934c	finished	CoaT	zyl2021ucla@gmail.com	null		null	2021-09-28 01:14:55.573366	2021-09-28 01:14:55.843629	2021-09-28 01:19:47.331019
-O999B372X196N88	search	d864f2c2-6714-4bcb-8a45-9ed45edb5bb1	finished	ATR4	zyl2021ucla@gmail.com	null		null	2021-09-28 02:25:12.452449	2021-09-28 02:25:12.720089	2021-09-28 02:27:53.978012
-F260M909U090L15	search	730faf23-1084-41e2-aebb-8f63008f02e0	finished	Example input (Burnettramic Acids)		null		null	2021-09-28 19:49:38.987733	2021-09-28 19:49:39.251900	2021-09-28 19:56:21.354233
-R857T069K735K36	search	69393904-0da4-4a15-b640-77aaaf364d7e	finished			null		null	2021-09-28 20:10:05.849964	2021-09-28 20:10:06.117148	2021-09-28 20:11:44.511840
-B021Y773N910U33	search	8e1c9ce9-01a5-4a11-8c50-4243aa0d974c	finished			null		null	2021-09-28 20:22:06.368152	2021-09-28 20:22:06.628986	2021-09-28 20:23:37.544154
-N369S518A814S32	search	6887b248-4e3d-48c8-957b-c99ad6371961	finished			null		null	2021-09-28 20:28:55.111799	2021-09-28 20:28:55.382254	2021-09-28 20:31:32.397809
-J889F768Z754B33	search	8cbb082b-ba17-4d2e-8d44-f70db17a7b3a	finished		wenyuhan0609@gmail.com	null		null	2021-09-28 20:33:56.247881	2021-09-28 20:33:56.521305	2021-09-28 20:36:34.063561
-C844H918M634C30	search	9163cbfa-9d69-4fa0-9115-6375fe29a2a0	finished			null		null	2021-09-28 20:46:06.744705	2021-09-28 20:46:07.009630	2021-09-28 20:49:01.387992
-Z486Z439L170C11	search	44f55197-3955-4846-b851-aa62fd254135	finished			null		null	2021-09-29 04:29:38.582813	2021-09-29 04:29:38.851433	2021-09-29 04:32:27.229783
-Q814Y146I112X59	search	383a9e23-36df-4cb9-983b-af074652411d	finished			null		null	2021-09-29 04:35:06.440107	2021-09-29 04:35:06.708450	2021-09-29 04:41:51.439046
-E219Y740Z944E73	search	19c3659e-ebb3-45a8-be42-7848276d38a1	finished	aa		null		null	2021-09-29 04:41:53.733988	2021-09-29 04:41:54.003486	2021-09-29 04:43:53.034499
-Z330E400L810Z16	search	f62c706e-cd6f-4aa6-a569-8a1ab3bcf85e	finished		wenyuhan0609@gmail.com	null		null	2021-09-29 04:45:29.797794	2021-09-29 04:45:30.066595	2021-09-29 04:52:20.332179
-X289Y674W663A91	search	90d8c835-a2ff-47dc-bec6-e47e49d7bd6f	finished	TTT2	zyl2021ucla@gmail.com	null		null	2021-09-29 19:34:31.335880	2021-09-29 19:34:31.610815	2021-09-29 19:37:38.612633
-Z970A659D950D72	search	fee989e2-aa83-405d-a46d-17e99974ad0d	finished			null		null	2021-09-29 19:43:38.046538	2021-09-29 19:43:38.362642	2021-09-29 19:47:41.957251
-B224J706G843A05	search	5c2100ef-5f84-4a2c-b9bc-c84580b42baa	finished			null		null	2021-09-30 04:22:35.781663	2021-09-30 04:22:36.060078	2021-09-30 04:24:34.397003
-R358X992U388W21	search	a0a4f883-80c3-4374-b926-10a38e1a8628	finished			null		null	2021-09-30 16:09:25.706642	2021-09-30 16:09:25.972507	2021-09-30 16:11:05.386374
-L520H735W853B82	search	4b1d9da7-3477-4bcc-b88e-9d2f6daa75d7	finished			null		null	2021-09-30 17:21:38.774324	2021-09-30 17:21:39.053527	2021-09-30 17:25:00.943065
-O353V128I836F29	search	79ed8cab-438f-40b0-b6f9-5df093adc72d	finished			null		null	2021-09-30 17:22:13.602806	2021-09-30 17:22:13.869379	2021-09-30 17:29:24.723322
-M021A107K154O71	search	b4a0029d-112f-46eb-abcb-a15046d3bc6c	finished			null		null	2021-09-30 17:23:08.892237	2021-09-30 17:23:09.157457	2021-09-30 17:24:41.542185
-J473G519N185N03	search	67fa9727-387b-4ecc-8170-2811e9b984e9	finished			null		null	2021-09-30 17:28:58.189397	2021-09-30 17:28:58.459199	2021-09-30 17:35:32.802980
-W496I473K050E77	search	0dcc8698-eb32-4f68-a3d6-016c5f3356e8	finished			null		null	2021-09-30 17:29:35.874676	2021-09-30 17:29:36.148460	2021-09-30 17:29:36.900220
-H111K467M652V64	search	6c00d98e-9324-44f7-abc0-0523f66b4b69	finished	dnp		null		null	2021-09-30 17:31:07.210142	2021-09-30 17:31:07.478722	2021-09-30 17:31:08.223280
-C308G121O535N62	search	ae0c2901-0a60-4c9b-b850-fc9609446dd5	finished	N+P		null		null	2021-09-30 17:36:56.499094	2021-09-30 17:36:56.767174	2021-09-30 17:36:57.463840
-D863R823O482P19	search	97d829c2-11fc-4d7d-9851-f8faed7433f2	finished	N+D		null		null	2021-09-30 17:39:49.449634	2021-09-30 17:39:49.723231	2021-09-30 17:39:50.541206
-L134B741D624P11	search	86394a3f-cc61-485b-9c02-58e07ccae1de	finished	Ajap_34_1_7-18-10012021	eliz653@gmail.com	null		null	2021-10-02 01:16:58.985325	2021-10-02 01:16:59.251468	2021-10-02 01:21:52.614583
-S872Q976E845Y40	search	a9a05b9f-2750-46ce-aa9d-2486eb5d8d47	finished	A_jap_34_1_7-18_Pen		null		null	2021-10-02 02:15:14.697351	2021-10-02 02:15:14.970498	2021-10-02 02:31:11.609007
-P777O240F070Z84	search	34054221-d96e-4d93-9864-e134baf69366	finished			null		null	2021-10-02 02:32:45.223643	2021-10-02 02:32:45.494527	2021-10-02 02:32:46.151730
-E592N080W529K17	search	1572bc85-fece-496a-bb50-69c0b749a274	finished			null		null	2021-10-02 05:16:55.030639	2021-10-02 05:16:55.303034	2021-10-02 05:18:42.351375
-X791V019W951N63	clinker	82bd2c35-473e-4436-8406-9e018c02a83e	finished			null		null	2021-10-02 05:18:54.151584	2021-10-02 05:18:54.416210	2021-10-02 05:18:54.928312
-A754V311G416X97	search	27c1b2fe-5e85-42c5-877a-db869bfb2a43	finished			null		null	2021-10-02 05:19:24.613377	2021-10-02 05:19:24.884271	2021-10-02 05:23:30.858229
-I023Q253D647W33	search	f1677c16-c388-4162-afcf-1945ae9a987c	finished	AT1	zyl2021ucla@gmail.com	null		null	2021-10-04 03:00:48.341386	2021-10-04 03:00:48.612934	2021-10-04 03:03:04.320287
-Z885L897N624O16	search	5918afbd-0a74-41a1-a1b0-32fe4cbf3f5a	finished	AT2	zyl2021ucla@gmail.com	null		null	2021-10-04 03:02:21.222626	2021-10-04 03:02:21.503128	2021-10-04 03:04:28.201190
-U493M012X804C02	search	9e2df4a3-71bd-42ac-9cdb-1dc7d034a2ef	finished			null	O098D339I435P47	null	2021-10-04 17:42:36.337987	2021-10-04 17:42:36.627936	2021-10-04 17:46:04.664457
-O098D339I435P47	clinker_query	023f0045-cb6e-49a7-8b91-80f67083aef2	finished			U493M012X804C02		null	2021-10-04 17:46:39.072149	2021-10-04 17:46:39.344784	2021-10-04 17:46:39.890090
-O146L582T627X04	clinker	b43eb687-be2a-47a1-867b-7426aba512c9	finished			null		null	2021-10-04 17:47:29.996988	2021-10-04 17:47:30.270419	2021-10-04 17:47:30.709568
-F311W175M097U06	clinker	fd395c6d-8d18-4c1a-a7a9-35fee4e3e6ce	finished			null		null	2021-10-04 17:47:44.369729	2021-10-04 17:47:44.640914	2021-10-04 17:47:45.068247
-E666H189D516S66	search	783f58b5-fc07-41fa-a6ca-92a3714f0879	finished	DUF+NRPS	wenyuhan0609@gmail.com	null	W810V980Y056L34	null	2021-10-05 01:28:00.255691	2021-10-05 01:28:00.522724	2021-10-05 01:31:32.168487
-K249I164S860W76	search	281e402c-c324-4e62-b70e-fac1cc312918	finished	duf+nrps2		null		null	2021-10-05 01:36:08.723322	2021-10-05 01:36:08.987248	2021-10-05 01:36:09.597383
-W810V980Y056L34	extract_clusters	3dc67a30-63fc-42b6-bb40-22c375208ae9	finished			E666H189D516S66		null	2021-10-05 01:40:16.373470	2021-10-05 01:40:16.643007	2021-10-05 01:40:26.030215
-S067D657S412I11	search	260606af-8424-42d6-862f-e8ff1efbfcad	finished			null		null	2021-10-05 02:25:03.429511	2021-10-05 02:25:03.695016	2021-10-05 02:25:04.322348
-P745O570T409D02	search	35afb7e9-052e-4171-b0a2-51e24244badd	finished			null		null	2021-10-05 02:25:52.074964	2021-10-05 02:25:52.347050	2021-10-05 02:25:52.936730
-K740I912K532U36	search	0c2ce271-4f8d-4c09-be0c-aa80bbf7ebfb	finished			null		null	2021-10-05 02:30:44.772186	2021-10-05 02:30:45.055969	2021-10-05 02:30:45.906545
-Q020Z459K641U77	search	9d31be77-27aa-4d58-8e8a-625d9f3a36dd	finished			null	Q816U280U155E72,L661H385H508L43	null	2021-10-05 07:48:43.235544	2021-10-05 07:48:43.498690	2021-10-05 08:01:05.159348
-Q816U280U155E72	extract_clusters	9da62c4a-3b5e-4867-8af5-ab4e5218020a	finished			Q020Z459K641U77		null	2021-10-05 08:17:12.318621	2021-10-05 08:17:12.581783	2021-10-05 08:17:45.668522
-L661H385H508L43	clinker	9f205e2e-af64-42b0-b1e9-c680c3d8dee4	finished			Q020Z459K641U77		Q816U280U155E72	2021-10-05 08:17:12.334276	2021-10-05 08:17:45.967608	2021-10-05 08:17:51.165853
-P341M484X032Y03	search	348344f3-418a-481c-8401-ab94ad4da886	finished			null		null	2021-10-05 08:23:15.824713	2021-10-05 08:23:16.094017	2021-10-05 08:27:57.574612
-O727Z102U259W91	search	4ff541d2-7891-4a5b-8f27-4073b5ff6995	finished			null	V423M468Y309W51,G999F649R040R41	null	2021-10-05 08:37:32.267228	2021-10-05 08:37:32.531330	2021-10-05 08:37:33.161657
-Y849O980C869N83	search	d0fc6e21-e917-488e-bbd0-bdff41e10b62	finished			null		null	2021-10-05 09:00:04.609127	2021-10-05 09:00:04.876100	2021-10-05 09:04:02.154914
-G188V034D570J48	search	d8450bff-b5de-43e1-afa3-10848ec583e6	finished			null		null	2021-10-05 09:17:16.974127	2021-10-05 09:17:17.260434	2021-10-05 09:17:17.900204
-T520B953N592A53	search	9b6701fb-5087-4998-88d2-69d4c92aed03	finished			null	Q285U935J917G50	null	2021-10-06 02:37:24.060750	2021-10-06 02:37:24.453553	2021-10-06 02:41:32.205732
-N303N343X239J79	search	9d481fcf-251f-49f1-aa73-a9c452ae4b48	finished			null	L546I954R055T08	null	2021-10-06 02:38:05.153372	2021-10-06 02:38:05.474696	2021-10-06 02:52:10.365996
-O237C753Z464C94	clinker	3eb28e80-efab-4110-882c-126040d3cb24	finished			null		null	2021-10-06 02:38:46.270452	2021-10-06 02:38:46.574743	2021-10-06 02:38:47.126366
-F956H285B806P98	search	e802360b-495f-4ecf-95a2-68c2d5ddfccd	finished			null		null	2021-10-06 02:42:50.947319	2021-10-06 02:42:51.269243	2021-10-06 02:45:35.509114
-B820C370V291Y50	clinker	ea0f4142-c5bd-4963-a9e1-ef61bfea67f8	finished			null		null	2021-10-06 02:49:58.050283	2021-10-06 02:49:58.403278	2021-10-06 02:49:58.891152
-Q285U935J917G50	extract_clusters	69962b55-a80a-4f38-bf32-028733489503	finished			T520B953N592A53		null	2021-10-06 02:59:18.723541	2021-10-06 02:59:19.105631	2021-10-06 02:59:19.803170
-L546I954R055T08	extract_clusters	bd74cd7e-ba92-4072-a014-c83dbb2b00cd	finished			N303N343X239J79		null	2021-10-06 03:01:03.668184	2021-10-06 03:01:03.974589	2021-10-06 03:01:16.415643
-V732O774R818P45	search	40f922bd-5936-4c92-82b8-7b03db50c45a	finished			null		null	2021-10-06 03:08:11.982779	2021-10-06 03:08:12.296821	2021-10-06 03:20:39.298139
-B180U859H594O89	search	1123b717-ab70-42cd-9b41-c992fd6e9186	finished			null		null	2021-10-06 03:25:33.199321	2021-10-06 03:25:33.489737	2021-10-06 03:44:37.237281
-B026X780Q879Q13	search	7affb81b-07ee-4244-bf45-590832ba5022	finished			null		null	2021-10-06 03:25:43.285077	2021-10-06 03:25:43.558349	2021-10-06 03:46:41.440125
-R488G783U849V74	search	4a2f1bcc-c0b4-4871-ad14-36d158a3b07f	finished	3.2		null		null	2021-10-08 02:10:13.175381	2021-10-08 02:10:13.446168	2021-10-08 02:20:40.145717
-I924M397B380M49	search	1850c4cb-6d8f-44e4-a0b7-b7e353d92912	finished	3.2		null		null	2021-10-08 02:22:47.000798	2021-10-08 02:22:47.285029	2021-10-08 02:33:16.515262
-C824L544E500V86	search	aba9a560-f370-4d97-9590-5e15f75f83c4	finished	39.1		null		null	2021-10-08 19:03:03.374814	2021-10-08 19:03:03.654547	2021-10-08 19:12:15.793118
-F418I742X853C66	search	d00a94b6-cea6-4640-a094-21c69d528361	finished	96.1		null		null	2021-10-08 21:55:56.095678	2021-10-08 21:55:56.377127	2021-10-08 21:59:02.050852
-V944I834S531C33	search	10690c49-d64a-4a15-a694-47056dedfcb7	finished			null		null	2021-10-08 22:04:27.669538	2021-10-08 22:04:27.952429	2021-10-08 22:04:28.680786
-C113K495D518F55	search	6457fd66-9e5b-4a88-9d07-f1783a9512ea	finished	1.1		null		null	2021-10-09 17:49:45.373658	2021-10-09 17:49:45.651706	2021-10-09 17:53:04.908024
-V423M468Y309W51	extract_clusters	afd4b08c-7066-484b-b3b6-c5c3551fbb7e	finished			O727Z102U259W91		null	2021-10-10 16:38:06.799923	2021-10-10 16:38:07.066326	2021-10-10 16:38:42.163778
-M971X189S032Z10	clinker	ac4105cc-1101-49a3-b732-9240600d357b	finished			O727Z102U259W91		null	2021-10-10 16:39:15.590250	2021-10-10 16:39:15.862496	2021-10-10 16:39:21.545526
-G999F649R040R41	extract_clusters	fcc10ca9-dfa3-4a4c-9c54-36982cb3b5c2	finished			O727Z102U259W91		null	2021-10-10 16:49:32.772587	2021-10-10 16:49:33.034137	2021-10-10 16:49:38.252162
-M719L455T415L65	clinker	66ea54cc-54a0-4d0e-8332-6cc362041758	finished			O727Z102U259W91		null	2021-10-10 16:55:15.105925	2021-10-10 16:55:15.379862	2021-10-10 16:55:15.937007
-I947V848O413N22	search	9923d376-32cd-4961-a147-c654325e4e4c	finished	96.1		null		null	2021-10-10 19:06:20.595978	2021-10-10 19:06:20.867704	2021-10-10 19:09:10.243482
-M512M154Q625O53	search	a75a9df3-f43c-4234-9733-3fe7de023fc8	finished	96.1.2		null		null	2021-10-10 19:08:02.621313	2021-10-10 19:08:02.892045	2021-10-10 19:10:36.955157
-H654G889J751J34	search	f1c79995-d45b-400d-b9fd-8d055af09914	finished			null		null	2021-10-10 19:24:45.145720	2021-10-10 19:24:45.423041	2021-10-10 19:24:46.063189
-V804Z784Q884Z85	search	591edd84-cbb7-4776-a4b8-2464ef942931	finished	96.1.latter4		null		null	2021-10-10 19:28:53.685743	2021-10-10 19:28:53.951422	2021-10-10 19:33:28.188187
-P888M331I927S62	search	f314b2bf-24a3-4169-b0bd-169f09297216	finished	3.1		null		null	2021-10-10 20:28:03.922825	2021-10-10 20:28:04.196085	2021-10-10 20:33:26.703916
-F886F630V928H80	search	56a3ef1b-6e07-40a8-b5af-6c56b0826df2	finished	36.1		null	U691D068Y704Y28	null	2021-10-10 21:09:48.802508	2021-10-10 21:09:49.079145	2021-10-10 21:14:03.346023
-U691D068Y704Y28	clinker_query	ceb83f97-7a10-4c32-b942-9b191c1ff47e	finished	36.1		F886F630V928H80		null	2021-10-10 21:20:08.373112	2021-10-10 21:20:08.645882	2021-10-10 21:20:09.164561
-T112F516M222C44	search	eb18a80b-4fd1-4f6f-812c-d709299a7ea9	finished	ZZ	zyl2021ucla@gmail.com	null		null	2021-10-11 01:33:22.627990	2021-10-11 01:33:22.896118	2021-10-11 01:35:10.155683
-B143K648T870X72	clinker	aef28106-3bee-421b-bff4-41480dfe6a26	finished	Example visualization input (BA)		null		null	2021-10-11 03:18:28.371348	2021-10-11 03:18:28.643696	2021-10-11 03:18:29.075081
-H232W671T383K99	clinker	664c6e3b-aa37-45fb-bec0-ef8946120587	finished	Example visualization input (BA)		null		null	2021-10-11 03:18:29.638137	2021-10-11 03:18:29.910488	2021-10-11 03:18:30.360007
-Q672W684Q188U13	clinker	8ddfda3d-0f15-4730-9419-0f001db196cf	finished			null		null	2021-10-11 03:19:04.138099	2021-10-11 03:19:04.414989	2021-10-11 03:19:04.874328
-E030P158B257D14	clinker	c0041b1a-5e0d-4a08-ad23-9d8147faaad4	finished			null		null	2021-10-11 03:19:42.466022	2021-10-11 03:19:42.740100	2021-10-11 03:19:43.180369
-K823Q441X767H13	search	d501c5d4-ce63-49e5-baae-350c7cfcf2fa	finished			null		null	2021-10-11 03:24:35.789126	2021-10-11 03:24:36.065788	2021-10-11 03:31:26.613752
-L739O099T551N32	search	01918ba4-b32c-40f5-9188-1a34319c776d	finished			null		null	2021-10-11 03:41:30.960846	2021-10-11 03:41:31.238480	2021-10-11 03:49:33.812457
-C762P364K188T09	search	def54b09-b61e-4597-9729-f3d371479a14	finished			null		null	2021-10-11 03:55:53.521288	2021-10-11 03:55:53.789460	2021-10-11 04:05:01.526929
-D794W510A649Q62	search	5afbfe64-d7db-41fa-9fc9-7d50da52ca10	finished			null		null	2021-10-11 04:18:04.655196	2021-10-11 04:18:04.921656	2021-10-11 04:26:08.299693
-H028P823N784F14	search	0af4ee81-610d-4cd1-b308-43574a9136bb	finished			null	T889K073W585D66,T252Y525Z554I17,N130M483V754D07,C727D000B693P78	null	2021-10-11 04:26:43.970802	2021-10-11 04:26:44.242458	2021-10-11 04:39:51.931221
-O966Z947M076G36	search	65974b8a-ae73-4d52-971e-607c2a2a20c2	finished			null		null	2021-10-11 04:41:00.650955	2021-10-11 04:41:00.920458	2021-10-11 04:49:09.676153
-V657X719G680R13	search	c47e590f-f166-4200-9cb4-cfd512bf803d	finished			null	T829R565F728M38,M887F696B119R88	null	2021-10-11 05:54:52.098688	2021-10-11 05:54:52.374769	2021-10-11 05:56:31.010548
-T889K073W585D66	extract_clusters	a3698091-06b8-4a4d-9461-9fbee45049b4	finished			H028P823N784F14		null	2021-10-11 05:55:29.111884	2021-10-11 05:55:29.379720	2021-10-11 05:56:00.270394
-T252Y525Z554I17	clinker	f97da369-6ffb-41bb-8b91-90ff291af0d6	finished			H028P823N784F14		T889K073W585D66	2021-10-11 05:55:29.130344	2021-10-11 05:56:00.571988	2021-10-11 05:57:03.168105
-T829R565F728M38	extract_clusters	296688ea-4496-43a3-b475-3aeda2336bb0	finished			V657X719G680R13		null	2021-10-11 06:07:44.709496	2021-10-11 06:07:44.972128	2021-10-11 06:08:09.067326
-M887F696B119R88	clinker	66ee25f4-a371-4ff8-a1ab-b518f17d1e15	finished			V657X719G680R13		T829R565F728M38	2021-10-11 06:07:44.726566	2021-10-11 06:08:09.366221	2021-10-11 06:08:23.963540
-N130M483V754D07	extract_clusters	37fe01ff-6d0e-4d8e-9b80-01b4addedb1c	finished			H028P823N784F14		null	2021-10-11 06:54:58.508320	2021-10-11 06:54:58.781666	2021-10-11 06:55:29.641878
-C727D000B693P78	clinker	39fc2f7e-0bb8-4ee2-8457-5350107c8b69	finished			H028P823N784F14		N130M483V754D07	2021-10-11 06:54:58.526489	2021-10-11 06:55:29.939464	2021-10-11 06:56:33.095830
-G472K996C922P82	search	70dfff78-6caf-4c4e-b48e-7d5035657526	finished			null	B874R912S435W94,F728J571L263E83	null	2021-10-11 07:04:16.576814	2021-10-11 07:04:16.852541	2021-10-11 07:09:47.088170
-B874R912S435W94	extract_clusters	dc10751e-e38d-4e7f-bc27-cbe402429dc2	finished			G472K996C922P82		null	2021-10-11 07:37:14.004945	2021-10-11 07:37:14.280183	2021-10-11 07:37:33.154221
-F728J571L263E83	clinker	910fa564-e849-40d5-8460-68d0dc6f74cf	finished			G472K996C922P82		B874R912S435W94	2021-10-11 07:37:14.024755	2021-10-11 07:37:33.473478	2021-10-11 07:38:01.695587
-Y165D797X621T92	search	d4cf7bb0-bffe-42a2-a91f-3d8b8f28912b	finished	cluster 27	roaa.arishi@hotmail.com	null		null	2021-10-11 19:06:15.745339	2021-10-11 19:06:16.017631	2021-10-11 19:21:04.772754
-E033D982D718A70	search	c37c63fc-db9b-4d62-aca4-e2f0ca6b359b	finished	9.1		null		null	2021-10-15 21:04:28.223226	2021-10-15 21:04:28.521980	2021-10-15 21:08:52.895153
-Z395M238Q558L09	search	774faaba-4676-4eea-ac8f-acbf4bfca6d8	finished			null		null	2021-10-16 22:13:10.417137	2021-10-16 22:13:10.701260	2021-10-16 22:15:29.330992
-S193C722D106Y34	search	f3eba1f1-6027-43b0-a41e-41bb2b5d0f04	finished			null		null	2021-10-16 22:21:02.037934	2021-10-16 22:21:02.322687	2021-10-16 22:22:47.332218
-W297M050T089J44	search	a9c67d5b-8bdd-4822-964f-c71b7aa9829d	finished			null		null	2021-10-16 22:24:26.625366	2021-10-16 22:24:26.923607	2021-10-16 22:29:25.059677
-D820J424T104L88	search	60925d03-a52f-4c10-bb8d-a20316b10037	finished			null		null	2021-10-16 22:51:09.471487	2021-10-16 22:51:09.755235	2021-10-16 22:55:52.200431
-P432I849A697L26	search	c859bc6e-3530-45c6-a2ae-5611089ecbcc	finished			null		null	2021-10-16 23:03:57.811476	2021-10-16 23:03:58.103375	2021-10-16 23:11:25.576741
-C423E672Y712S46	search	da2a7509-d7f9-43c1-8748-e4e6997ca311	finished	CS	zyl2021ucla@gmail.com	null		null	2021-10-17 01:27:14.580408	2021-10-17 01:27:14.872052	2021-10-17 01:28:58.420523
-W663E128Z857O37	search	898a8bbe-7cb4-4c40-9ab5-f4de4fb33495	finished	OX	zyl2021ucla@gmail.com	null		null	2021-10-17 01:44:42.093521	2021-10-17 01:44:42.379511	2021-10-17 01:46:40.332194
-M571F453H864T12	search	2cc516be-0fde-4736-9bd7-e3fdf2b8a310	finished			null		null	2021-10-17 07:10:27.372137	2021-10-17 07:10:27.658563	2021-10-17 07:14:36.715030
-S570M407J645W34	clinker	365ce111-7615-4db4-8b7d-c09f36682db6	finished			null		null	2021-10-17 16:25:24.813247	2021-10-17 16:25:25.095733	2021-10-17 16:25:25.623353
-Q049O362M334Y45	search	8f0b9d4d-101c-4a88-9223-46ef9ab1b909	finished	294.1		null		null	2021-10-18 20:06:13.063291	2021-10-18 20:06:13.342530	2021-10-18 20:08:32.898371
-E004G662T954G12	search	5e641b33-ff20-4da7-bb08-8c323d948517	finished	271.1		null		null	2021-10-18 22:42:28.372875	2021-10-18 22:42:28.653010	2021-10-18 22:45:28.939439
-Z704I144K866E67	search	4d5a671c-049c-45ff-a420-f160df86270b	finished	139.1		null		null	2021-10-18 23:44:03.162544	2021-10-18 23:44:03.434208	2021-10-18 23:46:12.903464
-X540E388W360L64	search	3d2f6006-6a8f-4e6c-90a2-391167999c96	finished	138.1		null		null	2021-10-19 00:04:28.009132	2021-10-19 00:04:28.287045	2021-10-19 00:06:44.354285
-E880Y744B265K76	search	b2295bd1-5fcc-4ffb-8cec-786bf19bba91	finished			null		null	2021-10-20 19:27:46.648330	2021-10-20 19:27:46.953113	2021-10-20 19:33:02.870041
-Z482I317R088Z64	search	4945bf22-d41c-44de-9b65-d994b3aff1b1	finished			null		null	2021-10-21 18:53:30.796479	2021-10-21 18:53:31.115878	2021-10-21 18:55:09.355916
-L992J657V417E90	search	a385098a-b428-41c3-b0a4-5a027664aaf5	finished			null		null	2021-10-21 19:14:32.405317	2021-10-21 19:14:32.699554	2021-10-21 20:46:31.025185
-T216X055O247D98	search	f18cbe96-05a1-45b8-87e6-25677cc7640c	finished	AO_RIB40_orn_decarb_10022021	eliz653@gmail.com	null		null	2021-10-21 20:41:56.496761	2021-10-21 20:41:56.785843	2021-10-21 20:45:56.002333
-F970O021B297Y18	search	1ba99f43-8be0-47d9-962a-c78489347db0	finished	orn_decarb_10212021		null	L263T262T686B71	null	2021-10-21 23:33:01.804805	2021-10-21 23:33:02.114794	2021-10-21 23:36:21.144795
-E690A273V368A50	search	d1226409-5a6f-4aa3-85f8-337d5bb4d558	finished			null		null	2021-10-22 06:44:52.846863	2021-10-22 06:44:53.146693	2021-10-22 06:47:23.813814
-E899U295D407C58	search	90c6c104-9516-4b73-a791-a1d292305252	finished			null		null	2021-10-22 06:53:55.051118	2021-10-22 06:53:55.323888	2021-10-22 06:58:49.369460
-Q263H494F793C84	search	1e158ca6-6a6f-47ee-a71f-c67b97435528	finished			null		null	2021-10-22 07:25:47.960945	2021-10-22 07:25:48.242069	2021-10-22 07:32:54.492402
-X690K601N638P16	search	57a66b0e-0cf9-47a3-83f6-997688c97db0	finished	PKSAT	zyl2021ucla@gmail.com	null		null	2021-10-23 04:51:08.795618	2021-10-23 04:51:09.304897	2021-10-23 04:53:37.497478
-U886L366U517E48	search	0f7eb6c4-487f-4f89-a8e0-3ab5886f18f2	finished	CATAT	zyl2021ucla@gmail.com	null		null	2021-10-23 04:53:38.199270	2021-10-23 04:53:38.728342	2021-10-23 05:03:06.738277
-X417F535G650W97	search	74d4c9d5-45cc-44b9-813b-b79c4ff484b0	finished	PKSP	zyl2021ucla@gmail.com	null		null	2021-10-23 04:58:58.448594	2021-10-23 04:58:58.917870	2021-10-23 05:04:12.209416
-K200T696A688P43	search	deccc049-f587-48db-b28c-1a1af9f32021	finished	ATR5	zyl2021ucla@gmail.com	null		null	2021-10-24 00:46:07.943595	2021-10-24 00:46:08.611931	2021-10-24 00:47:38.736810
-B772Q954F188Y34	search	482dcacd-2cfd-46fd-8b11-3dfd4b3220f3	finished	AMP	zyl2021ucla@gmail.com	null		null	2021-10-25 17:19:43.181149	2021-10-25 17:19:43.505794	2021-10-25 17:25:51.892130
-C250Z011Y689G65	search	ef1d764b-0122-4f37-86a9-f0a2fa679d4e	finished	PT	zyl2021ucla@gmail.com	null		null	2021-10-25 17:46:08.757683	2021-10-25 17:46:09.227237	2021-10-25 17:53:08.407128
-C139S398G614I01	search	bb0d116f-58cf-494b-8467-53763f7a542e	finished	9.1		null		null	2021-10-25 22:49:33.677757	2021-10-25 22:49:34.131631	2021-10-25 22:54:56.063782
-M172P823B523V66	search	933fdab9-220a-4c61-8ff2-615e7b7e3011	finished			null	X438M726B350M84,K256P622S193G89,S744B039S568O40,T606P039H286S01	null	2021-10-25 23:22:18.280660	2021-10-25 23:22:18.619044	2021-10-25 23:22:20.007040
-X438M726B350M84	clinker_query	38b9ccd2-2aa4-4763-9ec6-c49f790d48ec	finished			M172P823B523V66		null	2021-10-25 23:23:13.442424	2021-10-25 23:23:13.895621	2021-10-25 23:23:14.893863
-K256P622S193G89	gne	44dab8f9-e716-4398-95ca-fafcdf11fd33	finished			M172P823B523V66		null	2021-10-25 23:23:27.419791	2021-10-25 23:23:27.814455	2021-10-25 23:23:31.140326
-J902D872B988Y89	search	88dfcc90-3436-4121-8546-350c7c39fe16	finished			null		null	2021-10-25 23:26:21.552565	2021-10-25 23:26:21.933470	2021-10-25 23:29:09.413578
-S744B039S568O40	extract_clusters	7d0780a1-729b-49d8-8183-24f9e31109d4	finished			M172P823B523V66		null	2021-10-25 23:34:07.123151	2021-10-25 23:34:07.396274	2021-10-25 23:34:07.901833
-T606P039H286S01	extract_clusters	512bf791-46a3-462e-9b15-b7a6d6b7d20a	finished			M172P823B523V66		null	2021-10-25 23:36:05.925090	2021-10-25 23:36:06.214167	2021-10-25 23:37:01.162957
-G402W132I522E54	clinker	0655b5ab-9996-4ab2-9280-799eabe6f269	finished			M172P823B523V66		null	2021-10-25 23:42:27.850514	2021-10-25 23:42:28.253612	2021-10-25 23:44:53.712492
-M410S875X179B09	search	a3e0d6cd-5fb0-4125-8c38-cdc1e1ea1170	finished			null		null	2021-10-26 01:14:25.846905	2021-10-26 01:14:26.209887	2021-10-26 01:19:29.060523
-S049Q427O102C38	search	0fb34589-6a43-46a4-85a1-77ecea842474	finished			null		null	2021-10-26 01:20:04.882764	2021-10-26 01:20:05.329222	2021-10-26 01:20:07.081226
-D250A306X677N69	search	24bdc431-4f26-4ab3-ab45-77822942413b	finished	K	zyl2021ucla@gmail.com	null		null	2021-10-26 01:26:05.226040	2021-10-26 01:26:05.676528	2021-10-26 01:30:13.248611
-E427C069V274A37	search	d770d109-86d9-41e2-a5ac-bd268162972f	finished	C	zyl2021ucla@gmail.com	null		null	2021-10-26 01:26:29.595215	2021-10-26 01:26:30.028983	2021-10-26 01:30:53.923727
-K392G716L290I82	search	8a838a7e-3f88-4dcb-89d4-95a4706f5cec	finished			null	W186K288T570B56,E164Y540F060I84	null	2021-10-26 01:27:49.287557	2021-10-26 01:27:49.639603	2021-10-26 01:34:05.861415
-A998E755V643N58	search	af4bd875-5926-40d2-a0cd-cdece1153477	finished	CK	zyl2021ucla@gmail.com	null		null	2021-10-26 01:28:40.385641	2021-10-26 01:28:40.750806	2021-10-26 01:30:48.550289
-M468V039O733S60	search	09168c26-d250-41e5-be1e-458d4c385a12	finished	CC	zyl2021ucla@gmail.com	null		null	2021-10-26 01:29:06.111357	2021-10-26 01:29:06.569249	2021-10-26 01:34:30.592928
-W186K288T570B56	extract_clusters	2883311c-10cb-4371-ae18-caaaef72c5f8	finished			K392G716L290I82		null	2021-10-26 01:44:09.601637	2021-10-26 01:44:09.901444	2021-10-26 01:44:24.732916
-E164Y540F060I84	clinker	cd7f7488-def3-4300-a2f1-64abb06fd7ae	finished			K392G716L290I82		W186K288T570B56	2021-10-26 01:44:09.620648	2021-10-26 01:44:25.070703	2021-10-26 01:44:34.086262
-H643T641J288Y24	search	9ffb7902-a573-407e-9ade-6849860fcd4c	finished			null		null	2021-10-26 01:47:10.855372	2021-10-26 01:47:11.206303	2021-10-26 01:55:48.153857
-M732K364Z019T87	search	65716bfc-fd71-45fb-adfb-8ce710164b54	finished			null		null	2021-10-26 02:29:16.635850	2021-10-26 02:29:17.041524	2021-10-26 02:29:18.208424
-X029K572X561T62	search	5e5cc495-06e0-4d08-b051-784b8cdd497b	finished			null		null	2021-10-26 04:28:51.311006	2021-10-26 04:28:51.749010	2021-10-26 04:36:54.591313
-K924S983F226S47	search	7078a190-0914-4d6d-8817-53674a2b5367	finished			null		null	2021-10-26 19:54:20.595912	2021-10-26 19:54:20.916617	2021-10-26 19:56:11.117504
-C322N685T718R08	search	d7bed9f6-1e78-4f56-a1b6-785910f3b694	finished			null		null	2021-10-26 20:00:18.644164	2021-10-26 20:00:18.920602	2021-10-26 20:00:19.699793
-O783J596O639K56	search	e8429674-38ac-4954-b5f1-09ad08f5ebff	finished			null		null	2021-10-26 20:05:14.561193	2021-10-26 20:05:14.847774	2021-10-26 20:08:21.119799
-M204Q691X993H82	search	2089551e-8a73-4283-a384-7c102a7d2987	finished	Asp_pseduotamarii_genes		null		null	2021-10-26 21:07:25.452998	2021-10-26 21:07:25.719803	2021-10-26 21:12:30.123393
-F158S323G544D56	search	1b2ff9d8-713a-4f23-936f-acb898b7e310	finished	A_jap-orn-decarb-1		null		null	2021-10-26 22:31:39.359923	2021-10-26 22:31:39.658222	2021-10-26 22:34:25.408276
-Q788L807F619C46	search	1f741601-1d64-42e2-ab25-980cded35d5f	finished	A_jap-orn-decarb-2		null		null	2021-10-26 22:32:17.754918	2021-10-26 22:32:18.031509	2021-10-26 23:49:26.021384
-P807S232F154C30	search	27c80e9d-ecf5-48c4-9abd-e27929e926dd	finished	Asp_jap_nrps_2		null		null	2021-10-26 23:53:36.607792	2021-10-26 23:53:36.890570	2021-10-26 23:55:24.668624
-H990U908M392O40	search	4954882e-c7ad-40ee-82ee-7ee97b4e969e	finished			null	Q743S985V658S33,A686V315P639G84	null	2021-10-28 03:57:16.048081	2021-10-28 03:57:16.346342	2021-10-28 03:59:20.176180
-Q743S985V658S33	extract_clusters	3781609d-87ea-46db-8ce5-3e51c3738883	finished			H990U908M392O40		null	2021-10-28 04:00:00.291917	2021-10-28 04:00:00.596146	2021-10-28 04:00:14.348561
-A686V315P639G84	clinker	9f66cc2d-a67b-4915-93de-1ef6bffc0880	finished			H990U908M392O40		Q743S985V658S33	2021-10-28 04:00:00.315940	2021-10-28 04:00:14.683993	2021-10-28 04:00:15.968273
-E704T496F225M14	search	6c145c49-852b-43be-8e7d-58e61b3f5c7e	finished			null		null	2021-10-28 04:00:19.608382	2021-10-28 04:00:19.926058	2021-10-28 04:02:11.944316
-Y951F213B287K62	search	09fff4cd-acd3-4834-acf6-a0bc23e4beb0	finished			null		null	2021-10-28 04:03:53.446945	2021-10-28 04:03:53.734866	2021-10-28 04:03:54.651918
-D617D910F343I30	search	d754ad51-3c0e-4b6c-806e-3a768fe40e6d	finished			null	X652F153P620C84,G952V967S997J99,Q703Z054H400Z69,C051C659K973Y67,Y162Y204I283X48,P310R993X721C92,T610W773O544H18,M403X130P979M66,W686X328P841L44,O837W762X017G93	null	2021-10-28 04:05:06.860567	2021-10-28 04:05:07.166513	2021-10-28 04:05:07.941888
-X652F153P620C84	gne	e76890cf-6300-4872-9475-425e0cf8fbae	finished			D617D910F343I30		null	2021-10-28 04:08:42.834847	2021-10-28 04:08:43.110931	2021-10-28 04:08:44.839440
-G952V967S997J99	gne	f21cce38-c2f7-41f7-99a6-d1038a4a19ac	finished			D617D910F343I30		null	2021-10-28 04:09:45.425569	2021-10-28 04:09:45.710715	2021-10-28 04:09:47.416970
-Q703Z054H400Z69	gne	496ca2d0-a717-463b-b8d8-ed406e32b2cd	finished			D617D910F343I30		null	2021-10-28 04:10:19.521255	2021-10-28 04:10:19.808506	2021-10-28 04:10:21.539498
-C051C659K973Y67	extract_clusters	8597cd42-2fc0-42dc-9a42-a5c50aaa7c01	finished			D617D910F343I30		null	2021-10-28 04:11:08.471621	2021-10-28 04:11:08.774641	2021-10-28 04:11:09.312218
-Y162Y204I283X48	extract_clusters	93b1709b-b5db-4767-a98b-36ca6ff3b5e3	finished			D617D910F343I30		null	2021-10-28 04:15:02.033689	2021-10-28 04:15:02.310297	2021-10-28 04:17:33.370081
-M403X130P979M66	clinker	f0bacda0-7c4d-4915-92db-6477a9ba4451	finished			D617D910F343I30		T610W773O544H18	2021-10-28 04:15:06.198361	2021-10-28 04:15:35.189356	2021-10-28 04:15:35.667923
-O837W762X017G93	clinker	b95b90bd-e608-4c0f-a0ca-da78dd0250fd	finished			D617D910F343I30		W686X328P841L44	2021-10-28 04:16:48.659943	2021-10-28 04:17:04.812583	2021-10-28 04:17:05.267282
-X320S681L827T05	search	c223f1b5-7e79-4a59-81c6-a1098d264466	finished	A_fulv_lnaA		null		null	2021-10-28 20:40:16.713557	2021-10-28 20:40:17.007426	2021-10-28 20:45:28.001723
-Q889Q312N699D85	search	bea5a9ae-2092-4cf7-9561-e054d84fe566	finished	Aph_fulv_lnaA		null		null	2021-10-28 20:54:09.407670	2021-10-28 20:54:09.721080	2021-10-28 20:56:42.192940
-S824W390T813R36	search	71ab7971-e6e4-4c9a-b38c-baea4e4ddd84	finished	Aph_fulv_lnaa_24-28		null		null	2021-10-28 21:13:30.685819	2021-10-28 21:13:30.963108	2021-10-28 21:20:07.028411
-E581P027W772H31	search	b0127c4f-76da-496c-af8b-ccd100faf611	finished	prodigiosin search	mohammad.alanjary@wur.nl	null		null	2021-10-29 12:44:31.309497	2021-10-29 12:44:31.704382	2021-10-29 12:52:17.196609
-W673W571Y169V94	search	d8b1d4b0-ce8b-462b-8fef-6d9c7c150e78	finished	psitest	yitheng.chooi@uwa.edu.au	null		null	2021-10-29 23:44:36.550245	2021-10-29 23:44:37.011070	2021-10-29 23:46:45.695839
-V387L598L803D71	search	47f81f97-e9a2-4df8-a381-e7054a24bd18	finished			null		null	2021-10-29 23:50:08.525608	2021-10-29 23:50:08.899287	2021-10-29 23:50:10.286572
-A878M647X706B52	search	b9b48286-5138-459b-8cfd-eb20f27b7bd0	finished	psitest3	yitheng.chooi@uwa.edu.au	null		null	2021-10-29 23:54:01.355223	2021-10-29 23:54:01.667011	2021-10-29 23:54:02.897138
-S986A507U334Q35	search	89000e85-bbe1-487d-a8e3-991ea75ca59e	finished	psitest3	yitheng.chooi@uwa.edu.au	null		null	2021-10-29 23:56:59.331995	2021-10-29 23:56:59.614613	2021-10-29 23:57:06.145412
-W313V670H068E65	search	c3b0ee2f-f91a-4aa8-8e5d-87ae0d6954e7	finished			null	Q118Z877U438M69,D859R223G023C38	null	2021-10-31 02:23:12.124016	2021-10-31 02:23:12.432317	2021-10-31 02:29:42.417987
-Q118Z877U438M69	extract_sequences	df337f88-c86c-4515-bdea-721322a557a4	finished			W313V670H068E65		null	2021-10-31 02:32:36.797307	2021-10-31 02:32:37.245835	2021-10-31 02:50:31.277810
-D859R223G023C38	extract_clusters	6d62e6b5-68f7-4b1c-aba7-a2f0dfc57a19	finished			W313V670H068E65		null	2021-10-31 02:53:25.392734	2021-10-31 02:53:25.853004	2021-10-31 02:53:38.341063
-U749R694X791Z09	search	66ce872e-fee5-4f46-a079-beb58f7659d1	finished	6.1		null	P445T682T950Q23,Z095N745X777X13	null	2021-11-03 19:45:56.272286	2021-11-03 19:45:56.623158	2021-11-03 19:51:29.535045
-Z095N745X777X13	clinker	3c285103-ecd9-4a16-bb43-8245a6d452f3	finished			U749R694X791Z09		P445T682T950Q23	2021-11-03 19:56:36.529297	2021-11-03 19:57:04.100215	2021-11-03 19:57:04.557039
-G205G246Y148S70	search	1d6eb14c-8319-41d2-903a-8e10ff1ab07c	finished	6.1		null		null	2021-11-03 20:01:12.552545	2021-11-03 20:01:12.837042	2021-11-03 20:04:40.129665
-U007Z634I694U20	search	26394c51-034f-4af2-8c3c-803d5767cf94	finished	6.1		null		null	2021-11-03 20:39:11.728724	2021-11-03 20:39:12.038778	2021-11-03 20:41:00.273960
-Y717X980I978U05	search	8ccc2d72-7c74-41f6-be6c-df7f3d3a63ce	finished	6.1		null		null	2021-11-03 20:48:01.078981	2021-11-03 20:48:01.386839	2021-11-03 20:52:01.166974
-N316Z678T922W39	search	6e404991-67cd-477f-bfbe-2e1ec05de225	finished	96.1		null		null	2021-11-03 21:02:40.244265	2021-11-03 21:02:40.516644	2021-11-03 21:12:54.688782
-G338I920L555Q49	search	01b75a9c-e979-4466-8025-7a7330e36ff4	finished	peni		null		null	2021-11-03 21:10:49.788229	2021-11-03 21:10:50.099418	2021-11-03 23:54:37.831492
-Z897J305U711C34	search	8341b0e6-90ac-42b8-8c9e-84f4c67a2776	finished			null		null	2021-11-03 21:17:33.194399	2021-11-03 21:17:33.514301	2021-11-03 21:22:54.813760
-G591A378W052V08	search	53358e9b-9516-476e-954d-0832fcce43dd	finished			null		null	2021-11-03 21:31:28.044860	2021-11-03 21:31:28.363883	2021-11-03 21:40:01.857371
-L263T262T686B71	gne	f806ab64-b93a-443b-ad56-f67beafeff94	finished			F970O021B297Y18		null	2021-11-04 00:36:28.589486	2021-11-04 00:36:28.891709	2021-11-04 00:36:32.340533
-G468Y720H561S32	search	b747dda4-96dd-4a6c-851e-c69c55e080e0	finished	Aph_fulv_11-14_55	eliz653@gmail.com	null		null	2021-11-04 02:54:30.084083	2021-11-04 02:54:30.396479	2021-11-04 02:57:32.323054
-J082I823C741C48	search	014b001d-d3ac-4f80-972f-11925b5a6ff8	finished	Aph_fulv_55_11-14_apergillus	eliz653@gmail.com	null		null	2021-11-04 02:55:51.686316	2021-11-04 02:55:51.975791	2021-11-04 03:07:54.380017
-U131G247P849H92	clinker	79eee1c0-5722-460e-8930-6ba2192c4f4e	finished			null		null	2021-11-08 10:02:08.478699	2021-11-08 10:02:08.774801	2021-11-08 10:02:10.752736
-S975O986R769F43	clinker	8fbcd9e7-9578-480c-92a6-4d126b3d7fb5	finished			null		null	2021-11-08 10:16:37.324211	2021-11-08 10:16:37.613707	2021-11-08 10:16:39.452098
-I087Z185P651N30	search	958c223d-b0ed-4ccf-b09d-a6bb831b927b	finished	Sco_bre_11082021_sid		null		null	2021-11-08 20:50:51.928014	2021-11-08 20:50:53.384417	2021-11-08 20:55:01.735921
-H403L326E443A12	search	dd80b702-97dc-426c-a732-63a8869f6e44	finished	Sco_bre_11082021_sid_2		null		null	2021-11-08 20:58:18.499424	2021-11-08 20:58:18.774605	2021-11-08 21:01:04.270945
-I068T225P686Y58	search	fa0227e9-2075-4b52-905e-1f5bb010e315	finished	a-kg		null		null	2021-11-08 22:51:31.582939	2021-11-08 22:51:31.902806	2021-11-08 22:52:26.969085
-H427W386R393V85	search	96082aaa-d877-408e-b29b-8602840613c0	finished	a-kg		null		null	2021-11-08 22:54:40.444433	2021-11-08 22:54:40.745874	2021-11-08 22:57:42.981833
-S944N911W720D16	search	581cad15-56fe-4217-a32b-72bcc695d7ce	finished	Example input (Burnettramic Acids)		null	C458C511A544Y83,Y971A594A168K93	null	2021-11-09 04:47:42.844717	2021-11-09 04:47:43.290680	2021-11-09 04:54:30.328269
-C458C511A544Y83	extract_clusters	a72255de-5b2c-4c1a-a302-37f263f3f49a	finished			S944N911W720D16		null	2021-11-09 05:25:41.167376	2021-11-09 05:25:41.516528	2021-11-09 05:26:31.909382
-Y971A594A168K93	clinker	37002543-cb75-4ad9-ade3-82ff27dc5d6c	finished			S944N911W720D16		C458C511A544Y83	2021-11-09 05:25:41.290516	2021-11-09 05:26:32.310312	2021-11-09 05:29:49.085013
-S305P263Z161K16	search	c79acf6a-ab48-4a89-8462-6a3cf36115c5	finished	ak-c316		null	U330P612Z084U14	null	2021-11-09 05:47:21.633065	2021-11-09 05:47:21.942240	2021-11-09 05:52:56.120651
-U330P612Z084U14	clinker_query	0b52b20c-87a4-409f-9fe5-e529280cecad	finished			S305P263Z161K16		null	2021-11-09 06:00:23.972291	2021-11-09 06:00:24.248415	2021-11-09 06:00:25.767968
-C093O560E427D31	search	2d31af13-4ea9-4402-ba29-173e328089a9	finished			null		null	2021-11-12 03:22:17.910743	2021-11-12 03:22:20.135554	2021-11-12 03:30:12.131265
-J521X395T828M14	search	e3bd0d5c-5df1-4d5e-90d2-e11bed9e999d	finished	Aphfulv_nrps_node25_aspergillus	eliz653@gmail.com	null		null	2021-11-13 01:51:51.017107	2021-11-13 01:51:53.298383	2021-11-13 01:54:01.649780
-W312J371G143F80	search	11e81d8a-ddce-491e-9caa-ee9f991de3ba	finished	chr_fulv_5	eliz653@gmail.com	null		null	2021-11-13 02:38:21.012400	2021-11-13 02:38:21.709781	2021-11-13 02:41:28.719458
-F918I254C708M66	search	976e7005-bc3f-4453-8c55-371948ded25c	finished	Aph_fulv_1_63-75	eliz653@gmail.com	null		null	2021-11-13 03:49:56.237324	2021-11-13 03:49:56.747722	2021-11-13 03:52:09.914256
-C329Q189C976F42	search	c8eb7b3d-1633-41e9-b9f5-2db059441156	finished	Aph_fulv_65-73_node1_all		null		null	2021-11-13 03:55:24.697223	2021-11-13 03:55:25.128418	2021-11-13 03:59:20.572277
-Y091I702U854J34	clinker	ce6b610a-b56d-45ca-a1eb-151a392588ff	finished			null		null	2021-11-16 15:39:21.980748	2021-11-16 15:39:22.669623	2021-11-16 15:39:24.630259
-R793D419E969J26	search	00a8ed5a-24b5-4e88-aae2-4e687a099b2d	finished			null	W121I686Y881T90,H122S190N735I72,N858Q343Y869V01,Z093K908L066G36,Y960O932E054D88,S822U439G019Z27,K097Q183Y775J65,E336M199S606N55,B269W864N132K67,W463Y153A058F32,P795Z275J007O98,V509R292H017B61,H183S049R440N70,Y725S341E503A27,Z837Y726X728N70,B808N668Y297N91,W287K917X818W36,N448N057J478L83,V175T764Q691X80,I569V998U789C93	null	2021-11-17 04:12:48.420928	2021-11-17 04:12:48.757106	2021-11-17 04:29:32.303073
-T674W480H381O48	clinker	fa0cc6ac-a766-469f-a685-69ed2234b69f	finished			null		null	2021-11-17 04:13:29.835410	2021-11-17 04:13:30.140601	2021-11-17 04:13:30.700001
-U546R570M098R53	clinker	3d33b6a5-a93d-4dae-880a-9931e45d51c5	finished			null		null	2021-11-17 08:38:06.010581	2021-11-17 08:38:06.302690	2021-11-17 08:38:06.860927
-W121I686Y881T90	extract_clusters	5c7b88e1-778a-4baa-a6c6-5b21f9bb0001	finished			R793D419E969J26		null	2021-11-17 08:38:28.432007	2021-11-17 08:38:28.776938	2021-11-17 08:38:40.069838
-H122S190N735I72	clinker	0c07c996-6eb8-4491-915d-cc3cc84a8e25	finished			R793D419E969J26		W121I686Y881T90	2021-11-17 08:38:28.512177	2021-11-17 08:38:40.756072	2021-11-17 08:39:02.232989
-V956F805K986V08	search	5b3bc71a-c049-42eb-8e17-e7b714b09dd0	finished			null		null	2021-11-17 08:39:53.038008	2021-11-17 08:39:53.425155	2021-11-17 08:56:49.236734
-N858Q343Y869V01	clinker_query	6a91534c-8576-4f58-8d0e-dd71b7bd616b	finished			R793D419E969J26		null	2021-11-17 08:54:24.821968	2021-11-17 08:54:25.224253	2021-11-17 08:54:25.929940
-N365F479E617C48	search	81f6cf2e-0d8a-4012-bc80-204d3e3bd31b	finished			null		null	2021-11-17 09:05:30.602830	2021-11-17 09:05:30.910058	2021-11-17 09:05:32.544592
-E166T199T615R72	clinker	574a008c-75ef-47bc-b10d-c4cc3ccbcfa1	finished	Example visualization input (BA) - test if mail is still wor	matthiasvandenbelt@hotmail.com	null		null	2021-11-17 11:02:18.782460	2021-11-17 11:02:19.114884	2021-11-17 11:02:22.307726
-Z379K767Z191A89	clinker	bd034e55-495e-4d22-bcb4-a61deb8fa7b7	finished	Example visualization input (BA)		null		null	2021-11-17 12:38:50.541759	2021-11-17 12:38:50.849144	2021-11-17 12:38:53.574740
-D808S644N301A69	search	379948ac-cbc7-426d-8ff4-88714b42a2d4	finished	1.3		null		null	2021-11-18 01:40:21.994282	2021-11-18 01:40:22.267429	2021-11-18 01:48:02.799230
-M240Q011N101N21	search	f07de1f5-a4c6-4216-9d88-84d19f9d91a7	finished			null	O442Y508W333O50,C532U070F568M58	null	2021-11-18 02:55:56.863728	2021-11-18 02:55:57.140233	2021-11-18 02:55:58.526338
-O442Y508W333O50	extract_clusters	f4dd3331-89c9-4bed-a979-a99bd0033a47	finished			M240Q011N101N21		null	2021-11-18 03:03:55.619031	2021-11-18 03:03:55.890736	2021-11-18 03:04:15.690685
-C532U070F568M58	clinker	bf56df0a-7224-4f3e-b578-4fe02f0bab62	finished			M240Q011N101N21		O442Y508W333O50	2021-11-18 03:03:55.640549	2021-11-18 03:04:16.004466	2021-11-18 03:04:54.093747
-Z093K908L066G36	extract_clusters	af6436e7-50d9-4a35-a427-e637b06215d1	finished			R793D419E969J26		null	2021-11-18 03:11:30.724015	2021-11-18 03:11:31.023940	2021-11-18 03:11:42.223464
-Y960O932E054D88	clinker	fa238577-5d35-4cec-b26f-8cf7c57f998f	finished			R793D419E969J26		Z093K908L066G36	2021-11-18 03:11:30.740817	2021-11-18 03:11:42.539723	2021-11-18 03:12:03.257066
-S822U439G019Z27	clinker_query	c1e3550f-d896-4b54-967c-85a78e83cd4e	finished			R793D419E969J26		null	2021-11-18 06:51:38.573350	2021-11-18 06:51:38.866977	2021-11-18 06:51:39.613971
-W834A375V089G60	extract_clusters	ef9b5e10-1def-44e8-a004-e15c63f2b2d3	finished			R793D419E969J26		null	2021-11-18 06:53:18.761260	2021-11-18 06:53:19.046873	2021-11-18 06:53:29.828571
-U615I371M417R46	clinker	ed5f2b3e-3623-4905-bff2-ccd5c86813c4	finished			R793D419E969J26		null	2021-11-18 06:54:18.236215	2021-11-18 06:54:18.533610	2021-11-18 06:54:39.231615
-W835T357N410C67	clinker	1740e188-5cbc-443d-a793-cd0bf4ebc1d0	finished			R793D419E969J26		null	2021-11-18 06:55:30.963880	2021-11-18 06:55:31.261020	2021-11-18 06:55:31.884891
-K097Q183Y775J65	clinker_query	8f096cef-51af-4e0f-8917-f42e5001daca	finished			R793D419E969J26		null	2021-11-18 06:55:52.370715	2021-11-18 06:55:52.656802	2021-11-18 06:55:53.388986
-E336M199S606N55	extract_clusters	aa1a334a-e944-4b8c-b79d-bc9d1db51da1	finished			R793D419E969J26		null	2021-11-18 06:57:28.194230	2021-11-18 06:57:28.492931	2021-11-18 06:57:39.860299
-B269W864N132K67	clinker	5abae4b6-bf14-4d9d-90bb-41d086b9290a	finished			R793D419E969J26		E336M199S606N55	2021-11-18 06:57:28.210173	2021-11-18 06:57:40.186656	2021-11-18 06:58:00.940455
-G421A493S216I08	search	e8f0145f-a9cf-4e18-aa9a-1d763e31b5b4	finished			null		null	2021-11-18 07:00:02.665304	2021-11-18 07:00:02.940605	2021-11-18 07:00:04.325594
-V785I965M996B68	search	89f38500-e6dd-4277-8c27-c8f035f92e26	finished			null		null	2021-11-18 07:02:31.384516	2021-11-18 07:02:31.676747	2021-11-18 07:02:33.068018
-G842M305U971P13	search	fe69945f-a4b9-4840-a4b7-3dc252f5c4ec	finished			null	P133J389R037Z00,E208U101N914V50	null	2021-11-18 07:03:15.519412	2021-11-18 07:03:15.810503	2021-11-18 07:03:17.165526
-P133J389R037Z00	extract_clusters	a6248236-27fe-4f66-a3c9-bb396bed42a8	finished			G842M305U971P13		null	2021-11-18 07:04:02.233044	2021-11-18 07:04:02.531951	2021-11-18 07:04:13.836918
-E208U101N914V50	clinker	e64680a6-c926-44dc-b537-ff1feba8716d	finished			G842M305U971P13		P133J389R037Z00	2021-11-18 07:04:02.251199	2021-11-18 07:04:14.165023	2021-11-18 07:04:35.224601
-W463Y153A058F32	extract_clusters	7c6c4f21-aac2-4656-b6bd-ee229a952629	finished			R793D419E969J26		null	2021-11-18 07:07:22.215497	2021-11-18 07:07:22.499130	2021-11-18 07:07:33.607263
-K641M709U616K52	clinker	f5730f68-fae8-4d51-b872-7fe2af13fa9d	finished			R793D419E969J26		null	2021-11-18 07:07:59.607225	2021-11-18 07:07:59.882276	2021-11-18 07:08:20.496897
-P795Z275J007O98	clinker_query	238377bc-a8d6-40a6-aa93-409e73d65575	finished			R793D419E969J26		null	2021-11-18 07:09:29.420850	2021-11-18 07:09:29.695670	2021-11-18 07:09:30.421754
-X411X383U547Q72	extract_clusters	fb31e5fe-2cd6-40ec-8a36-85acc6988ff2	finished			R793D419E969J26		null	2021-11-18 07:10:35.857248	2021-11-18 07:10:36.152095	2021-11-18 07:10:43.010676
-L418U036G967R05	clinker	5450cedb-7cf8-4a82-9129-a0081da3f00c	finished			R793D419E969J26		null	2021-11-18 07:11:31.314716	2021-11-18 07:11:31.614066	2021-11-18 07:11:37.887478
-V509R292H017B61	extract_clusters	6b996ec9-5d73-420d-b087-1dc9f23797c5	finished			R793D419E969J26		null	2021-11-18 07:16:47.562872	2021-11-18 07:16:47.859148	2021-11-18 07:16:57.927613
-H183S049R440N70	clinker	60e78bfb-c995-4bd6-9321-51d85eb00503	finished			R793D419E969J26		V509R292H017B61	2021-11-18 07:16:47.577086	2021-11-18 07:16:58.262170	2021-11-18 07:17:18.997754
-Y725S341E503A27	clinker_query	9fe863da-b48a-42a0-aea4-0ad828caa585	finished			R793D419E969J26		null	2021-11-18 07:18:46.407252	2021-11-18 07:18:46.680487	2021-11-18 07:18:47.336653
-S659I201H124W35	search	b0764943-f63a-4035-909e-0162f0f5f0eb	finished	Asp_chr_fulv_007_54-65_2ndfind	eliz653@gmail.com	null		null	2021-11-18 22:24:41.092784	2021-11-18 22:24:41.369846	2021-11-18 22:30:08.269911
-I289X205Q481R68	search	b801e409-65ba-44aa-971b-a0c2696f789c	finished	Chr_fulv_54-65_2ndfind_007_all	eliz653@gmail.com	null		null	2021-11-18 22:37:45.789392	2021-11-18 22:37:46.065056	2021-11-18 22:42:52.426332
-W279S891B558Y32	search	de3467b5-00eb-4ce5-ab2d-4f6135fbbaba	finished	chr_fulv_007_all_2ndfind_54-65		null		null	2021-11-18 22:45:11.443988	2021-11-18 22:45:11.723358	2021-11-18 22:52:25.262768
-Z837Y726X728N70	extract_sequences	58b1d47b-7842-42b9-9696-8be6fa96c8c5	finished			R793D419E969J26		null	2021-11-19 03:32:24.900078	2021-11-19 03:32:25.178529	2021-11-19 03:32:25.842261
-B808N668Y297N91	clinker_query	81fd1292-d9f4-4d1f-95d7-a348947ee2b5	finished			R793D419E969J26		null	2021-11-19 03:36:48.635235	2021-11-19 03:36:48.919645	2021-11-19 03:36:49.622368
-W287K917X818W36	extract_clusters	05161553-bb79-49c4-8b94-59455881ff63	finished			R793D419E969J26		null	2021-11-19 03:41:38.200112	2021-11-19 03:41:38.474630	2021-11-19 03:41:51.329370
-N448N057J478L83	clinker	4e8910a8-3883-487d-84f9-8a8c90dd6d13	finished			R793D419E969J26		W287K917X818W36	2021-11-19 03:41:38.213195	2021-11-19 03:41:51.635310	2021-11-19 03:42:12.430730
-S717X077I024S45	search	ea752d96-488e-4824-9c9b-6c69847b8a1b	finished	Mthermo-ATR-fusedp450	eliz653@gmail.com	null		null	2021-11-19 22:18:46.178274	2021-11-19 22:18:46.692826	2021-11-19 22:22:23.162788
-K358J419F876Y08	search	75f94c89-eee6-4d5f-822a-3f9fe15c0de3	finished	pac		null		null	2021-11-20 02:07:24.691932	2021-11-20 02:07:24.956053	2021-11-20 02:12:48.552687
-K542D371D059J50	search	1fae08fe-9549-4bdc-b2c8-5aa7c8fc8a31	finished			null		null	2021-11-20 02:14:39.780479	2021-11-20 02:14:40.050475	2021-11-20 02:14:41.424373
-R932R079D993A61	search	99b101d5-4069-4baa-bb61-1cc0ae097824	finished			null		null	2021-11-20 02:16:59.282906	2021-11-20 02:16:59.544418	2021-11-20 02:17:00.937460
-M391S328G185Y06	search	ec3350ce-b965-4716-9e11-11dc7eee61f8	finished			null		null	2021-11-20 02:27:43.203481	2021-11-20 02:27:43.468370	2021-11-20 02:32:44.413287
-Z639W985U743V94	clinker	4b9206f4-42b6-47ce-91c7-253ba76df1a3	finished	Example visualization input (BA)		null		null	2021-11-22 09:46:34.953561	2021-11-22 09:46:35.243267	2021-11-22 09:46:37.883074
-Y173F536K176D35	search	b90ac785-d1a8-47ae-8d76-f2d02276d2a8	finished	Example input (Burnettramic Acids)		null		null	2021-11-23 11:09:13.731283	2021-11-23 11:09:14.251777	2021-11-23 11:15:49.708172
-K343W276O419T12	clinker	34ac271e-5007-4c33-9d4b-902592988a3e	finished	Example visualization input (BA)		null		null	2021-11-23 11:11:10.014492	2021-11-23 11:11:10.410293	2021-11-23 11:11:14.299514
-W357L897R072M04	clinker	b7feeb61-3e52-4102-a810-5b91941556e6	finished	Example visualization input (BA)		null		null	2021-11-23 11:12:09.494786	2021-11-23 11:12:09.888984	2021-11-23 11:12:13.149023
-F585S432Z740E95	clinker	7d35c3e1-41fe-487b-8a9f-806ea1cc5243	finished	Example visualization input (BA)		null		null	2021-11-23 11:18:05.609983	2021-11-23 11:18:06.093821	2021-11-23 11:18:09.243935
-X595Z338L862H20	clinker	730283ff-24f2-45ac-8401-db68b5e1e0c2	finished	Example visualization input (BA)		null		null	2021-11-23 11:19:01.418089	2021-11-23 11:19:01.730839	2021-11-23 11:19:04.608071
-V175T764Q691X80	extract_clusters	5ebc7e45-bf53-49ff-9c03-54f6a90e40ab	finished			R793D419E969J26		null	2021-11-25 07:50:59.225560	2021-11-25 07:50:59.520588	2021-11-25 07:51:16.761495
-I569V998U789C93	clinker	b4a9f21c-8af8-4279-8f6c-7f0bf50d4888	finished			R793D419E969J26		V175T764Q691X80	2021-11-25 07:50:59.248686	2021-11-25 07:51:17.076802	2021-11-25 07:51:38.516166
-Q360Y097Z849T55	search	010148cb-190b-4dbf-a303-f5948b0b713d	finished	2.1		null	Z062N355K500L14,D541Y194V183C16,W268Q302S135Y49	null	2021-11-27 21:15:42.677693	2021-11-27 21:15:42.943960	2021-11-27 21:19:20.447805
-U363B268B846I63	search	9b1058bc-9f25-47a6-8a8e-6f5c2454c9e6	finished	3.1		null		null	2021-11-27 23:58:37.978441	2021-11-27 23:58:38.254614	2021-11-28 00:04:15.907005
-L025N873B061I88	search	bc6b544d-bf3f-4dd6-971f-d4102e9a467f	finished			null		null	2021-11-29 04:03:47.935997	2021-11-29 04:03:48.205526	2021-11-29 04:03:49.481160
-M885R609D073Z83	search	3848502d-98b4-49d3-bd98-d3ab8631eeca	finished			null		null	2021-11-29 04:04:49.043548	2021-11-29 04:04:49.308228	2021-11-29 04:04:50.619902
-D498M776B967R01	search	3f67b296-4211-43c1-9017-9c97c14c75b1	finished			null		null	2021-11-29 04:05:49.996025	2021-11-29 04:05:50.260490	2021-11-29 04:05:51.569768
-S746X366W474K34	search	b864dfcb-35e8-40ea-a86c-0ee81708fe6c	finished			null		null	2021-11-29 04:06:59.042673	2021-11-29 04:06:59.309159	2021-11-29 04:07:00.658980
-M373A224N434K64	search	e17bdbff-22ff-44d4-9cce-067619b872c5	finished			null		null	2021-11-29 05:16:51.694416	2021-11-29 05:16:51.963983	2021-11-29 05:16:56.701636
-T518G083L066Z97	search	9077c0b3-c8ed-4d06-a25d-3173a9ff464a	finished	Example input (Burnettramic Acids)	matthiasvandenbelt@hotmail.com	null		null	2021-11-29 08:35:46.825180	2021-11-29 08:35:47.101688	2021-11-29 08:42:50.011637
-E567O297R058P37	search	5690ae41-0249-4b28-989b-7882f3ccc26c	finished	4		null		null	2021-11-29 21:39:12.871685	2021-11-29 21:39:13.160548	2021-11-29 21:45:48.119069
-L789F356K128L44	search	9535ed75-ab8f-4c24-91ab-81dbd8e84b22	finished	9.1		null		null	2021-11-30 02:19:45.287537	2021-11-30 02:19:45.557388	2021-11-30 02:24:03.744011
-Z062N355K500L14	extract_clusters	842cea93-b685-4838-ad40-3e752b50dcec	finished			Q360Y097Z849T55		null	2021-11-30 06:12:56.859482	2021-11-30 06:12:57.126071	2021-11-30 06:12:57.708990
-U124D109H611I14	clinker	e866770f-4150-435d-864e-3caa48202331	finished			Q360Y097Z849T55		null	2021-11-30 06:13:46.770613	2021-11-30 06:13:47.030514	2021-11-30 06:13:47.452329
-S403H114I160J04	clinker	91ec1617-7b1e-4280-892e-571b8e508c0a	finished			Q360Y097Z849T55		null	2021-11-30 06:14:09.619067	2021-11-30 06:14:09.888209	2021-11-30 06:14:10.250576
-D541Y194V183C16	extract_clusters	e91a66a4-d84d-4d8e-99b3-55b1f980c2c0	finished			Q360Y097Z849T55		null	2021-11-30 06:16:51.147316	2021-11-30 06:16:51.413116	2021-11-30 06:17:49.399548
-W268Q302S135Y49	clinker	64c65fa2-778c-4ad9-80f2-5b6dae3f77db	finished			Q360Y097Z849T55		D541Y194V183C16	2021-11-30 06:16:51.165138	2021-11-30 06:17:49.714987	2021-11-30 06:20:20.148213
-C076R594I102R04	search	21c29e50-a9ff-4830-bc24-10565d88ef4d	finished	FMNBBEMT		null		null	2021-11-30 17:45:38.524077	2021-11-30 17:45:38.803321	2021-11-30 17:47:56.693371
-Z890P933R203F08	search	cf704f3e-582e-474f-b239-cb27a8c3387f	finished			null		null	2021-11-30 17:52:01.583752	2021-11-30 17:52:01.862847	2021-11-30 17:52:02.680660
-O095G902C136Q37	search	a8a3ff1e-89db-41d6-b5d3-7d8b2925aa9e	finished			null	V891G961H931M14,G245K224N823K73	null	2021-11-30 17:53:53.107692	2021-11-30 17:53:53.372858	2021-11-30 17:55:32.317391
-V891G961H931M14	extract_clusters	b7686538-7e78-40b2-a901-4ecab28c8505	finished			O095G902C136Q37		null	2021-11-30 17:56:02.762998	2021-11-30 17:56:03.016874	2021-11-30 17:56:12.516394
-G245K224N823K73	clinker	002fad99-a536-4a3d-b64f-da521623ad30	finished			O095G902C136Q37		V891G961H931M14	2021-11-30 17:56:02.785085	2021-11-30 17:56:12.812404	2021-11-30 17:56:13.459213
-S324T582M354I48	search	3a5e610e-045b-44a2-bed7-6f368a18c2a9	finished	137.1		null		null	2021-11-30 21:15:45.925036	2021-11-30 21:15:46.205698	2021-11-30 21:18:21.829346
-P898I881Z680T01	search	a9abb24c-d08c-4a1e-920a-ddc9fb97fc05	finished	9.1.2		null		null	2021-11-30 22:46:57.133863	2021-11-30 22:46:57.395573	2021-11-30 22:49:13.955773
-L418B255T721H12	search	48ffbdc8-6026-4518-bb00-a7ddef7ec7e8	finished	9.1.3		null		null	2021-11-30 22:57:53.436133	2021-11-30 22:57:53.704631	2021-11-30 23:00:43.313566
-D805N130X606H56	search	b638b695-5105-4bbd-84dd-d281e33bbd4c	finished	2.1.2		null		null	2021-12-01 00:36:16.223259	2021-12-01 00:36:16.488923	2021-12-01 00:40:48.947920
-L764G410C227L76	search	1d589697-1e5e-42ca-9300-59de56d78235	finished			null		null	2021-12-01 05:52:38.976357	2021-12-01 05:52:39.248971	2021-12-01 05:52:40.098313
-R283Y695B614J20	search	08c805a1-2322-4861-8ef5-7c23cde564f5	finished	1.3.1		null	C795Z616K115L06,H009I938V118B55	null	2021-12-01 21:15:34.968378	2021-12-01 21:15:35.344964	2021-12-01 21:22:45.257602
-C795Z616K115L06	extract_clusters	18e83848-d47a-425b-8664-6c63ce40eb23	finished			R283Y695B614J20		null	2021-12-01 21:37:47.084097	2021-12-01 21:37:47.341450	2021-12-01 21:38:01.503099
-H009I938V118B55	clinker	37208d36-79d7-45cf-9edd-7d6327c67217	finished			R283Y695B614J20		C795Z616K115L06	2021-12-01 21:37:47.107941	2021-12-01 21:38:01.797074	2021-12-01 21:38:29.875198
-J360P982W380F32	search	5b6b394c-faa5-4ef5-9eee-60eb15700822	finished	1.1		null		null	2021-12-02 02:25:48.694270	2021-12-02 02:25:48.958924	2021-12-02 02:29:17.631406
-S369K687B736I43	search	4d097069-336e-4b91-b3ae-2daccb034e01	finished			null		null	2021-12-02 06:25:01.028959	2021-12-02 06:25:01.301570	2021-12-02 06:25:02.098630
-Y081T406O227C70	search	77d86804-3314-4ef5-b4ae-64acfdddc825	finished			null		null	2021-12-04 19:04:37.825846	2021-12-04 19:04:38.099060	2021-12-04 19:11:02.210375
-F129M252R045D44	search	37e3368c-abe8-4a9f-aede-c02f7c89e80a	finished			null	J308D478H335M18	null	2021-12-04 19:12:28.207667	2021-12-04 19:12:28.479998	2021-12-04 19:12:29.855144
-C883Q285Q250V86	search	cc199e6e-e1d5-46d8-b097-9f3a1f0e366e	finished	53.1		null		null	2021-12-04 21:57:52.815881	2021-12-04 21:57:53.088543	2021-12-04 22:04:39.360496
-O074U721G657E42	search	6123a91e-c0f8-4fb9-8251-55c95ee34691	finished			null		null	2021-12-04 22:46:54.183689	2021-12-04 22:46:54.464061	2021-12-04 22:54:11.809822
-A370W452M893I52	search	016875ca-e1bd-4950-81df-d5ac9ab53574	finished	NODE1		null		null	2021-12-04 22:52:30.537387	2021-12-04 22:52:30.798951	2021-12-04 23:01:42.638790
-S329D023E173I01	search	d0251e77-6bb6-4c2f-b85e-73c3085ca052	finished	Example input (Burnettramic Acids)		null		null	2021-12-05 12:02:49.138197	2021-12-05 12:02:49.407193	2021-12-05 12:09:56.033092
-D570L610A395A15	search	5ca521e8-296f-40fa-8519-2a69f4bae5c8	finished	Example input (Burnettramic Acids)		null		null	2021-12-05 12:14:18.701989	2021-12-05 12:14:18.967681	2021-12-05 12:20:52.637592
-D644S208R040P47	search	eab06afe-d204-488d-b700-1d31487b70e3	finished			null		null	2021-12-06 08:34:22.909829	2021-12-06 08:34:23.195446	2021-12-06 08:38:55.269647
-T518T898E286W04	search	b23cbe9b-afc2-427f-bd0d-9295654bbb11	finished			null		null	2021-12-06 08:40:55.076237	2021-12-06 08:40:55.353389	2021-12-06 08:40:56.249220
-M344Q682F941S33	search	43b4d2ee-02ca-43aa-97f1-0ed0c7a2f9ac	finished			null		null	2021-12-06 21:03:15.103320	2021-12-06 21:03:15.373187	2021-12-06 21:08:11.978646
-D347W960F410B32	search	fe44e316-072e-4959-b8b3-e222dffbeffa	finished	61.1		null		null	2021-12-06 22:01:26.920939	2021-12-06 22:01:27.192516	2021-12-06 22:12:22.037554
-W082S365U731J57	search	a13348cb-f022-4e68-883f-1d0769111c18	finished			null		null	2021-12-06 22:16:03.252309	2021-12-06 22:16:03.524743	2021-12-06 22:16:04.362369
-R287F442V269F08	search	5dc75b7d-ffdb-4271-b74c-101281690453	finished	1.3.2		null		null	2021-12-06 22:20:53.392342	2021-12-06 22:20:53.670059	2021-12-06 22:31:55.945571
-H486V066M415X98	search	23651fbd-ed6a-4934-be3c-66971216e7b3	finished			null		null	2021-12-06 22:57:04.185316	2021-12-06 22:57:04.452142	2021-12-06 22:57:05.438871
-A451D056C811X09	search	dfc4c452-74dd-44d4-a3a3-b3e697bad787	finished	1.3-1		null		null	2021-12-06 23:45:08.364348	2021-12-06 23:45:08.642659	2021-12-06 23:49:03.817506
-J953S722G556O55	search	412ccbac-b2e9-47ba-97ba-ae6938ddc449	finished	1.3-2		null		null	2021-12-06 23:46:15.346638	2021-12-06 23:46:15.615413	2021-12-06 23:52:33.216945
-Z905M611L992A12	search	d262ca87-abda-4d67-bf9e-9ddc0c75ce49	finished	1.3-3		null		null	2021-12-06 23:46:58.142119	2021-12-06 23:46:58.404261	2021-12-06 23:52:24.988955
-P724Z997H804C78	search	6ddef6b6-022b-4603-af23-4178109a3c96	finished	1.3-4		null		null	2021-12-06 23:48:06.788438	2021-12-06 23:48:07.055337	2021-12-06 23:54:18.653150
-K574D704B046K85	search	ff9d9932-f2cf-4ac4-8c09-e0c1c5732d28	finished	1.3-5		null		null	2021-12-06 23:48:45.764386	2021-12-06 23:48:46.030338	2021-12-06 23:53:56.682266
-D273L035G052N93	search	43dc9b25-e33d-431b-9a4d-0b14f1fd8e91	finished			null		null	2021-12-06 23:49:43.294508	2021-12-06 23:49:43.559246	2021-12-06 23:49:44.430878
-M993Y979L866W80	search	9b359cc8-72f1-44fc-afd0-68ad5d2c1b40	finished	NODE53		null		null	2021-12-07 06:09:21.289852	2021-12-07 06:09:21.566790	2021-12-07 06:12:44.324489
-Y442W277S924Y65	search	4bb8d274-c297-46bf-a908-f859445ebca8	finished	NODE53		null		null	2021-12-07 06:17:14.195026	2021-12-07 06:17:14.458666	2021-12-07 06:20:06.044262
-J308D478H335M18	extract_clusters	18b0934d-a36f-4c3b-a54f-eacd7ae2469d	finished			F129M252R045D44		null	2021-12-07 07:19:43.869021	2021-12-07 07:19:44.142291	2021-12-07 07:19:47.123684
-E731D906B049U36	search	6727a6d3-f1b2-40be-82a3-96d401d59790	finished	NODE53		null		null	2021-12-07 07:34:16.631022	2021-12-07 07:34:16.899358	2021-12-07 07:44:30.666776
-Z282S658J716A58	search	9d07b370-6599-455a-bdc7-61ffa3f4f38c	finished			null		null	2021-12-07 07:42:26.978652	2021-12-07 07:42:27.241604	2021-12-07 07:51:10.312480
-A018D846Z538R41	search	4c50693a-bcc2-45da-8c10-a9aa054ba7dc	finished			null		null	2021-12-07 07:54:00.648485	2021-12-07 07:54:00.922478	2021-12-07 08:02:00.583949
-F534B685M910O16	search	e28f120b-05ab-480f-aa35-0c10ffe1410f	finished	NODE53		null		null	2021-12-07 08:24:20.238632	2021-12-07 08:24:20.507196	2021-12-07 08:27:37.807105
-Q679R395A470F98	search	f65cfe27-c76e-4b8e-a14c-21c1e9efd954	finished			null		null	2021-12-07 09:25:02.633038	2021-12-07 09:25:02.918503	2021-12-07 09:28:19.310436
-M597Z658Y980N76	search	2db35e17-cde3-4da2-94da-2f36753e2143	finished			null		null	2021-12-07 09:25:40.730851	2021-12-07 09:25:41.002212	2021-12-07 09:28:23.440451
-X831H703S352J74	search	c3a8c144-d630-487a-9eb5-b46cec00c3d9	finished			null		null	2021-12-07 09:32:56.333501	2021-12-07 09:32:56.601719	2021-12-07 09:38:27.683916
-A260T503D764N97	search	7efb8c67-6603-4b36-9222-0f141e717796	finished			null		null	2021-12-07 10:01:29.089339	2021-12-07 10:01:29.356105	2021-12-07 10:11:42.377161
-P892P281T125Y26	search	0deadf98-bf03-4e22-af04-aade550a1ef5	finished			null		null	2021-12-07 20:22:48.471061	2021-12-07 20:22:48.823949	2021-12-07 20:29:27.124316
-W463V187C709J37	search	d005342e-7c7c-4369-bee9-d3ac0afd1568	finished	1.3-6		null		null	2021-12-07 21:13:48.488870	2021-12-07 21:13:48.754723	2021-12-07 21:17:15.092064
-R918H828A638M03	search	1eaaa8c8-c91b-4d4e-9f3a-8190fcf0d910	finished	1.3-21		null		null	2021-12-07 21:14:40.343666	2021-12-07 21:14:40.602004	2021-12-07 21:20:41.276005
-F474Z959T519G80	search	cdbdc92b-0dfc-42a5-b87f-caefcbcff656	finished			null		null	2021-12-08 02:40:36.750104	2021-12-08 02:40:37.013073	2021-12-08 02:46:58.915419
-U267W867G174R97	search	0fab660e-c6fa-4244-a81d-bb5a55dece59	finished			null		null	2021-12-08 02:49:31.965511	2021-12-08 02:49:32.238273	2021-12-08 02:49:32.908930
-I485F221Z133Q01	search	0bae1ae9-f486-4ba7-8e8e-d2e793e9b325	finished	4.1		null		null	2021-12-08 04:42:41.284144	2021-12-08 04:42:41.552304	2021-12-08 04:46:29.759675
-T286I021F511S69	search	8b5687e9-0d0f-4c78-a44b-881044473841	finished	node53		null		null	2021-12-08 06:26:03.313325	2021-12-08 06:26:03.584162	2021-12-08 06:32:44.051516
-F472R459V047T00	search	37ff3075-8fde-4eb1-a7bf-0709f8e70c8f	finished			null		null	2021-12-08 08:25:28.038273	2021-12-08 08:25:28.299781	2021-12-08 08:31:31.807462
-P104X643R906Y63	search	132fcdec-a3f0-4c13-8c81-013e8fff3002	finished			null		null	2021-12-08 08:57:19.461378	2021-12-08 08:57:19.799346	2021-12-08 09:01:31.318885
-F563S591O308F71	search	e3933f17-aac0-4286-a4e5-35700f49b992	finished			null		null	2021-12-08 09:05:57.876601	2021-12-08 09:05:58.146441	2021-12-08 09:11:38.321182
-E179A362K144F62	search	bcdb0560-8066-4c6e-8089-299b78109ef2	finished			null		null	2021-12-08 09:17:35.761824	2021-12-08 09:17:36.028768	2021-12-08 09:20:02.640852
-A180I285Y291B45	search	ead65675-d841-4cf0-a111-eff72e68af05	finished			null		null	2021-12-08 09:21:38.516979	2021-12-08 09:21:38.797537	2021-12-08 10:01:56.442293
-O604P969R095Q01	search	04ec7f17-9f36-4ec4-98ed-d0f3d25208dd	finished			null		null	2021-12-08 19:14:06.115518	2021-12-08 19:14:06.417280	2021-12-08 19:20:50.192929
-V996O232F135H57	search	a5587065-7122-42ca-9f40-f298188ce38d	finished			null		null	2021-12-08 19:26:27.411682	2021-12-08 19:26:27.696339	2021-12-08 19:33:23.130731
-O317D286X598G08	search	9b72c5f1-84dd-4547-80ea-7cc6bde68be6	finished			null		null	2021-12-09 08:56:44.829975	2021-12-09 08:56:45.113379	2021-12-09 09:02:18.348172
-T317Z623Y367K67	search	40db08b6-8055-4703-a0da-69c1485055cc	finished			null		null	2021-12-09 22:26:46.378037	2021-12-09 22:26:46.658633	2021-12-09 22:26:48.049870
-J657A191Q853O58	search	86d0b3ae-726d-4ee0-ad67-b8f924594b1a	finished			null		null	2021-12-10 03:31:02.331920	2021-12-10 03:31:02.598550	2021-12-10 03:31:03.820813
-J465R270U661S07	search	323c35d6-9dee-4c76-9b5c-6ba73a9d613e	finished	Example input (Burnettramic Acids)		null		null	2021-12-14 08:33:38.005249	2021-12-14 08:33:38.394016	2021-12-14 08:40:46.456868
-D717N754Y665G52	search	366b737d-1237-478b-9fa6-71343cac6361	finished	hungry		null		null	2021-12-17 02:40:44.542496	2021-12-17 02:40:46.504711	2021-12-17 02:46:37.668737
-Z796E485L912Y24	search	165bb272-7f13-4d59-86f8-6fa77abb0ffc	finished	PF1018		null		null	2021-12-20 23:45:37.015090	2021-12-20 23:45:37.747258	2021-12-20 23:47:31.949434
-V181O743W719I77	search	8a817415-c3b2-4dfe-a9bc-e435fc04e601	finished	PF1018		null		null	2021-12-20 23:50:04.103175	2021-12-20 23:50:04.641739	2021-12-20 23:53:57.191683
-P152R383P788U85	search	466e7b99-daa2-42db-9ef3-6820b310eb16	finished	NRPKS	zyl2021ucla@gmail.com	null		null	2021-12-30 05:01:56.321645	2021-12-30 05:01:56.853482	2021-12-30 05:04:58.463474
-R498R894R595A38	search	dfd69d11-8010-4b83-8396-e1ab32cc1cc3	finished			null		null	2021-12-31 03:42:05.364755	2021-12-31 03:42:05.641128	2021-12-31 03:44:44.163193
-E833Z871A937B72	search	86fda350-2608-4191-8600-dc354db75489	finished			null		null	2021-12-31 03:46:44.190396	2021-12-31 03:46:44.764955	2021-12-31 03:46:54.840669
-K277A084Z694Z07	search	351c6309-333b-4361-be37-1568dd75786f	finished	Example input (Burnettramic Acids)		null		null	2022-01-03 22:43:21.646022	2022-01-03 22:43:21.961760	2022-01-03 22:49:58.852172
-A092B797I453E65	search	fd52bce2-a6be-4788-b960-d88a81ae4189	finished	Example input (Burnettramic Acids)		null		null	2022-01-04 14:37:21.314757	2022-01-04 14:37:21.616764	2022-01-04 14:43:24.334492
-J473S718B929L47	search	274594b4-e7c1-4181-9ba0-9d7f3a1b7312	finished	Example input (Burnettramic Acids)		null		null	2022-01-04 14:38:06.919108	2022-01-04 14:38:07.222221	2022-01-04 14:43:48.298414
-E951O106B045X63	search	75ea1402-32e8-43c7-b278-1526b82b75c9	finished	Example input (Burnettramic Acids)		null		null	2022-01-04 14:39:28.034055	2022-01-04 14:39:28.385727	2022-01-04 14:47:02.091136
-Y304H517E598U39	search	99d021a7-b27f-4f3d-9497-069a71622548	finished			null		null	2022-01-05 03:51:49.548234	2022-01-05 03:51:49.865406	2022-01-05 03:54:36.302470
-X622C943Y701E34	search	a5c2ebc6-a743-40b0-a3cd-0fe11fac839a	finished	Example input (Burnettramic Acids)		null		null	2022-01-05 05:27:01.794289	2022-01-05 05:27:02.126998	2022-01-05 05:33:32.841831
-W422L412G444O57	search	41704b22-8844-4f3f-827e-93a9bbdad70c	finished	PNP450	zyl2021ucla@gmail.com	null		null	2022-01-05 05:27:21.442222	2022-01-05 05:27:21.774980	2022-01-05 05:29:31.093832
-Q060J218U435O72	clinker	ae39b367-ef58-4c35-a0f6-d03e9615da78	finished		matthiasvandenbelt@hotmail.com	null		null	2022-01-05 12:18:35.171119	2022-01-05 12:18:35.500616	2022-01-05 12:18:47.804183
-K720C542L859A47	search	e5267eed-ea8e-451b-88c9-777656b3dd98	finished	Example input (Burnettramic Acids)		null		null	2022-01-05 12:20:51.450026	2022-01-05 12:20:51.754073	2022-01-05 12:29:43.161950
-P663L778T610B73	search	ebdad9e2-69e5-4f47-93b4-97398467aec3	finished			null		null	2022-01-06 00:34:45.815594	2022-01-06 00:34:46.135187	2022-01-06 00:35:21.252673
-W210M859O684X61	search	c7087063-6b98-405f-9048-9a09b3a3578e	finished	Example input (Burnettramic Acids)		null		null	2022-01-06 00:35:00.513817	2022-01-06 00:35:00.834530	2022-01-06 00:43:52.832510
-S344J898T652V60	search	a56d8ffc-a07f-467f-95ff-480b820e9434	finished			null		null	2022-01-06 00:42:16.398654	2022-01-06 00:42:16.897662	2022-01-06 00:54:51.581480
-D950K970Y327H34	search	cf41c82c-5d33-4864-9628-6ea2d1c51e1a	finished			null		null	2022-01-06 12:47:08.214832	2022-01-06 12:47:08.532975	2022-01-06 12:53:23.972159
-C176L063L024D03	search	b36615ff-1b25-43ab-bffc-8b99fbe69201	finished	61.1		null		null	2022-01-06 23:57:08.095208	2022-01-06 23:57:08.398915	2022-01-07 00:02:01.527491
-N162O235P327Z57	search	c2f0822a-d838-4692-ad09-4ea131964dd8	finished	8		null		null	2022-01-07 00:05:41.838179	2022-01-07 00:05:42.162017	2022-01-07 00:10:35.901192
-U656M159Z600A33	search	274bb5ee-dfc4-4322-91dd-d6727aab2876	finished			null		null	2022-01-07 01:33:08.604662	2022-01-07 01:33:09.021659	2022-01-07 01:33:09.772300
-X767U838P335S15	search	79fed8eb-a3b0-4c04-8061-228e0bb2c51a	finished			null		null	2022-01-07 03:06:27.717579	2022-01-07 03:06:28.186422	2022-01-07 03:08:37.451734
-N396Z194F397I05	search	88934200-3b2c-4ec1-b549-a12ca3de5d0d	finished			null		null	2022-01-08 01:39:36.885860	2022-01-08 01:39:37.210586	2022-01-08 01:45:22.507882
-F762S617N478U38	search	4930b75d-f4b8-4da4-9ec9-38581e3c3b4c	finished			null		null	2022-01-08 04:18:11.141683	2022-01-08 04:18:11.454134	2022-01-08 04:22:17.039891
-T926T935J467N29	search	3ea71671-d372-4d04-90e2-7da1c31a3ef3	finished	Example input (Burnettramic Acids)	matthiasvandenbelt@hotmail.com	null		null	2022-01-08 10:38:49.055911	2022-01-08 10:38:49.374545	2022-01-08 10:48:41.084678
-T744R327I276G99	gne	f0d43e50-8150-40dd-9620-3749fdf74d59	finished			C360K487O778X13		null	2022-01-08 10:40:54.139770	2022-01-08 10:40:54.469017	2022-01-08 10:40:55.780606
-M388T294T076S38	extract_sequences	1e579c8f-6fe6-4f9c-9bd6-626d8fbab5e0	finished			C360K487O778X13		null	2022-01-08 10:42:52.550683	2022-01-08 10:42:52.858120	2022-01-08 10:42:53.668396
-R589C601I762A45	extract_sequences	2781b045-1d6b-498d-b4b6-e6972b4c3553	finished			C360K487O778X13		null	2022-01-08 10:43:06.267553	2022-01-08 10:43:06.574647	2022-01-08 10:46:37.302337
-M324O086N863N67	extract_clusters	3dda5aa2-3d6e-4246-9186-b0eec3dec7f4	finished		matthiasvandenbelt@hotmail.com	C360K487O778X13		null	2022-01-08 10:44:40.758615	2022-01-08 10:44:41.172507	2022-01-08 10:44:51.664645
-U756M573B627G75	clinker_query	8384f83d-6546-4737-8f03-d07942c3e01c	finished		matthiasvandenbelt@hotmail.com	C360K487O778X13		null	2022-01-08 10:48:41.314417	2022-01-08 10:48:41.610324	2022-01-08 10:48:42.419178
-T144R744N821V66	extract_clusters	cc85fde3-4121-4691-8d98-c31d67618a0b	finished			C360K487O778X13		null	2022-01-08 10:51:19.264639	2022-01-08 10:51:19.568692	2022-01-08 10:52:38.924854
-N973B490A476P15	search	ad631a9c-af1f-437a-927e-63e8e2d461b0	finished			null	Z404M081Q774O22,U123P238J790I05	null	2022-01-08 10:54:02.185541	2022-01-08 10:54:02.499822	2022-01-08 10:54:04.014603
-Z404M081Q774O22	extract_clusters	037893c3-e6d0-4607-9b60-39a6fd668615	finished			N973B490A476P15		null	2022-01-08 10:54:11.572061	2022-01-08 10:54:11.877781	2022-01-08 10:54:21.430282
-U123P238J790I05	clinker	baa96cc7-58da-45dc-8769-921f81ff099d	finished		matthiasvandenbelt@hotmail.com	N973B490A476P15		Z404M081Q774O22	2022-01-08 10:54:11.594824	2022-01-08 10:54:21.771557	2022-01-08 10:54:36.394505
-A613V914J239P06	extract_sequences	a0723953-55af-468f-9544-c8126e9e6ab7	finished			C360K487O778X13		null	2022-01-08 11:41:02.572901	2022-01-08 11:41:02.886235	2022-01-08 11:57:19.102169
-W783I211L017G80	search	0adc835a-c63b-4fc8-9000-c94b070e2bf0	finished			null		null	2022-01-09 02:21:57.068786	2022-01-09 02:21:57.423675	2022-01-09 02:32:52.480648
-H805M555W719J19	search	214d7751-7c35-49bb-9e0b-0554c3ea986b	finished			null		null	2022-01-09 04:15:21.767361	2022-01-09 04:15:22.240924	2022-01-09 04:19:52.737982
-R219L976C014M51	search	d175b54e-bc40-41b6-b33b-7656f82922fb	finished			null		null	2022-01-09 04:54:53.924448	2022-01-09 04:54:54.349835	2022-01-09 05:20:16.181224
-D218H964A095U99	clinker	a52291b1-788c-4a65-8cf4-170bd83ae33a	finished			null		null	2022-01-10 06:39:20.554304	2022-01-10 06:39:20.878009	2022-01-10 06:39:21.491508
-V292X066O634D88	clinker	cd01d289-71fb-4742-b42e-96f47dc00f27	finished			null		null	2022-01-10 06:44:27.059703	2022-01-10 06:44:27.365146	2022-01-10 06:44:34.630454
-F382P895U009N08	search	a678d759-5885-4fdf-94f2-84bb319cb1a1	finished			null		null	2022-01-10 07:20:04.021624	2022-01-10 07:20:04.340511	2022-01-10 07:28:17.551956
-X038Y191T335N77	search	4a1de555-e329-4814-b17e-f85cf48f503c	finished			null		null	2022-01-10 07:43:11.654372	2022-01-10 07:43:11.968879	2022-01-10 07:43:13.807788
-K421V498C810Q50	search	fc341539-4776-4b73-9cd0-adf6fb0d91a4	finished			null		null	2022-01-10 07:44:46.105607	2022-01-10 07:44:46.411566	2022-01-10 07:44:48.026321
-W539C242Y412K48	clinker	1c74c82d-3d0c-4abf-87c8-7a9cd132161b	finished			null		null	2022-01-10 08:13:55.481750	2022-01-10 08:13:55.787947	2022-01-10 08:13:56.716632
-M074A221U816E83	clinker	48d5b827-796c-45da-a34d-d6004211383c	finished			null		null	2022-01-10 08:29:38.059940	2022-01-10 08:29:38.373009	2022-01-10 08:29:45.619221
-T898F272X550I41	search	8dfdab15-625d-4b3e-8216-20f355ebf369	finished			null		null	2022-01-10 09:37:41.468930	2022-01-10 09:37:41.775854	2022-01-10 09:46:11.138850
-C465R079D477H81	clinker	c8c3f254-f949-44a8-a5b5-d44b626ae087	finished			null		null	2022-01-11 04:22:35.510603	2022-01-11 04:22:35.834708	2022-01-11 04:22:43.112342
-B480N391X636H44	search	8c6afa19-6e8a-4c67-8565-8dfeca35cdf6	finished			null		null	2022-01-11 05:15:45.302580	2022-01-11 05:15:45.616723	2022-01-11 05:18:28.700780
-E850C138T131O61	search	24fc96ae-0dee-4cf9-9dfd-9cc6b79bb69f	finished			null		null	2022-01-11 12:40:22.446164	2022-01-11 12:40:22.752194	2022-01-11 12:44:15.086511
-A127Y868F145W58	extract_clusters	5826032f-cefd-4328-b129-0695176a449f	finished			Y736N982T834D20		null	2022-01-11 14:24:43.280868	2022-01-11 14:24:43.597710	2022-01-11 14:26:14.566381
-M032P173P542W08	search	38bd073c-1aa9-4173-85f7-309824cbf4c4	finished		gph422001@g.ucla.edu	null		null	2022-01-11 14:45:38.891892	2022-01-11 14:45:39.203675	2022-01-11 15:54:20.632797
-P433O295Z709V27	search	64f9c154-d9c5-4b09-aaeb-e982e9824f75	finished			null		null	2022-01-11 22:39:56.597496	2022-01-11 22:39:56.914853	2022-01-11 22:42:33.127742
-G710S558W675W55	search	81bfddb4-c4e8-45c5-87c6-07ce01ec14d9	finished			null	B519M149M861C74	null	2022-01-11 23:03:45.352281	2022-01-11 23:03:45.662537	2022-01-11 23:08:52.976985
-B519M149M861C74	extract_clusters	9fed1aed-805a-4e7c-bbe7-b978c58803ff	finished			G710S558W675W55		null	2022-01-12 20:20:23.855911	2022-01-12 20:20:25.409052	2022-01-12 20:20:37.851519
-T846Q654G802C20	search	b569e8cc-36ff-4ecf-b3aa-474042e09281	finished	Example input (Burnettramic Acids)		null		null	2022-01-12 21:38:28.345434	2022-01-12 21:38:28.654334	2022-01-12 21:47:13.045483
-X271M408E887L07	extract_clusters	15b7c83c-af27-4490-a8ce-ffb6d5a2dd21	finished			Y736N982T834D20		null	2022-01-13 09:07:37.114233	2022-01-13 09:07:37.592467	2022-01-13 09:07:52.584300
-J267P825E844O38	clinker	aecc2109-1d23-4c45-b795-44bc10552aa5	finished			Y736N982T834D20		null	2022-01-13 09:08:55.766739	2022-01-13 09:08:56.062938	2022-01-13 09:09:14.639259
-F279O675H642U50	search	da6cc705-2f04-412d-8024-57272f6ad8ed	finished			null		null	2022-01-14 00:12:09.855983	2022-01-14 00:12:10.606627	2022-01-14 00:13:39.345417
-D646D002X529B35	search	9434e8c9-990f-426a-830b-d1fde59abc2d	finished	polyketide synthase 2		null		null	2022-01-14 00:17:11.037148	2022-01-14 00:17:11.787819	2022-01-14 00:18:53.788391
-Y623U357N041X40	search	ed881fb5-13a3-466f-a1d7-634fedc58a00	finished			null		null	2022-01-14 02:20:07.431530	2022-01-14 02:20:08.031085	2022-01-14 02:22:22.722360
-Q103T054R413B80	search	d254de08-39bc-46c8-a566-d5cd5db6bce3	finished	BGC0000433 Surfactin B. velezensis FZB42		null	Z182H187B777L19	null	2022-01-14 10:34:01.613570	2022-01-14 10:34:01.961870	2022-01-14 10:59:40.350234
-Z182H187B777L19	extract_sequences	063ce3c0-9bc9-4205-a36f-7e1e90358fbb	finished			Q103T054R413B80		null	2022-01-14 11:04:38.187831	2022-01-14 11:04:38.680024	2022-01-14 11:04:43.012600
-Y973L888R215L38	search	dbe6cd76-4198-4ddc-9f3a-f1cf84c6cc5b	finished			null		null	2022-01-14 11:08:01.339713	2022-01-14 11:08:01.905337	2022-01-14 11:08:18.488229
-N024Q927J344R28	search	da2ad5da-e925-4be7-9bbe-618fe3eb4d87	finished			null		null	2022-01-14 11:15:57.513363	2022-01-14 11:15:57.873746	2022-01-14 11:16:08.053683
-A687Z574O670Q88	search	a0076d86-3780-4fb3-897e-f3bc3579e649	finished			null		null	2022-01-14 11:30:17.063266	2022-01-14 11:30:17.498857	2022-01-14 11:30:28.739416
-K989O936P695E37	search	fe09ab1b-3355-4c7a-a6bd-f9825b3671ed	finished			null		null	2022-01-14 19:13:53.450958	2022-01-14 19:13:53.898556	2022-01-14 19:18:02.178010
-C640G524O395J82	search	d5d2cb17-00ec-47d9-a08c-1bba24d7baad	finished			null		null	2022-01-14 19:20:20.662878	2022-01-14 19:20:21.079007	2022-01-14 19:20:23.225984
-Y230H393P602E31	search	bb8298fa-1efa-4a05-afb2-1fa70d419cc4	finished			null		null	2022-01-14 19:39:14.294826	2022-01-14 19:39:14.876771	2022-01-14 20:11:28.787883
-K958X607V845X55	search	4989cba3-829e-48c4-994a-636477e1a30d	finished			null		null	2022-01-14 20:10:36.681049	2022-01-14 20:10:37.253811	2022-01-14 20:49:11.227147
-F591F772U666G83	search	0ec83f81-b842-4a79-9eea-b91425faefec	finished			null		null	2022-01-14 20:22:30.409606	2022-01-14 20:22:30.887270	2022-01-14 21:09:10.409183
-A102V190X063J70	search	6a58aebd-6b81-43d7-a0a0-c7d68010527a	finished	Example input (Burnettramic Acids)		null		null	2022-01-15 13:31:59.965105	2022-01-15 13:32:00.253537	2022-01-15 13:33:30.422680
-L983V061O383U20	search	753b1133-95df-4ea5-853d-627023c7d5e6	finished			null		null	2022-01-15 13:33:15.188580	2022-01-15 13:33:15.464053	2022-01-15 14:13:08.828247
-A608R795Y592Z23	search	a836d428-f1b7-4f72-9c28-dcfb651e1315	finished	Example input (Burnettramic Acids)		null	N284Y776X081E21	null	2022-01-16 16:06:13.270293	2022-01-16 16:06:13.555195	2022-01-16 16:13:31.147449
-Z185Z233M174W69	search	a3116424-a50a-4e23-a72d-f2e4320ffc76	finished	salinamide BGC0001766		null		null	2022-01-16 16:13:57.757671	2022-01-16 16:13:58.039917	2022-01-16 16:25:04.218529
-N284Y776X081E21	clinker_query	c4e03f3c-f2c1-4a31-8c01-82980bc2751b	finished			A608R795Y592Z23		null	2022-01-16 16:18:00.945955	2022-01-16 16:18:01.216501	2022-01-16 16:18:01.991982"""
-
-    main()
+    # optionally, pass the number of days to include
+    calculate_average_job_times(
+        since=datetime.datetime.utcnow() - datetime.timedelta(days=int(argv[1]))
+        if len(argv) > 1 else None)
@@ -13,21 +13,26 @@ from rq.registry import StartedJobRegistry, FinishedJobRegistry, \
     FailedJobRegistry, DeferredJobRegistry, ScheduledJobRegistry
 import os
 
+from cagecat.const import job_queues
+
 ### main code
 database_path = "cagecat/status.db"
 registries = [StartedJobRegistry, FinishedJobRegistry, FailedJobRegistry, DeferredJobRegistry, ScheduledJobRegistry]
 
 print("\n" + "========== WARNING ==========")
-print("Continuing will empty the current queue, delete the database, and reset all registries.")
+print("Continuing will empty the current queues, delete the database, and reset all registries.")
 result = None
 
 while result not in ("y", "n", "yes", "no"):
     result = input("Continue? (y/n)")
     if result in ("y", "yes"):
-        # empty queue
-        q = Queue(connection=Redis())
-        q.empty()
-        print("The rq Queue has been emptied")
+        # empty queues. "default" was used before jobs were routed to
+        # separate queues
+        queues = [Queue(name, connection=Redis())
+                  for name in list(job_queues) + ["default"]]
+        for q in queues:
+            q.empty()
+        print("The rq Queues have been emptied")
 
         # remove database
         if not os.path.exists(database_path):
@@ -37,11 +42,12 @@ while result not in ("y", "n", "yes", "no"):
             print("Database removed succesfully")
 
         # clean registries
-        for registry in registries:
-            reg = registry(queue=q)
-            for job_id in reg.get_job_ids():
-                print(f"Deleted job {job_id} from the {reg}")
-                reg.remove(job_id, delete_job=True)
+        for q in queues:
+            for registry in registries:
+                reg = registry(queue=q)
+                for job_id in reg.get_job_ids():
+                    print(f"Deleted job {job_id} from the {reg}")
+                    reg.remove(job_id, delete_job=True)
 
     elif result in ("n", "no"):
         print("Nothing has been emptied or removed. Exiting..")
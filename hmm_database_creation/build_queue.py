@@ -0,0 +1,43 @@
+"""Queue of genera of which the HMM database should be built
+
+download_files.py adds a genus as soon as all its genomes have been
+downloaded. create_databases.py blocks on this queue, so a build starts
+immediately instead of after the next poll of a directory.
+
+Author: Matthias van den Belt
+"""
+from redis import Redis
+
+# added when all genera have been downloaded
+stop_signal = 'stop_creating_databases'
+
+
+def get_build_queue_key(organism: str) -> str:
+    """Returns the Redis key of the build queue of an organism
+
+    Input:
+        - organism: organism of the databases (prokaryota or fungi)
+
+    Output:
+        - Redis key of the list of genera to build
+    """
+    return f'cagecat:hmm_db:{organism}:build_queue'
+
+
+def enqueue_build(organism: str, genus: str, redis_conn: Redis = None) -> None:
+    """Requests the database of a genus to be built
+
+    Input:
+        - organism: organism of the database (prokaryota or fungi)
+        - genus: genus to build the database of. stop_signal indicates all
+            genera have been added
+        - redis_conn: connection to Redis. A new connection is made if not
+            given
+
+    Output:
+        - None, genus added to the build queue
+    """
+    if redis_conn is None:
+        redis_conn = Redis()
+
+    redis_conn.rpush(get_build_queue_key(organism), genus)
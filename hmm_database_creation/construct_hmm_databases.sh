@@ -11,10 +11,8 @@ fi
 
 if [ "$1" == 'prokaryota' ]; then
   echo "Using RefSeqs"
-  ftp_labels="FtpPath_RefSeq"
 elif [ "$1" == 'fungi' ]; then
     echo "Using GenBanks + Refseqs"
-    ftp_labels="FtpPath_GenBank FtpPath_RefSeq"
 else
   echo "Invalid organism provided"
 
@@ -23,44 +21,22 @@ fi
 
 echo "Constructing HMM databases for organism: $1"
 
-fn_non_unique="non_unique_genera.txt"
-fn_unique="unique_genera.txt"
+fn_selected="selected_genera.txt"
 
 echo "If you try to rerun this script, make sure to remove any unmoved files.."
 echo ".. from the default RefSeq GBKS storage folder to prevent missing a file"
 
 echo "Removing too_few_species.txt"
-rm too_few_species.txt
+rm -f too_few_species.txt
 
-echo " Fetching all genera from NCBI"
-esearch -db assembly -query '((('"$1"'[orgn] AND ("representative genome"[refseq category] OR "reference genome"[refseq category])) AND (latest[filter] AND all[filter] NOT anomalous[filter])))' | efetch -format docsum | xtract -pattern DocumentSummary -element Organism > "$fn_non_unique"
+echo " Fetching FTP paths of all genomes from NCBI"
+total_genera=$(python3 fetch_ftp_paths.py "$1" "${fn_selected}")
 
-echo " Creating list of unique genera"
-total_genera=$(python3 get_unique_genera.py "${fn_non_unique}" "${fn_unique}")
+echo " Downloading genomes of ${total_genera} genera"
+python3 download_files.py 'download_all' "$1" "${fn_selected}"
 
-i=0
-echo " Downloading genomes"
-for genus in $(cat "$fn_unique")
-do
-  i=$((i+1))
-
-  echo " Processing ${genus} (${i} of ${total_genera})"
-  echo "   -> Fetching FTP paths"
-#  echo "esearch -db assembly -query '((('$1'[orgn] AND ('representative genome'[refseq category] OR 'reference genome'[refseq category])) AND (latest[filter] AND all[filter] NOT anomalous[filter]))) AND '${genus}'[Organism]' | efetch -format docsum | xtract -pattern DocumentSummary -element {$ftp_labels} SpeciesName > ${genus}_ftp_paths.txt"
-#  echo "${ftp_labels}"
-#  echo "$ftp_labels"
-#  echo $ftp_labels
-#  echo ${ftp_labels}
-#  echo "--"
-
-  esearch -db assembly -query '((('"$1"'[orgn] AND ("representative genome"[refseq category] OR "reference genome"[refseq category])) AND (latest[filter] AND all[filter] NOT anomalous[filter]))) AND '${genus}'[Organism]' | efetch -format docsum | xtract -pattern DocumentSummary -element $ftp_labels SpeciesName > "${genus}_ftp_paths.txt"
-
-  echo "   -> Downloading files"
-  python3 download_files.py "${genus}_ftp_paths.txt" "$1"
-done
-
-echo "Creating file to stop creating databases"
-python3 download_files.py 'everything_has_been_downloaded'
+echo "Signalling that all databases have been queued"
+python3 download_files.py 'everything_has_been_downloaded' "$1"
 
 echo "Removing ftp paths files"
 rm *_ftp_paths.txt
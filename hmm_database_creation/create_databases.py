@@ -1,41 +1,334 @@
 """Module to create HMMer databases
 
 This script should be ran parallel to the construct_hmm_databases.sh
-script, as this script waits for a file, indicating a genus, created by that
-script that a database is ready to be created
+script, as this script waits for genera to be added to the build queue by
+that script when all genomes of a genus have been downloaded.
+
+Builds run simultaneously as long as their CPUs fit within the CPU budget.
+Failed builds are retried, and reported when all genera have been built.
+Databases built from the same genomes as the current genomes of a genus
+(see genus_manifests.py) are not rebuilt.
 
 Author: Matthias van den Belt
 """
 import subprocess
-import time
 import os
 import sys
 import typing as t
 import shutil
+from collections import deque
+
 import requests
+from redis import Redis
+
+from build_queue import get_build_queue_key, stop_signal
+from generations import activate_generation, collect_garbage, \
+    create_generation, get_current_generation, remove_database, \
+    restore_database
+from genus_manifests import get_database_manifest_path, \
+    get_genomes_manifest_path, is_database_up_to_date, read_manifest, \
+    write_manifest
 
 sys.path.append('..')
 from config_files.sensitive import finished_hmm_db_folder, hmm_db_genome_downloads
 from config_files.config import hmm_db_creation_conf
 
-def list_files(_genus: str) -> t.List[str]:
+def list_files(organism: str, _genus: str,
+               genome_files: t.Optional[t.Iterable[str]] = None) -> t.List[str]:
     """Lists all present GenBank files for the given genus
 
     Input:
+        - organism: organism of the genus (prokaryota or fungi)
         - genus: name of genus to list files for
+        - genome_files: if given, only files with these names are listed
+            (i.e. genomes of earlier downloads which are no longer part of
+            the genus are left out)
 
     Output:
         - list of file paths belonging to the given genus
     """
     all_files = []
+    to_include = None if genome_files is None else set(genome_files)
 
     for root, directory, files in os.walk(os.path.join(hmm_db_genome_downloads, organism, _genus)):
         for f in files:
-            all_files.append(os.path.join(root, f))
+            if to_include is None or f in to_include:
+                all_files.append(os.path.join(root, f))
 
     return all_files
 
 
+class BuildScheduler:
+    """Builds the databases of genera taken from the build queue
+
+    Input:
+        - organism: organism of the databases (prokaryota or fungi)
+        - redis_conn: connection to Redis, on which the build queue is stored
+        - generation: path to the generation the databases are built in
+        - previous: path to the generation currently used by jobs. Failed
+            databases are restored from this generation
+
+    The genomes of a genus are divided into shards of at most
+    hmm_db_creation_conf['shard_size'] files. Each shard is built into a
+    partial database by a separate cblaster makedb process, after which the
+    partial databases are merged (see merge_databases.py). Genera with a
+    single shard are built directly. Each process uses
+    hmm_db_creation_conf['cpus'] CPUs, and is only started when it fits
+    within hmm_db_creation_conf['cpu_budget'].
+    """
+
+    def __init__(self, organism: str, redis_conn: Redis, generation: str,
+                 previous: t.Optional[str]):
+        self.organism = organism
+        self.redis_conn = redis_conn
+        self.generation = generation
+        self.previous = previous
+        self.queue_key = get_build_queue_key(organism)
+
+        self.cpus_per_build = min(int(hmm_db_creation_conf['cpus']),
+                                  hmm_db_creation_conf['cpu_budget'])
+        self.pending = deque()  # (genus, step, attempt). step: shard or 'merge'
+        self.running = {}  # (genus, step) -> (process, log file, attempt)
+        self.builds = {}  # genus -> manifest, names of shards, finished shards
+        self.failed = []
+        self.all_queued = False
+
+    def get_shards_dir(self, genus: str) -> str:
+        """Returns the directory in which the shards of a genus are built"""
+        return os.path.join(hmm_db_genome_downloads, self.organism, 'shards',
+                            genus)
+
+    def prepare_build(self, genus: str) -> None:
+        """Divides the genomes of a genus into shards to be built
+
+        Input:
+            - genus: genus to build the database of
+
+        Output:
+            - None, pending build of each shard and written file lists
+
+        The build is skipped if the database was built from the same genomes
+        before, according to the manifest of the downloaded genomes.
+        """
+        manifest = read_manifest(get_genomes_manifest_path(self.organism, genus))
+        if manifest is not None and is_database_up_to_date(
+                self.organism, genus, manifest, self.generation):
+            print(f'{genus} database is up to date. Continuing..', flush=True)
+            return
+
+        files = list_files(self.organism, genus, manifest)
+        if not files:
+            # keep the database of the current generation (if any), instead
+            # of leaving the genus out of the new generation
+            print(f'{genus} has no genome files. Keeping its previous '
+                  f'database..', flush=True)
+            restore_database(self.generation, genus, self.previous)
+            return
+
+        # the files are hard links to the previous generation (used by
+        # running jobs), so they have to be removed instead of overwritten.
+        # This also removes the manifest, which would become invalid
+        remove_database(self.generation, genus)
+
+        shards_dir = self.get_shards_dir(genus)
+        shutil.rmtree(shards_dir, ignore_errors=True)
+        os.makedirs(shards_dir)
+
+        shard_size = hmm_db_creation_conf['shard_size']
+        batches = [files[i:i+shard_size] for i in range(0, len(files), shard_size)]
+
+        if len(batches) == 1:
+            names = [os.path.join(self.generation, genus)]
+        else:
+            names = [os.path.join(shards_dir, f'shard_{i}') for i in range(len(batches))]
+
+        for i, batch in enumerate(batches):
+            # passed as a file instead of arguments to stay within argv limits
+            with open(os.path.join(shards_dir, f'shard_{i}.txt'), 'w') as outf:
+                outf.write('\n'.join(batch))
+            self.pending.append((genus, i, 1))
+
+        self.builds[genus] = {'manifest': manifest, 'shards': names,
+                              'finished': set()}
+        print(f'Queued {genus} database ({len(files)} genomes, '
+              f'{len(names)} shard(s))', flush=True)
+
+    def get_command(self, genus: str, step: t.Union[int, str]) -> t.List[str]:
+        """Returns the command to execute a step of the build of a genus
+
+        Input:
+            - genus: genus of which the database is built
+            - step: index of the shard to build, or 'merge'
+
+        Output:
+            - command to execute
+        """
+        build = self.builds[genus]
+
+        if step == 'merge':
+            return [sys.executable,
+                    os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 'merge_databases.py'),
+                    os.path.join(self.generation, genus),
+                    str(self.cpus_per_build), *build['shards']]
+
+        return ["cblaster", "makedb",
+                "--name", build['shards'][step],
+                "--cpus", str(self.cpus_per_build),
+                "--batch", hmm_db_creation_conf['batch_size'],
+                "--force",  # a failed attempt may have left files behind
+                os.path.join(self.get_shards_dir(genus), f'shard_{step}.txt')]
+
+    def start_task(self, genus: str, step: t.Union[int, str],
+                   attempt: int) -> None:
+        """Starts a step of the build of a genus
+
+        Input:
+            - genus: genus of which the database is built
+            - step: index of the shard to build, or 'merge'
+            - attempt: number of times the step has been attempted,
+                including this attempt
+
+        Output:
+            - None, started process
+        """
+        if genus not in self.builds:  # failed in the meantime
+            return
+
+        label = genus if len(self.builds[genus]['shards']) == 1 \
+            else f'{genus}_{step}'
+        print(f'Creating {label} (attempt {attempt})', flush=True)
+
+        log = open(os.path.join(finished_hmm_db_folder, 'logs', self.organism,
+                                f'{label}_creation.log'), 'w')
+        process = subprocess.Popen(self.get_command(genus, step), stderr=log,
+                                   stdout=log, text=True)
+
+        self.running[(genus, step)] = (process, log, attempt)
+
+    def start_tasks(self) -> None:
+        """Starts pending steps as long as they fit within the CPU budget"""
+        while self.pending and (len(self.running) + 1) * \
+                self.cpus_per_build <= hmm_db_creation_conf['cpu_budget']:
+            self.start_task(*self.pending.popleft())
+
+    def collect_finished_tasks(self) -> None:
+        """Handles steps which have finished since the last call"""
+        for (genus, step), (process, log, attempt) in list(self.running.items()):
+            if process.poll() is None:
+                continue
+
+            del self.running[(genus, step)]
+            log.close()
+
+            if genus not in self.builds:  # another step of this genus failed
+                continue
+
+            if process.returncode == 0:
+                self.finish_step(genus, step)
+            elif attempt < hmm_db_creation_conf['max_attempts']:
+                print(f'  Creating {genus} ({step}) failed. Retrying..', flush=True)
+                self.pending.append((genus, step, attempt + 1))
+            else:
+                print(f'  Creating {genus} ({step}) failed {attempt} times', flush=True)
+                self.fail_build(genus)
+
+    def finish_step(self, genus: str, step: t.Union[int, str]) -> None:
+        """Continues the build of a genus after a step has succeeded
+
+        Input:
+            - genus: genus of which the database is built
+            - step: index of the built shard, or 'merge'
+
+        Output:
+            - None, pending merge step or finished build
+        """
+        build = self.builds[genus]
+
+        if step != 'merge':
+            build['finished'].add(step)
+            if len(build['finished']) < len(build['shards']):
+                return
+
+            if len(build['shards']) > 1:
+                self.pending.appendleft((genus, 'merge', 1))
+                return
+
+        del self.builds[genus]
+        shutil.rmtree(self.get_shards_dir(genus), ignore_errors=True)
+
+        print(f'  Successfully created {genus} HMM database', flush=True)
+        if build['manifest'] is not None:
+            write_manifest(get_database_manifest_path(
+                self.organism, genus, self.generation), build['manifest'])
+
+    def fail_build(self, genus: str) -> None:
+        """Stops the build of a genus and restores its previous database
+
+        Input:
+            - genus: genus of which building the database failed
+
+        Output:
+            - None, killed running steps of the genus and restored database
+        """
+        del self.builds[genus]
+        self.failed.append(genus)
+
+        for (running_genus, _), (process, _, _) in self.running.items():
+            if running_genus == genus:
+                process.kill()
+
+        shutil.rmtree(self.get_shards_dir(genus), ignore_errors=True)
+        restore_database(self.generation, genus, self.previous)
+
+    def receive_genus(self) -> None:
+        """Waits for a genus to be added to the build queue
+
+        Blocks until a genus is added, or until poll_interval seconds have
+        passed when builds are running or waiting for CPUs.
+        """
+        busy = self.running or self.pending
+        if self.all_queued and busy:
+            item = None
+            self.wait_for_builds()
+        else:
+            item = self.redis_conn.blpop(
+                self.queue_key,
+                timeout=hmm_db_creation_conf['poll_interval'] if busy else 0)
+
+        if item is None:
+            return
+
+        genus = item[1].decode()
+        if genus == stop_signal:
+            print('Encountered the stop_creating_databases signal', flush=True)
+            self.all_queued = True
+        else:
+            self.prepare_build(genus)
+
+    def wait_for_builds(self) -> None:
+        """Waits for a running build to finish, at most poll_interval seconds"""
+        for process, *_ in self.running.values():
+            try:
+                process.wait(timeout=hmm_db_creation_conf['poll_interval'])
+                return
+            except subprocess.TimeoutExpired:
+                continue
+
+    def run(self) -> t.List[str]:
+        """Builds all databases until all genera have been queued and built
+
+        Output:
+            - genera of which building the database failed
+        """
+        while not (self.all_queued and not self.running and not self.pending):
+            self.receive_genus()
+            self.collect_finished_tasks()
+            self.start_tasks()
+
+        return self.failed
+
+
 if __name__ == '__main__':
     # if len(sys.argv) != 2:
     #     print('Enter if existing databases should be removed')
@@ -52,84 +345,40 @@ if __name__ == '__main__':
     else:
         remove_dbs = input('Remove old databases? (y/n) ')
 
-    if remove_dbs == 'y':
-        print('Removing databases', flush=True)
+    if remove_dbs not in ('y', 'n'):
+        raise ValueError('Invalid option entered')
 
-        os.chdir(finished_hmm_db_folder)
-        for f in os.listdir():
-            try:
-                os.remove(f)
-            except IsADirectoryError:
-                shutil.rmtree(f)
+    os.makedirs(os.path.join(finished_hmm_db_folder, 'logs', organism),
+                exist_ok=True)
 
-            print(f'  Removed: {f}', flush=True)  # remove old db's
-    elif remove_dbs == 'n':
-        pass
-    else:
-        raise ValueError('Invalid option entered')
+    # databases are built in a new generation, so jobs can keep using the
+    # current databases. Removing the old databases means the new
+    # generation starts empty (and all databases are rebuilt)
+    redis_conn = Redis()
+    previous_generation = get_current_generation(organism)
+    generation = create_generation(organism, copy_current=remove_dbs == 'n')
+    print(f'Building databases in {generation}', flush=True)
 
-    folders_to_create = [
-        os.path.join(finished_hmm_db_folder, 'logs', organism),
-        os.path.join(finished_hmm_db_folder, organism)
-    ]
-
-    for path in folders_to_create:
-        if not os.path.exists(path):
-            os.makedirs(path, exist_ok=True)
-
-    while True:
-        try:
-            dbs_to_create_path = os.path.join(hmm_db_genome_downloads, organism, 'databases_to_create')
-            dbs_to_create = os.listdir(dbs_to_create_path)
-        except FileNotFoundError:
-            print('No databases_to_create folder present yet')
-            print(f'Sleeping for {hmm_db_creation_conf["sleeping_time"]} seconds', flush=True)
-            time.sleep(hmm_db_creation_conf['sleeping_time'])
-            continue
-
-        if len(dbs_to_create) == 0:
-            print(f'Nothing to create. Sleeping for {hmm_db_creation_conf["sleeping_time"]} seconds', flush=True)
-            time.sleep(hmm_db_creation_conf['sleeping_time'])
-        elif len(dbs_to_create) == 1 and dbs_to_create[0] == 'stop_creating_databases':
-            print('Encountered the stop_creating_databases file', flush=True)
-            subprocess.run(['rm', os.path.join(dbs_to_create_path, 'stop_creating_databases')])
-            print('Finished creating all databases.', flush=True)
-
-            res = requests.get('https://www.bioinformatics.nl/cagecat/update-hmm-databases')
-
-            if res.text == '1':
-                print('Successfully updated the available databases variable in the back-end, which is used to create the front-end')
-            else:
-                print('Something did not go well when updating the available databases')
+    failed_genera = BuildScheduler(organism, redis_conn, generation,
+                                   previous_generation).run()
+    print('Finished creating all databases.', flush=True)
 
-            exit(0)
-        else:
-            for genus in dbs_to_create:
-                if genus == 'stop_creating_databases':
-                    continue  # as we don't want to make a db for this file
-                    # actually create the db
-                print(f'Creating {genus} database', flush=True)
-                cmd = ["cblaster", "makedb",
-                       "--name", os.path.join(finished_hmm_db_folder, organism, genus),
-                       "--cpus", hmm_db_creation_conf['cpus'],
-                       "--batch", hmm_db_creation_conf['batch_size']]
-
-                cmd.extend(list_files(genus))
-
-                if len(cmd) == 8: # indicates no files were added
-                    print(f'{genus} has no genome files. Continuing..', flush=True)
-                    continue
-
-                with open(os.path.join(finished_hmm_db_folder, 'logs', organism, f'{genus}_creation.log'), 'w') as outf:
-                    res = subprocess.run(cmd, stderr=outf, stdout=outf, text=True)
-
-                if res.returncode != 0:
-                    print('Something went wrong. Exiting..', flush=True)
-                    exit(1)
-
-                print(f'  Successfully created {genus} HMM database', flush=True)
-                subprocess.run(['rm', os.path.join(dbs_to_create_path, genus)])
-                print(f'  Removed {genus} touch file', flush=True)
+    activate_generation(organism, generation)
+    print(f'Activated {generation}', flush=True)
+
+    for removed in collect_garbage(organism, redis_conn):
+        print(f'  Removed unused generation: {removed}', flush=True)
+
+    res = requests.get('https://www.bioinformatics.nl/cagecat/update-hmm-databases')
+
+    if res.text == '1':
+        print('Successfully updated the available databases variable in the back-end, which is used to create the front-end')
+    else:
+        print('Something did not go well when updating the available databases')
+
+    if failed_genera:
+        print(f'Failed to create databases of: {", ".join(failed_genera)}', flush=True)
+        exit(1)
 
 
 # TODO future: we could compress all refseq gbks until the next time we use it so we save storage
@@ -2,14 +2,19 @@
 
 Author: Matthias van den Belt
 """
-import subprocess
 from sys import argv
 import os
-import ftplib
-import time
 import hashlib
 import sys
+import typing as t
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from build_queue import enqueue_build, stop_signal
+from ftp_downloads import DownloadManifest, FTPConnectionPool, RateLimiter, \
+    download_file, fetch_file_contents
+from genus_manifests import get_genomes_manifest_path, \
+    is_database_up_to_date, read_manifest, write_manifest
 
 sys.path.append('..')
 from config_files.sensitive import hmm_db_genome_downloads
@@ -91,44 +96,195 @@ def create_dir(*args) -> str:
     return names
 
 
-def validate_download(gb_path):
-    """Validates a downloading using their MD5 checksum
+class StreamingValidator:
+    """Hashes and decompresses a gzipped genome file while it is downloaded
 
     Input:
-        - gb_path: path to genome file
+        - output_path: path to write the decompressed genome file to
+        - max_chunk: maximum number of decompressed bytes held in memory
+
+    Each downloaded block is passed to feed(), so the compressed file never
+    has to be read from disk again. finish() returns the MD5 checksum of the
+    compressed file.
+    """
+
+    def __init__(self, output_path: str, max_chunk: int = 1048576):
+        self.max_chunk = max_chunk
+        self.md5 = hashlib.md5()
+        self.decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        # 16 + MAX_WBITS: expect a gzip header and trailer
+        self.outf = open(output_path, 'wb')
+
+    def feed(self, block: bytes) -> None:
+        self.md5.update(block)
+
+        data = block
+        while data:
+            self.outf.write(self.decompressor.decompress(data, self.max_chunk))
+            data = self.decompressor.unconsumed_tail
+
+            if self.decompressor.eof:  # next member of a multi-member file
+                data = self.decompressor.unused_data
+                self.decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    def replay(self, path: str, size: int) -> None:
+        """Feeds the blocks of a partially downloaded file
+
+        Input:
+            - path: path to the partially downloaded (compressed) file
+            - size: number of bytes of the file to feed, being the bytes
+                kept by download_file
+
+        Output:
+            - None
+        """
+        with open(path, 'rb') as inf:
+            while size > 0:
+                block = inf.read(min(self.max_chunk, size))
+                if not block:
+                    break
+
+                self.feed(block)
+                size -= len(block)
+
+    def finish(self) -> str:
+        """Writes the remaining decompressed data
+
+        Output:
+            - MD5 checksum of the compressed file
+        """
+        self.outf.write(self.decompressor.flush())
+        self.outf.close()
+
+        return self.md5.hexdigest()
+
+    def close(self) -> None:
+        self.outf.close()
+
+
+def parse_md5_checksums(contents: bytes) -> t.Dict[str, str]:
+    """Parses the contents of an md5checksums.txt file of an assembly
+
+    Input:
+        - contents: contents of the file. Lines look like:
+            "a1b2...  ./GCF_000820515.1_ASM82051v1_genomic.gbff.gz"
 
     Output:
-        - bool: if the file was successfully validated
+        - file name -> MD5 checksum
+    """
+    checksums = {}
+    for line in contents.decode().splitlines():
+        splitted = line.strip().split()
+        if len(splitted) == 2:
+            checksums[os.path.basename(splitted[1])] = splitted[0]
+
+    return checksums
+
+
+def remove_files(*paths: str) -> None:
+    """Removes files, if they exist
+
+    Input:
+        - paths: paths to the files to remove
 
+    Output:
+        - None
     """
-    print('         -> validation.. ', end='\r')
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def download_species(pool: FTPConnectionPool, manifest: DownloadManifest,
+                     species: str, paths: t.Tuple[str, str],
+                     output_dir: str, blocksize: int) -> t.Optional[str]:
+    """Downloads, validates and unzips the genome file of a single species
 
-    with open(os.path.join(hmm_db_genome_downloads, 'md5checksums.txt')) as inf:
-        for line in inf.readlines():
-            splitted = line.strip().split()
-            if splitted[-1].endswith('genomic.gbff.gz'):
-                ori_chksum = splitted[0]
-                break
+    Input:
+        - pool: pool of connections to NCBI's FTP server
+        - manifest: manifest of the downloads of the genus
+        - species: name of the species
+        - paths: FTP paths of the genome file and its md5checksums.txt file
+        - output_dir: directory where the genome file should be saved
+        - blocksize: blocksize to be used during downloading
 
-    with open(gb_path, 'rb') as inf:
-        calc_chksum = hashlib.md5(inf.read()).hexdigest()
+    Output:
+        - MD5 checksum of the (compressed) genome file if it was validated
+            successfully, otherwise None
+        - downloaded genome file
 
-    if calc_chksum == ori_chksum:
-        print('         -> validation --> ok')
+    The genome file is hashed and decompressed while it is downloaded. The
+    compressed file is only kept on disk to be able to continue an
+    interrupted download, and removed afterwards.
+    """
+    # paths[0] looks like:
+    # ftp.ncbi.nlm.nih.gov/genomes/all/GCF/000/820/515/GCF_000820515.1_ASM82051v1/GCF_000820515.1_ASM82051v1_genomic.gbff.gz
+    genome_file_name = paths[0].split('/')[-1]
+    compressed_path = os.path.join(hmm_db_genome_downloads, genome_file_name)
+    decompressed_path = compressed_path[:-3]  # [:-3] is to remove .gz
+    retries = hmm_db_download_conf['retries']
+
+    checksums = parse_md5_checksums(
+        fetch_file_contents(pool, paths[1], retries=retries))
+    if genome_file_name not in checksums:
+        print(f'         -> no checksum of {genome_file_name}. Skipping')
+        return None
+
+    validator = StreamingValidator(decompressed_path)
+    try:
+        # bytes kept from a previous download are fed before the new blocks
+        download_file(pool, paths[0], compressed_path, manifest,
+                      blocksize=blocksize, retries=retries,
+                      callback=validator.feed,
+                      on_resume=lambda size: validator.replay(compressed_path,
+                                                              size))
+        calc_chksum = validator.finish()
+    except zlib.error as e:
+        validator.close()
+        calc_chksum = f'invalid ({e})'
+    except BaseException:
+        validator.close()  # partial files are kept to continue the download
+        raise
+
+    manifest.remove(paths[0])
+    if calc_chksum == checksums[genome_file_name]:
+        print(f'         -> validation --> ok: {species}')
+        os.replace(decompressed_path,
+                   os.path.join(output_dir, genome_file_name[:-3]))
+        remove_files(compressed_path)
+        print(f'         -> moved to {output_dir}')
+
+        return calc_chksum
     else:
-        print('         -> validation --> incorrect')
-        print(f'Invalid path: {gb_path}')
-        return False
+        print(f'         -> validation --> incorrect: {species}')
+        print(f'Invalid path: {paths[0]}')
         # check manually (or create script to grep the log files of cron job
-        # with this line)
+        # with this line). Removed, so it is downloaded again in the next run
+        remove_files(compressed_path, decompressed_path)
 
-    subprocess.run(['gzip', '-d', gb_path])
-    print('         -> unzipped')
+        return None
 
-    return True
 
+def create_pool(host=hmm_db_download_conf['host'],
+                port=hmm_db_download_conf['port']) -> FTPConnectionPool:
+    """Creates a pool of connections to NCBI's FTP server
 
-def download_files(genus, paths, output_dir, blocksize=33554432):
+    Input:
+        - host, port: address of the FTP server
+
+    Output:
+        - pool of connections, limited as configured in hmm_db_download_conf
+    """
+    return FTPConnectionPool(
+        host, port=port, size=hmm_db_download_conf['concurrency'],
+        rate_limiter=RateLimiter(hmm_db_download_conf['requests_per_second']))
+
+
+def download_files(genus, paths, output_dir,
+                   blocksize=hmm_db_download_conf['blocksize'],
+                   host=hmm_db_download_conf['host'],
+                   port=hmm_db_download_conf['port'],
+                   pool=None):
     """Downloads (genome) files from NCBI's FTP server
 
     Input:
@@ -137,71 +293,136 @@ def download_files(genus, paths, output_dir, blocksize=33554432):
         - output_dir: directory where files should be saved
         - blocksize: blocksize to be used during downloading (current has
             been recommended by NCBI)
+        - host, port: address of the FTP server
+        - pool: pool of connections to reuse. A new pool (for host and port)
+            is created and closed if not given
 
     Output:
-        - None, downloaded genome files
+        - checksums: (decompressed) file name -> MD5 checksum of the genomes
+            downloaded in this run
+        - downloaded genome files
+
+    Species are downloaded simultaneously over a pool of reused connections.
+    The state of all downloads is kept in a manifest, so genomes which were
+    partially downloaded in an interrupted run are continued.
     """
-    present_files = os.listdir(output_dir)
+    present_files = set(os.listdir(output_dir))
     species_count = len(paths)
 
-    for count, (species, paths) in enumerate(paths.items(), start=1):
-        print(f'     -> {count}/{species_count}: {species}')
-        # paths[0] looks like:
-        # ftp.ncbi.nlm.nih.gov/genomes/all/GCF/000/820/515/GCF_000820515.1_ASM82051v1/GCF_000820515.1_ASM82051v1_genomic.gbff.gz
-        genome_file_name = paths[0].split('/')[-1]
-        if genome_file_name[:-3] in present_files:
-            print(f'         -> already present: {genome_file_name[:-3]}')
-        else:
-            # print(paths)
-            for i, fp in enumerate(paths, start=1):
-                ftp = ftplib.FTP(NCBI_ftp_base_url)
-
-                print(f'         -> downloading file {i} of 2')
-                file_name = fp.split('/')[-1]
-                ftp.login()
-                time.sleep(0.34)
-                # print('accessing URL:', fp)
-
-                with open(os.path.join(hmm_db_genome_downloads, file_name), 'wb') as outf: # now with .gz as we download it as compressed
-                    ftp.retrbinary(f'RETR {fp}', outf.write, blocksize=blocksize)
-                time.sleep(0.34)
-
-            genome_file_path = os.path.join(hmm_db_genome_downloads, genome_file_name)
-            if validate_download(genome_file_path):
-                os.rename(genome_file_path[:-3], os.path.join(hmm_db_genome_downloads, organism, genus,
-                                                         genome_file_path.split('/')[-1][:-3]))
-                # [:-3] is to remove .gz
-                print(f'         -> moved to {genus} folder')
+    manifest = DownloadManifest(os.path.join(
+        create_dir(os.path.dirname(output_dir), 'manifests'),
+        f'{genus}.json'))
+    own_pool = pool is None
+    if own_pool:
+        pool = create_pool(host, port)
+
+    with ThreadPoolExecutor(
+            max_workers=hmm_db_download_conf['concurrency']) as executor:
+        futures, checksums = {}, {}
+        for count, (species, species_paths) in enumerate(paths.items(),
+                                                         start=1):
+            genome_file_name = species_paths[0].split('/')[-1]
+            if genome_file_name[:-3] in present_files:
+                print(f'     -> {count}/{species_count}: already present: '
+                      f'{genome_file_name[:-3]}')
+                continue
+
+            futures[executor.submit(download_species, pool, manifest,
+                                    species, species_paths, output_dir,
+                                    blocksize)] = (species,
+                                                   genome_file_name[:-3])
+
+        for future in as_completed(futures):
+            try:
+                checksum = future.result()
+            except Exception as e:  # other species can still be used
+                print(f'         -> failed: {futures[future][0]} ({e})',
+                      flush=True)
+                continue
+
+            if checksum is not None:
+                checksums[futures[future][1]] = checksum
+
+    if own_pool:
+        pool.close()
+    return checksums
+
+
+def download_genus(organism: str, genus: str, ftp_paths_path: str,
+                   pool: t.Optional[FTPConnectionPool] = None) -> None:
+    """Downloads the genomes of a genus and requests its database to be built
 
+    Input:
+        - organism: organism of the genus (prokaryota or fungi)
+        - genus: genus to download the genomes of
+        - ftp_paths_path: file with the FTP paths of the genomes of the genus
+        - pool: pool of connections to reuse, if given
 
-if __name__ == '__main__':
-    if argv[1] == 'everything_has_been_downloaded':
-        subprocess.run(['touch', os.path.join(hmm_db_genome_downloads, 'databases_to_create', 'stop_creating_databases')])
-        exit(0)
+    Output:
+        - None, downloaded genomes, written manifest and queued build
+
+    The genomes are not downloaded again if the current database was built
+    from the same genomes. The build is always queued, so the genus is also
+    present in a newly built generation.
+    """
+    paths = parse_paths(ftp_paths_path)
 
-    genus = argv[1].split('_')[0]
-    organism = argv[2]
+    genome_files = [p[0].split('/')[-1][:-3] for p in paths.values()]
+    if is_database_up_to_date(organism, genus, genome_files):
+        # the build is still queued: the scheduler checks the genus against
+        # the generation being built, which starts empty when the old
+        # databases are removed, and builds it from the present genomes
+        print(f'  skipping download of {genus} (database is up to date)')
+        enqueue_build(organism, genus)
+        return
 
-    if organism == 'prokaryota':
-        threshold = thresholds['prokaryotes_min_number_of_genomes']
-    elif organism == 'fungi':
-        threshold = thresholds['fungi_min_number_of_genomes']
-    else:
-        raise ValueError(f'Invalid organism entered: {organism}')
+    output_dir = create_dir(hmm_db_genome_downloads, organism, genus)
+    checksums = download_files(genus, paths, output_dir, pool=pool)
+
+    # genomes which were downloaded in a previous run keep their checksum
+    manifest_path = get_genomes_manifest_path(organism, genus)
+    previous_checksums = read_manifest(manifest_path) or {}
+    present_files = set(os.listdir(output_dir))
 
-    paths = parse_paths(argv[1])
-    if len(paths) < threshold:
-        print(f'  skipping {genus} ({len(paths)} < {threshold})')
+    write_manifest(manifest_path,
+                   {fn: checksums.get(fn, previous_checksums.get(fn))
+                    for fn in genome_files if fn in present_files})
 
-        mode = 'a' if os.path.exists('too_few_species.txt') else 'w'
-        with open('too_few_species.txt', mode) as outf:  # gets overwritten every time
-            for species, file_paths in paths.items():
-                outf.write(f'{species},{file_paths[0]},{file_paths[1]}\n')
-                # species,genome file ftp path, md5 checksum ftp path
+    enqueue_build(organism, genus)
+
+
+def download_all_genera(organism: str, selected_path: str) -> None:
+    """Downloads the genomes of all selected genera in a single process
+
+    Input:
+        - organism: organism of the genera (prokaryota or fungi)
+        - selected_path: file with a genus per line, of which the FTP paths
+            have been written to <genus>_ftp_paths.txt
+
+    Output:
+        - None, downloaded genomes and queued builds
+
+    All genera share the same pool of connections.
+    """
+    with open(selected_path) as inf:
+        genera = inf.read().split()
+
+    pool = create_pool()
+    try:
+        for i, genus in enumerate(genera, start=1):
+            print(f' Processing {genus} ({i} of {len(genera)})', flush=True)
+            download_genus(organism, genus, f'{genus}_ftp_paths.txt', pool)
+    finally:
+        pool.close()
+
+
+if __name__ == '__main__':
+    if argv[1] == 'everything_has_been_downloaded':
+        enqueue_build(argv[2], stop_signal)
         exit(0)
 
-    output_dir = create_dir(hmm_db_genome_downloads, organism, genus)
-    download_files(genus, paths, output_dir)
+    if argv[1] == 'download_all':
+        download_all_genera(argv[2], argv[3])
+        exit(0)
 
-    create_dir(hmm_db_genome_downloads, organism, 'databases_to_create')
-    subprocess.run(['touch', os.path.join(hmm_db_genome_downloads, organism, 'databases_to_create', genus)])
+    download_genus(argv[2], argv[1].split('_')[0], argv[1])
@@ -0,0 +1,186 @@
+"""Fetches the FTP paths of all genomes of an organism in a single pass
+
+The assembly document summaries of all representative genomes are fetched
+from NCBI's E-utilities in large pages, using the history server. The FTP
+paths are grouped by genus, and a <genus>_ftp_paths.txt file is written for
+each genus with enough genomes, in the format expected by
+download_files.parse_paths.
+
+The function used to fetch a URL can be passed to fetch_document_summaries,
+so recorded responses can be used instead of NCBI's servers (see
+tests/test_fetch_ftp_paths.py).
+
+Usage:
+    python3 fetch_ftp_paths.py <organism> <selected genera>
+
+Author: Matthias van den Belt
+"""
+import os
+import sys
+import typing as t
+import xml.etree.ElementTree as ET
+
+import requests
+
+from ftp_downloads import RateLimiter
+from get_unique_genera import count_genera, select_genera
+
+sys.path.append('..')
+from config_files.config import eutils_conf
+
+assembly_query = '(({organism}[orgn] AND ("representative genome"[refseq ' \
+                 'category] OR "reference genome"[refseq category])) AND ' \
+                 '(latest[filter] AND all[filter] NOT anomalous[filter]))'
+
+# FTP paths to write per organism, in this order
+ftp_labels = {'prokaryota': ('FtpPath_RefSeq', ),
+              'fungi': ('FtpPath_GenBank', 'FtpPath_RefSeq')}
+
+Fetcher = t.Callable[[str, t.Dict[str, t.Union[str, int]]], bytes]
+
+
+def create_fetcher(requests_per_second: float = eutils_conf['requests_per_second'],
+                   retries: int = 3) -> Fetcher:
+    """Creates a function to request E-utilities, respecting NCBI's rate limit
+
+    Input:
+        - requests_per_second: maximum number of requests per second
+        - retries: number of times a failed request is retried
+
+    Output:
+        - function requesting a URL with the given parameters, returning the
+            contents of the response
+    """
+    rate_limiter = RateLimiter(requests_per_second)
+    session = requests.Session()
+
+    def fetch(url: str, params: t.Dict[str, t.Union[str, int]]) -> bytes:
+        for attempt in range(retries + 1):
+            rate_limiter.wait()
+            try:
+                response = session.get(url, params=params, timeout=120)
+                response.raise_for_status()
+                return response.content
+            except requests.RequestException:
+                if attempt == retries:
+                    raise
+
+    return fetch
+
+
+def fetch_document_summaries(organism: str, fetch: Fetcher,
+                             page_size: int = eutils_conf['page_size']) \
+        -> t.Iterator[ET.Element]:
+    """Yields the assembly document summaries of all genomes of an organism
+
+    Input:
+        - organism: organism to fetch the genomes of (prokaryota or fungi)
+        - fetch: function to request a URL (see create_fetcher)
+        - page_size: number of summaries requested at once
+
+    Output:
+        - DocumentSummary elements
+    """
+    search = ET.fromstring(fetch(
+        f'{eutils_conf["base_url"]}esearch.fcgi',
+        {'db': 'assembly', 'term': assembly_query.format(organism=organism),
+         'usehistory': 'y', 'retmax': 0}))
+
+    count = int(search.findtext('Count'))
+    history = {'db': 'assembly', 'WebEnv': search.findtext('WebEnv'),
+               'query_key': search.findtext('QueryKey')}
+
+    for retstart in range(0, count, page_size):
+        summaries = ET.fromstring(fetch(
+            f'{eutils_conf["base_url"]}esummary.fcgi',
+            {**history, 'retstart': retstart, 'retmax': page_size}))
+
+        yield from summaries.iter('DocumentSummary')
+
+
+def group_ftp_paths(summaries: t.Iterable[ET.Element], organism: str) \
+        -> t.Tuple[t.Dict[str, t.List[str]], t.List[str]]:
+    """Groups the FTP paths of genomes by genus
+
+    Input:
+        - summaries: assembly document summaries
+        - organism: organism of the genomes (prokaryota or fungi)
+
+    Output:
+        - ftp_paths: genus -> lines of its FTP paths file, formatted as the
+            FTP paths followed by the species name (tab-separated)
+        - organisms: organism names of all genomes, used to count the genomes
+            per genus
+    """
+    ftp_paths, organisms = {}, []
+
+    for summary in summaries:
+        organism_name = summary.findtext('Organism', '').strip()
+        if not organism_name:
+            continue
+
+        organisms.append(organism_name)
+        genus = organism_name.split()[0]
+
+        paths = [summary.findtext(label, '').strip()
+                 for label in ftp_labels[organism]]
+        paths = [p for p in paths if p]
+        if not paths:  # genome is not available for downloading
+            continue
+
+        species = summary.findtext('SpeciesName', '').strip()
+        ftp_paths.setdefault(genus, []).append('\t'.join(paths + [species]))
+
+    return ftp_paths, organisms
+
+
+def write_ftp_paths(organism: str, selected_path: str,
+                    fetch: t.Optional[Fetcher] = None,
+                    output_dir: str = '.') -> int:
+    """Writes the FTP paths files of all genera with enough genomes
+
+    Input:
+        - organism: organism to fetch the genomes of (prokaryota or fungi)
+        - selected_path: file to write the selected genera to
+        - fetch: function to request a URL. Requests NCBI if not given
+        - output_dir: directory to write the files to
+
+    Output:
+        - number of selected genera
+        - written genome_counts.txt, too_few_species.txt, selected genera and
+            <genus>_ftp_paths.txt files
+    """
+    if fetch is None:
+        fetch = create_fetcher()
+
+    ftp_paths, organisms = group_ftp_paths(
+        fetch_document_summaries(organism, fetch), organism)
+
+    counts_path = os.path.join(output_dir, 'genome_counts.txt')
+    with open(counts_path, 'w') as outf:
+        for genus, count in count_genera(organisms).items():
+            outf.write(f'{genus}\t{count}\n')
+
+    selected = select_genera(
+        organism, counts_path, selected_path,
+        skipped_path=os.path.join(output_dir, 'too_few_species.txt'))
+
+    with open(selected_path) as inf:
+        for genus in inf.read().split():
+            with open(os.path.join(output_dir, f'{genus}_ftp_paths.txt'), 'w') as outf:
+                for line in ftp_paths.get(genus, []):
+                    outf.write(f'{line}\n')
+
+    return selected
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        raise IndexError('Supply an organism and an output file')
+
+    if sys.argv[1] not in ftp_labels:
+        raise ValueError(f'Invalid organism entered: {sys.argv[1]}')
+
+    print(write_ftp_paths(sys.argv[1], sys.argv[2]))
+    # total number of genera is used in bash script from which this script
+    # is called. Above line should be left in!
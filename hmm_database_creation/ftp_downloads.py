@@ -0,0 +1,280 @@
+"""Pooled, rate limited and resumable downloading from an FTP server
+
+Used to download genome files from NCBI's FTP server when constructing the
+HMM databases. Logged in connections are reused between downloads, the
+number of commands sent to the server is limited over all threads, and
+interrupted downloads are continued from the bytes already on disk. The
+state of each download is kept in a manifest on disk, so a new run continues
+where an interrupted run stopped. As the host and port are parameters, a
+local FTP server can be used instead of NCBI's.
+
+Author: Matthias van den Belt
+"""
+import contextlib
+import ftplib
+import json
+import os
+import queue
+import threading
+import time
+import typing as t
+
+# errors after which a download is retried using a new connection
+retry_errors = (ftplib.error_temp, ftplib.error_reply, EOFError, OSError)
+
+
+class RateLimiter:
+    """Limits the number of requests per second, shared by all threads
+
+    Input:
+        - requests_per_second: maximum number of requests per second
+    """
+
+    def __init__(self, requests_per_second: float):
+        self.interval = 1 / requests_per_second
+        self.lock = threading.Lock()
+        self.next_allowed = 0.0
+
+    def wait(self) -> None:
+        """Blocks until a new request is allowed"""
+        with self.lock:
+            now = time.monotonic()
+            wait_time = self.next_allowed - now
+            self.next_allowed = max(now, self.next_allowed) + self.interval
+
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
+class FTPConnectionPool:
+    """Pool of logged in FTP connections which are reused between downloads
+
+    Input:
+        - host: address of the FTP server
+        - port: port of the FTP server
+        - size: maximum number of simultaneously opened connections
+        - rate_limiter: limits the commands sent to the server. No limit is
+            applied if not given
+        - timeout: timeout in seconds of the connections
+
+    Connections are borrowed using connection(). A connection on which an
+    error occurred is closed instead of returned to the pool.
+    """
+
+    def __init__(self, host: str, port: int = 21, size: int = 4,
+                 rate_limiter: t.Optional[RateLimiter] = None,
+                 timeout: int = 60):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+
+        self.idle = queue.LifoQueue()
+        self.slots = threading.BoundedSemaphore(size)
+
+    def throttle(self) -> None:
+        """Waits until a new command may be sent to the server"""
+        if self.rate_limiter is not None:
+            self.rate_limiter.wait()
+
+    def connect(self) -> ftplib.FTP:
+        """Opens a new (anonymous) connection to the FTP server
+
+        Output:
+            - logged in FTP connection
+        """
+        ftp = ftplib.FTP(timeout=self.timeout)
+
+        self.throttle()
+        ftp.connect(self.host, self.port)
+        self.throttle()
+        ftp.login()
+
+        return ftp
+
+    @contextlib.contextmanager
+    def connection(self) -> t.Iterator[ftplib.FTP]:
+        """Borrows a connection from the pool
+
+        Output:
+            - logged in FTP connection. Blocks while the maximum number of
+                connections is in use
+        """
+        with self.slots:
+            try:
+                ftp = self.idle.get_nowait()
+            except queue.Empty:
+                ftp = self.connect()
+
+            try:
+                yield ftp
+            except BaseException:
+                close_connection(ftp)
+                raise
+
+            self.idle.put(ftp)
+
+    def close(self) -> None:
+        """Closes all idle connections of the pool"""
+        while True:
+            try:
+                close_connection(self.idle.get_nowait())
+            except queue.Empty:
+                break
+
+
+def close_connection(ftp: ftplib.FTP) -> None:
+    """Closes an FTP connection, also when it is broken
+
+    Input:
+        - ftp: connection to close
+
+    Output:
+        - None
+    """
+    try:
+        ftp.quit()
+    except (ftplib.Error, EOFError, OSError):
+        ftp.close()
+
+
+class DownloadManifest:
+    """Persistent record of the state of downloads
+
+    Input:
+        - path: JSON file in which the states are stored. Loaded if it
+            already exists
+
+    Maps remote file paths to their state ("partial" or "complete"). The
+    file is rewritten atomically after each change, so it is never left
+    corrupted when a run is interrupted.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+
+        if os.path.exists(path):
+            with open(path) as inf:
+                self.entries = json.load(inf)
+        else:
+            self.entries = {}
+
+    def get(self, remote_path: str) -> t.Optional[str]:
+        with self.lock:
+            return self.entries.get(remote_path)
+
+    def set(self, remote_path: str, state: str) -> None:
+        with self.lock:
+            self.entries[remote_path] = state
+            self.save()
+
+    def remove(self, *remote_paths: str) -> None:
+        with self.lock:
+            for remote_path in remote_paths:
+                self.entries.pop(remote_path, None)
+            self.save()
+
+    def save(self) -> None:
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w') as outf:
+            json.dump(self.entries, outf, indent=1)
+        os.replace(tmp_path, self.path)
+
+
+def download_file(pool: FTPConnectionPool, remote_path: str, local_path: str,
+                  manifest: DownloadManifest, blocksize: int = 33554432,
+                  retries: int = 3,
+                  callback: t.Optional[t.Callable[[bytes], None]] = None,
+                  on_resume: t.Optional[t.Callable[[int], None]] = None) \
+        -> None:
+    """Downloads a file, continuing a previously interrupted download
+
+    Input:
+        - pool: pool of connections to the FTP server
+        - remote_path: path of the file on the FTP server
+        - local_path: path to save the file to
+        - manifest: manifest in which the state of the download is stored
+        - blocksize: blocksize to be used during downloading
+        - retries: number of times a failed download is continued
+        - callback: called with each downloaded block, if given
+        - on_resume: called with the number of bytes of local_path which are
+            kept from a previous run, before any block is passed to
+            callback, if given. Not called when no bytes are kept
+
+    Output:
+        - None, downloaded file
+
+    Raises:
+        - ftplib.error_perm: when the file is not available on the server
+        - one of retry_errors: when the download failed more than retries
+            times
+
+    If the manifest marks the file as partially downloaded, only the
+    remaining bytes are requested using a REST offset. Any other file
+    already at local_path (e.g. an outdated version of the file) is
+    overwritten.
+    """
+    state = manifest.get(remote_path)
+    if state == 'complete' and os.path.exists(local_path):
+        if on_resume is not None:
+            on_resume(os.path.getsize(local_path))
+        return
+
+    if state != 'partial':
+        open(local_path, 'wb').close()
+        manifest.set(remote_path, 'partial')
+
+    kept = os.path.getsize(local_path) if os.path.exists(local_path) else 0
+    if kept and on_resume is not None:
+        on_resume(kept)
+
+    for attempt in range(retries + 1):
+        offset = os.path.getsize(local_path) \
+            if os.path.exists(local_path) else 0
+
+        try:
+            with pool.connection() as ftp, open(local_path, 'ab') as outf:
+                def write_block(block: bytes) -> None:
+                    outf.write(block)
+                    if callback is not None:
+                        callback(block)
+
+                pool.throttle()
+                ftp.retrbinary(f'RETR {remote_path}', write_block,
+                               blocksize=blocksize, rest=offset or None)
+        except retry_errors as e:
+            if attempt == retries:
+                raise
+            print(f'         -> retrying {remote_path} from byte '
+                  f'{os.path.getsize(local_path)} ({e})', flush=True)
+            continue
+
+        manifest.set(remote_path, 'complete')
+        return
+
+
+def fetch_file_contents(pool: FTPConnectionPool, remote_path: str,
+                        retries: int = 3) -> bytes:
+    """Downloads a (small) file into memory
+
+    Input:
+        - pool: pool of connections to the FTP server
+        - remote_path: path of the file on the FTP server
+        - retries: number of times a failed download is retried
+
+    Output:
+        - contents of the file
+    """
+    for attempt in range(retries + 1):
+        blocks = []
+        try:
+            with pool.connection() as ftp:
+                pool.throttle()
+                ftp.retrbinary(f'RETR {remote_path}', blocks.append)
+        except retry_errors:
+            if attempt == retries:
+                raise
+            continue
+
+        return b''.join(blocks)
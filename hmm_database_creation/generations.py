@@ -0,0 +1,213 @@
+"""Versioned generations of the HMM databases
+
+Each run of create_databases.py builds the databases of an organism in a new
+generation directory (finished_hmm_db_folder/generations/<organism>/<time>).
+When all databases have been built, finished_hmm_db_folder/<organism>, which
+is a symlink, is swapped atomically to the new generation. Running jobs keep
+using the generation they resolved when they started, and register it in
+Redis (see cagecat/generation_usage.py), so a generation is only removed
+when no job uses it anymore.
+
+Author: Matthias van den Belt
+"""
+import datetime
+import os
+import shutil
+import sys
+import typing as t
+
+from redis import Redis
+
+sys.path.append('..')
+from config_files.sensitive import finished_hmm_db_folder
+
+# imported as a standalone module, as importing the cagecat package would
+# start the web application
+sys.path.append(os.path.join('..', 'cagecat'))
+from generation_usage import is_generation_in_use
+
+
+def get_live_path(organism: str) -> str:
+    """Returns the path to the databases of an organism used by new jobs
+
+    Input:
+        - organism: organism of the databases (prokaryota or fungi)
+
+    Output:
+        - path of the symlink to the current generation
+    """
+    return os.path.join(finished_hmm_db_folder, organism)
+
+
+def get_generations_dir(organism: str) -> str:
+    """Returns the directory in which the generations of an organism are stored
+
+    Input:
+        - organism: organism of the databases (prokaryota or fungi)
+
+    Output:
+        - path to the directory containing all generations
+    """
+    return os.path.join(finished_hmm_db_folder, 'generations', organism)
+
+
+def get_current_generation(organism: str) -> t.Optional[str]:
+    """Returns the generation currently used by new jobs
+
+    Input:
+        - organism: organism of the databases (prokaryota or fungi)
+
+    Output:
+        - path to the current generation OR
+        - None if no generation has been activated yet
+    """
+    live_path = get_live_path(organism)
+    if not os.path.islink(live_path):
+        return None
+
+    return os.path.realpath(live_path)
+
+
+def migrate_legacy_folder(organism: str) -> None:
+    """Converts databases built before generations existed to a generation
+
+    Input:
+        - organism: organism of the databases (prokaryota or fungi)
+
+    Output:
+        - None, the databases directory of the organism is moved to a
+            generation, and replaced by a symlink to that generation
+    """
+    live_path = get_live_path(organism)
+    if os.path.islink(live_path) or not os.path.isdir(live_path):
+        return
+
+    legacy_generation = os.path.join(get_generations_dir(organism), 'legacy')
+    os.makedirs(get_generations_dir(organism), exist_ok=True)
+
+    os.rename(live_path, legacy_generation)
+    os.symlink(legacy_generation, live_path)
+
+
+def create_generation(organism: str, copy_current: bool = True) -> str:
+    """Creates a new generation to build databases in
+
+    Input:
+        - organism: organism of the databases (prokaryota or fungi)
+        - copy_current: if the databases of the current generation should
+            be included in the new generation
+
+    Output:
+        - path to the new generation
+
+    Databases of the current generation are hard linked instead of copied.
+    Therefore, the files of a database should be removed from the new
+    generation before it is rebuilt (see remove_database).
+    """
+    migrate_legacy_folder(organism)
+
+    generation = os.path.join(
+        get_generations_dir(organism),
+        datetime.datetime.utcnow().strftime('%Y%m%d-%H%M%S'))
+    current = get_current_generation(organism)
+
+    if copy_current and current is not None:
+        shutil.copytree(current, generation, copy_function=os.link)
+    else:
+        os.makedirs(generation)
+
+    return generation
+
+
+def remove_database(generation: str, genus: str) -> None:
+    """Removes the files of the database of a genus from a generation
+
+    Input:
+        - generation: path to the generation
+        - genus: name of the genus
+
+    Output:
+        - None, removed files. Other generations sharing these files (as
+            hard links) are not affected
+    """
+    for fn in os.listdir(generation):
+        if fn.split('.')[0] == genus:
+            os.remove(os.path.join(generation, fn))
+
+
+def restore_database(generation: str, genus: str,
+                     source: t.Optional[str]) -> None:
+    """Restores the database of a genus in a generation from another one
+
+    Input:
+        - generation: path to the generation to restore the database in
+        - genus: name of the genus
+        - source: path to the generation to restore the database from. Nothing
+            is restored if None
+
+    Output:
+        - None, hard linked database files
+    """
+    if source is None or not os.path.isdir(source):
+        return
+
+    remove_database(generation, genus)
+    for fn in os.listdir(source):
+        if fn.split('.')[0] == genus:
+            os.link(os.path.join(source, fn), os.path.join(generation, fn))
+
+
+def activate_generation(organism: str, generation: str) -> None:
+    """Lets new jobs use the databases of a generation
+
+    Input:
+        - organism: organism of the databases (prokaryota or fungi)
+        - generation: path to the generation to activate
+
+    Output:
+        - None, the symlink of the organism points to the generation
+    """
+    live_path = get_live_path(organism)
+    tmp_path = f'{live_path}.tmp'
+
+    if os.path.lexists(tmp_path):
+        os.remove(tmp_path)
+
+    os.symlink(generation, tmp_path)
+    os.replace(tmp_path, live_path)  # atomic
+
+
+def collect_garbage(organism: str, redis_conn: Redis,
+                    keep: int = 2) -> t.List[str]:
+    """Removes old generations which are not used anymore
+
+    Input:
+        - organism: organism of the databases (prokaryota or fungi)
+        - redis_conn: connection to Redis
+        - keep: number of most recent generations which are always kept
+            (including the current generation). Older generations are kept
+            as long as running jobs, or the sessions of jobs which have not
+            expired yet, use them (see cagecat/generation_usage.py)
+
+    Output:
+        - paths to the removed generations
+    """
+    generations_dir = get_generations_dir(organism)
+    if not os.path.isdir(generations_dir):
+        return []
+
+    current = get_current_generation(organism)
+    generations = sorted(
+        (os.path.join(generations_dir, g) for g in os.listdir(generations_dir)),
+        key=os.path.getmtime)
+
+    removed = []
+    for generation in generations[:max(len(generations) - keep, 0)]:
+        if os.path.realpath(generation) == current or \
+                is_generation_in_use(redis_conn, os.path.realpath(generation)):
+            continue
+
+        shutil.rmtree(generation)
+        removed.append(generation)
+
+    return removed
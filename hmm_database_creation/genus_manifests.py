@@ -0,0 +1,143 @@
+"""Manifests of the genomes of which the HMM database of a genus is built
+
+download_files.py writes a manifest (genome file name -> MD5 checksum of
+the compressed file) of the genomes of a genus. When a database has been
+built, this manifest is stored next to the database. Genera of which the
+current genomes equal the genomes in the manifest of the database are not
+downloaded and built again.
+
+Author: Matthias van den Belt
+"""
+import json
+import os
+import sys
+import typing as t
+
+sys.path.append('..')
+from config_files.sensitive import finished_hmm_db_folder, hmm_db_genome_downloads
+
+# files written by cblaster makedb
+database_extensions = ('.fasta', '.sqlite3', '.dmnd')
+
+
+def get_genomes_manifest_path(organism: str, genus: str) -> str:
+    """Returns the path to the manifest of the downloaded genomes of a genus
+
+    Input:
+        - organism: organism of the genus (prokaryota or fungi)
+        - genus: name of the genus
+
+    Output:
+        - path to the manifest
+    """
+    return os.path.join(hmm_db_genome_downloads, organism, 'manifests',
+                        f'{genus}_genomes.json')
+
+
+def get_database_dir(organism: str, database_dir: t.Optional[str]) -> str:
+    """Returns the directory with the databases of an organism
+
+    Input:
+        - organism: organism of the databases (prokaryota or fungi)
+        - database_dir: directory of a specific generation, if given
+
+    Output:
+        - database_dir, or the directory used by new jobs if not given
+    """
+    if database_dir is not None:
+        return database_dir
+
+    return os.path.join(finished_hmm_db_folder, organism)
+
+
+def get_database_manifest_path(organism: str, genus: str,
+                               database_dir: t.Optional[str] = None) -> str:
+    """Returns the path to the manifest of the database of a genus
+
+    Input:
+        - organism: organism of the genus (prokaryota or fungi)
+        - genus: name of the genus
+        - database_dir: directory of the database, if not the current one
+
+    Output:
+        - path to the manifest, next to the database files
+    """
+    return os.path.join(get_database_dir(organism, database_dir),
+                        f'{genus}.manifest.json')
+
+
+def read_manifest(path: str) -> t.Optional[t.Dict[str, t.Optional[str]]]:
+    """Reads a manifest
+
+    Input:
+        - path: path to the manifest
+
+    Output:
+        - genome file name -> MD5 checksum OR
+        - None if the manifest does not exist
+    """
+    if not os.path.exists(path):
+        return None
+
+    with open(path) as inf:
+        return json.load(inf)
+
+
+def write_manifest(path: str, manifest: t.Dict[str, t.Optional[str]]) -> None:
+    """Writes a manifest atomically
+
+    Input:
+        - path: path to the manifest
+        - manifest: genome file name -> MD5 checksum
+
+    Output:
+        - None, written manifest
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w') as outf:
+        json.dump(manifest, outf, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def database_exists(organism: str, genus: str,
+                    database_dir: t.Optional[str] = None) -> bool:
+    """Checks if all files of the database of a genus are present
+
+    Input:
+        - organism: organism of the genus (prokaryota or fungi)
+        - genus: name of the genus
+        - database_dir: directory of the database, if not the current one
+
+    Output:
+        - True if the database is present
+    """
+    database_dir = get_database_dir(organism, database_dir)
+
+    return all(os.path.exists(os.path.join(database_dir, f'{genus}{ext}'))
+               for ext in database_extensions)
+
+
+def is_database_up_to_date(organism: str, genus: str,
+                           genome_files: t.Iterable[str],
+                           database_dir: t.Optional[str] = None) -> bool:
+    """Checks if the database of a genus was built with the given genomes
+
+    Input:
+        - organism: organism of the genus (prokaryota or fungi)
+        - genus: name of the genus
+        - genome_files: (decompressed) file names of the current genomes
+        - database_dir: directory of the database, if not the current one
+
+    Output:
+        - True if the database does not have to be rebuilt
+
+    Only the file names are compared, as they contain the versioned
+    assembly accession, which changes when the genome changes.
+    """
+    manifest = read_manifest(
+        get_database_manifest_path(organism, genus, database_dir))
+
+    return manifest is not None and set(manifest) == set(genome_files) and \
+        database_exists(organism, genus, database_dir)
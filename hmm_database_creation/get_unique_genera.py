@@ -1,31 +1,88 @@
-"""Script to get the unique genera from a collection of all species
+"""Selects the genera to construct HMM databases of
+
+The genomes of all genera are counted from the organism names of the
+genomes, after which only genera with enough genomes are selected. Used by
+fetch_ftp_paths.py, so FTP paths are only written for the selected genera.
 
 Author: Matthias van den Belt
 """
-from sys import argv
+import sys
+import typing as t
+
+sys.path.append('..')
+from config_files.config import thresholds
+
 
-def write_unique_genera():
-    """Writes unique genera to the output file
+def count_genera(lines: t.Iterable[str]) -> t.Dict[str, int]:
+    """Counts the number of genomes per genus
+
+    Input:
+        - lines: lines with the organism name of a genome, starting with the
+            genus
 
     Output:
-        - written file
+        - genus -> number of genomes, in order of first occurrence
     """
-    with open(argv[1]) as inf:
-        all_lines = inf.readlines()
+    counts = {}
+    for line in lines:
+        splitted = line.split()
+        if not splitted:
+            continue
+
+        genus = splitted[0]
+        counts[genus] = counts.get(genus, 0) + 1
 
-    all_genera = []
-    for line in all_lines:
-        genus = line.strip().split()[0]
+    return counts
 
-        if genus not in all_genera:
-            all_genera.append(genus)
 
-    with open(argv[2], 'w') as outf:
-        for g in all_genera:
-            outf.write(f'{g}\n')
+def get_genome_threshold(organism: str) -> int:
+    """Returns the minimum number of genomes of a genus to create a database
+
+    Input:
+        - organism: organism of the genera (prokaryota or fungi)
+
+    Output:
+        - minimum number of genomes
+    """
+    if organism == 'prokaryota':
+        return thresholds['prokaryotes_min_number_of_genomes']
+    elif organism == 'fungi':
+        return thresholds['fungi_min_number_of_genomes']
+    else:
+        raise ValueError(f'Invalid organism entered: {organism}')
+
+
+def select_genera(organism: str, counts_path: str, output_path: str,
+                  skipped_path: str = 'too_few_species.txt') -> int:
+    """Selects the genera with enough genomes to create a database of
+
+    Input:
+        - organism: organism of the genera (prokaryota or fungi)
+        - counts_path: file with a genus and its number of genomes per line
+            (tab-separated), as written by fetch_ftp_paths.write_ftp_paths
+        - output_path: file to write the selected genera to
+        - skipped_path: file to write the skipped genera and their number of
+            genomes to
+
+    Output:
+        - number of selected genera
+        - written files
+
+    Applied before the FTP paths of the genera are written, so no files are
+    written for genera which are skipped anyway.
+    """
+    threshold = get_genome_threshold(organism)
+    selected = 0
+
+    with open(counts_path) as inf, open(output_path, 'w') as outf, \
+            open(skipped_path, 'w') as skipped:
+        for line in inf:
+            genus, count = line.split()
 
-    print(len(all_genera))
-    # total number of genera is used in bash script from which this script
-    # is called. Above line should be left in!
+            if int(count) < threshold:
+                skipped.write(f'{genus},{count}\n')
+            else:
+                outf.write(f'{genus}\n')
+                selected += 1
 
-write_unique_genera()
+    return selected
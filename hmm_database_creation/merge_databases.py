@@ -0,0 +1,87 @@
+"""Merges partial databases of a genus into a single cblaster database
+
+Large genera are built in shards (see create_databases.py), each of which
+results in a partial database. The genes of all partial SQLite databases are
+inserted into a new database, after which the FASTA file and DIAMOND
+database are written from the merged database, exactly as cblaster makedb
+would do. Gene IDs are reassigned while merging, so they are unique in the
+merged database and its FASTA headers.
+
+Usage:
+    python3 merge_databases.py <database name> <cpus> <shard name> ...
+
+Author: Matthias van den Belt
+"""
+import os
+import sys
+import typing as t
+
+from cblaster import database, sql
+
+# columns of the feature table, in the order of cblaster's sql.INSERT
+feature_columns = ('feature_type', 'name', 'start_pos', 'end_pos', 'strand',
+                   'sequence', 'scaffold', 'organism')
+merge_batch_size = 100000  # number of genes held in memory while merging
+
+
+def merge_sqlite(shards: t.List[str], output: str) -> None:
+    """Merges the SQLite databases of shards
+
+    Input:
+        - shards: names of the partial databases (without extension)
+        - output: path of the merged SQLite database
+
+    Output:
+        - None, written merged database
+    """
+    database.init_sqlite_db(output, force=True)
+    query = f'SELECT {", ".join(feature_columns)} FROM feature ORDER BY id'
+
+    with database.SQLITE.connect(output) as out_con:
+        for shard in shards:
+            with database.SQLITE.connect(f'{shard}.sqlite3') as shard_con:
+                rows = shard_con.execute(query)
+                while True:
+                    batch = rows.fetchmany(merge_batch_size)
+                    if not batch:
+                        break
+
+                    out_con.executemany(sql.INSERT, batch)
+
+
+def merge_databases(name: str, cpus: int, shards: t.List[str]) -> None:
+    """Creates a cblaster database from the partial databases of shards
+
+    Input:
+        - name: base name of the merged database files
+        - cpus: number of threads used by DIAMOND
+        - shards: names of the partial databases (without extension)
+
+    Output:
+        - None, written name.sqlite3, name.fasta and name.dmnd
+
+    Raises:
+        - RuntimeError: when the DIAMOND database was not created
+    """
+    sqlite_path = f'{name}.sqlite3'
+    fasta_path = f'{name}.fasta'
+    dmnd_path = f'{name}.dmnd'
+
+    print(f'Merging {len(shards)} shards into {sqlite_path}', flush=True)
+    merge_sqlite(shards, sqlite_path)
+
+    print(f'Writing FASTA to {fasta_path}', flush=True)
+    database.sqlite_to_fasta(fasta_path, sqlite_path, False)
+
+    print(f'Building DIAMOND database at {dmnd_path}', flush=True)
+    database.diamond_makedb(fasta_path, dmnd_path, cpus)
+
+    if not os.path.exists(dmnd_path):
+        raise RuntimeError(f'DIAMOND database {dmnd_path} was not created')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 4:
+        raise IndexError('Supply a database name, number of cpus and shards')
+
+    merge_databases(sys.argv[1], int(sys.argv[2]), sys.argv[3:])
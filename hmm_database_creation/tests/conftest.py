@@ -0,0 +1,15 @@
+"""Makes the scripts used to construct the HMM databases importable in tests
+
+The scripts import each other by module name, as they are executed from
+the hmm_database_creation folder.
+
+Author: Matthias van den Belt
+"""
+import os
+import sys
+
+tests_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(tests_dir))  # hmm_database_creation
+sys.path.insert(0, os.path.dirname(os.path.dirname(tests_dir)))  # repository
+
+fixtures_dir = os.path.join(tests_dir, 'fixtures')
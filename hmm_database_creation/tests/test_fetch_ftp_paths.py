@@ -0,0 +1,125 @@
+"""Tests of fetching FTP paths, using recorded responses of E-utilities
+
+The fixtures are an esearch response of the assembly database and the
+esummary responses of its history, requested in pages of two summaries.
+
+Author: Matthias van den Belt
+"""
+import functools
+import os
+
+import pytest
+
+import fetch_ftp_paths
+import get_unique_genera
+from conftest import fixtures_dir
+
+ftp_base = 'ftp://ftp.ncbi.nlm.nih.gov/genomes/all'
+
+
+class RecordedFetcher:
+    """Returns recorded responses instead of requesting E-utilities
+
+    Stores the parameters of each request, so they can be checked.
+    """
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, url, params):
+        self.requests.append((url, params))
+
+        if url.endswith('esearch.fcgi'):
+            fn = 'esearch_assembly.xml'
+        elif url.endswith('esummary.fcgi'):
+            fn = f'esummary_assembly_{params["retstart"]}.xml'
+        else:
+            raise ValueError(f'No recorded response for {url}')
+
+        with open(os.path.join(fixtures_dir, fn), 'rb') as inf:
+            return inf.read()
+
+
+def test_fetch_document_summaries_pages_through_history():
+    fetch = RecordedFetcher()
+
+    summaries = list(fetch_ftp_paths.fetch_document_summaries(
+        'prokaryota', fetch, page_size=2))
+
+    assert len(summaries) == 6
+    assert [params.get('retstart') for _, params in fetch.requests] == \
+        [None, 0, 2, 4]
+
+    for _, params in fetch.requests[1:]:
+        assert params['WebEnv'] == 'MCID_6530e8a1b4c2f05a1d4f0e12'
+        assert params['query_key'] == '1'
+        assert params['retmax'] == 2
+
+
+def test_group_ftp_paths_skips_genomes_without_ftp_path():
+    summaries = fetch_ftp_paths.fetch_document_summaries(
+        'prokaryota', RecordedFetcher(), page_size=2)
+
+    ftp_paths, organisms = fetch_ftp_paths.group_ftp_paths(summaries,
+                                                            'prokaryota')
+
+    # the genome without a RefSeq FTP path is counted, but not downloaded
+    assert len(organisms) == 6
+    assert len(ftp_paths['Streptomyces']) == 2
+    assert ftp_paths['Bacillus'] == [
+        f'{ftp_base}/GCF/000/009/045/GCF_000009045.1_ASM904v1\t'
+        f'Bacillus subtilis']
+
+
+def test_group_ftp_paths_of_fungi_includes_genbank_paths():
+    summaries = fetch_ftp_paths.fetch_document_summaries(
+        'fungi', RecordedFetcher(), page_size=2)
+
+    ftp_paths, _ = fetch_ftp_paths.group_ftp_paths(summaries, 'fungi')
+
+    assert len(ftp_paths['Streptomyces']) == 3
+    assert ftp_paths['Pseudomonas'][0] == \
+        f'{ftp_base}/GCA/000/006/765/GCA_000006765.1_ASM676v1\t' \
+        f'{ftp_base}/GCF/000/006/765/GCF_000006765.1_ASM676v1\t' \
+        f'Pseudomonas aeruginosa'
+
+
+def test_write_ftp_paths(tmp_path, monkeypatch):
+    monkeypatch.setitem(get_unique_genera.thresholds,
+                        'prokaryotes_min_number_of_genomes', 2)
+    monkeypatch.setattr(fetch_ftp_paths, 'fetch_document_summaries',
+                        functools.partial(
+                            fetch_ftp_paths.fetch_document_summaries,
+                            page_size=2))
+    selected_path = tmp_path / 'selected_genera.txt'
+
+    selected = fetch_ftp_paths.write_ftp_paths(
+        'prokaryota', str(selected_path), fetch=RecordedFetcher(),
+        output_dir=str(tmp_path))
+
+    assert selected == 2
+    assert selected_path.read_text().split() == ['Streptomyces',
+                                                 'Pseudomonas']
+    assert (tmp_path / 'genome_counts.txt').read_text() == \
+        'Streptomyces\t3\nPseudomonas\t2\nBacillus\t1\n'
+    assert (tmp_path / 'too_few_species.txt').read_text() == 'Bacillus,1\n'
+
+    lines = (tmp_path / 'Streptomyces_ftp_paths.txt').read_text() \
+        .splitlines()
+    assert lines == [
+        f'{ftp_base}/GCF/000/203/835/GCF_000203835.1_ASM20383v1\t'
+        f'Streptomyces coelicolor',
+        f'{ftp_base}/GCF/000/009/765/GCF_000009765.2_ASM976v2\t'
+        f'Streptomyces avermitilis']
+    assert (tmp_path / 'Pseudomonas_ftp_paths.txt').exists()
+    assert not (tmp_path / 'Bacillus_ftp_paths.txt').exists()
+
+
+def test_select_genera_rejects_unknown_organisms(tmp_path):
+    counts_path = tmp_path / 'genome_counts.txt'
+    counts_path.write_text('Streptomyces\t3\n')
+
+    with pytest.raises(ValueError):
+        get_unique_genera.select_genera(
+            'viruses', str(counts_path), str(tmp_path / 'selected.txt'),
+            skipped_path=str(tmp_path / 'too_few_species.txt'))
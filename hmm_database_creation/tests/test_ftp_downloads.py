@@ -0,0 +1,165 @@
+"""Tests of resumable downloading, against a local FTP server
+
+A pyftpdlib server serving a temporary folder stands in for NCBI's FTP
+server. Interrupted transfers are simulated by raising a connection error
+from the callback of download_file.
+
+Author: Matthias van den Belt
+"""
+import json
+import os
+import threading
+
+import pytest
+
+pytest.importorskip('pyftpdlib')
+from pyftpdlib.authorizers import DummyAuthorizer
+from pyftpdlib.handlers import FTPHandler
+from pyftpdlib.servers import ThreadedFTPServer
+
+from ftp_downloads import DownloadManifest, FTPConnectionPool, download_file
+
+remote_path = '/genomes/GCF_000203835.1_ASM20383v1_genomic.gbff.gz'
+contents = os.urandom(10 * 1024)
+blocksize = 1024
+
+
+@pytest.fixture
+def server(tmp_path):
+    """Serves a genome file from a local FTP server
+
+    Output:
+        - (host, port) of the server
+    """
+    root = tmp_path / 'server'
+    (root / 'genomes').mkdir(parents=True)
+    (root / remote_path.lstrip('/')).write_bytes(contents)
+
+    authorizer = DummyAuthorizer()
+    authorizer.add_anonymous(str(root))
+    handler = type('Handler', (FTPHandler, ), {'authorizer': authorizer})
+
+    ftp_server = ThreadedFTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target=ftp_server.serve_forever,
+                              kwargs={'timeout': 0.1}, daemon=True)
+    thread.start()
+
+    yield ftp_server.address
+
+    ftp_server.close_all()
+    thread.join(timeout=5)
+
+
+@pytest.fixture
+def pool(server):
+    connection_pool = FTPConnectionPool(*server, size=2, timeout=10)
+    yield connection_pool
+    connection_pool.close()
+
+
+class Interrupter:
+    """Collects downloaded blocks, interrupting the transfer once
+
+    Input:
+        - after: number of blocks after which the transfer is interrupted.
+            Never interrupted if None
+    """
+
+    def __init__(self, after=None):
+        self.after = after
+        self.blocks = []
+
+    def __call__(self, block):
+        self.blocks.append(block)
+
+        if self.after is not None and len(self.blocks) == self.after:
+            self.after = None
+            raise ConnectionResetError('simulated interruption')
+
+
+def read_manifest(path):
+    with open(path) as inf:
+        return json.load(inf)
+
+
+def test_interrupted_transfer_is_resumed(tmp_path, pool):
+    local_path = str(tmp_path / 'genome.gbff.gz')
+    manifest_path = str(tmp_path / 'manifest.json')
+    callback = Interrupter(after=3)
+
+    download_file(pool, remote_path, local_path,
+                  DownloadManifest(manifest_path), blocksize=blocksize,
+                  retries=1, callback=callback)
+
+    with open(local_path, 'rb') as inf:
+        assert inf.read() == contents
+
+    # only the remaining bytes were requested after the interruption
+    assert b''.join(callback.blocks) == contents
+    assert read_manifest(manifest_path) == {remote_path: 'complete'}
+
+
+def test_failed_download_stays_partial(tmp_path, pool):
+    local_path = str(tmp_path / 'genome.gbff.gz')
+    manifest_path = str(tmp_path / 'manifest.json')
+
+    with pytest.raises(ConnectionResetError):
+        download_file(pool, remote_path, local_path,
+                      DownloadManifest(manifest_path), blocksize=blocksize,
+                      retries=0, callback=Interrupter(after=3))
+
+    assert read_manifest(manifest_path) == {remote_path: 'partial'}
+    assert os.path.getsize(local_path) == 3 * blocksize
+
+
+def test_partial_download_of_previous_run_is_resumed(tmp_path, pool):
+    local_path = str(tmp_path / 'genome.gbff.gz')
+    manifest_path = str(tmp_path / 'manifest.json')
+
+    with pytest.raises(ConnectionResetError):
+        download_file(pool, remote_path, local_path,
+                      DownloadManifest(manifest_path), blocksize=blocksize,
+                      retries=0, callback=Interrupter(after=4))
+
+    kept, callback = [], Interrupter()
+    download_file(pool, remote_path, local_path,
+                  DownloadManifest(manifest_path), blocksize=blocksize,
+                  callback=callback, on_resume=kept.append)
+
+    assert kept == [4 * blocksize]
+    assert b''.join(callback.blocks) == contents[4 * blocksize:]
+    with open(local_path, 'rb') as inf:
+        assert inf.read() == contents
+    assert read_manifest(manifest_path) == {remote_path: 'complete'}
+
+
+def test_file_not_marked_partial_is_downloaded_again(tmp_path, pool):
+    local_path = str(tmp_path / 'genome.gbff.gz')
+    with open(local_path, 'wb') as outf:  # e.g. an outdated genome file
+        outf.write(b'outdated contents')
+
+    kept, callback = [], Interrupter()
+    download_file(pool, remote_path, local_path,
+                  DownloadManifest(str(tmp_path / 'manifest.json')),
+                  blocksize=blocksize, callback=callback,
+                  on_resume=kept.append)
+
+    assert kept == []
+    assert b''.join(callback.blocks) == contents
+    with open(local_path, 'rb') as inf:
+        assert inf.read() == contents
+
+
+def test_completed_download_is_not_repeated(tmp_path, pool):
+    local_path = str(tmp_path / 'genome.gbff.gz')
+    manifest = DownloadManifest(str(tmp_path / 'manifest.json'))
+    download_file(pool, remote_path, local_path, manifest,
+                  blocksize=blocksize)
+
+    kept, callback = [], Interrupter()
+    download_file(pool, remote_path, local_path, manifest,
+                  blocksize=blocksize, callback=callback,
+                  on_resume=kept.append)
+
+    assert kept == [len(contents)]
+    assert callback.blocks == []
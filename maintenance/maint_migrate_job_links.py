@@ -0,0 +1,82 @@
+"""Module to migrate connections between jobs to the job_links table
+
+Previously, the child jobs of a main search job were stored as a
+comma-separated string in the child_jobs column of the job table. This
+script converts these strings, together with the main_search_job and
+depending_on columns, to entries in the job_links table. Running the
+script multiple times does not create duplicate entries.
+
+This migration has to be done before maint_migrate_job_times.py rebuilds the
+job table without the child_jobs column. That script therefore runs this
+migration itself when the column is still present.
+
+Author: Matthias van den Belt
+"""
+
+import typing as t
+
+from sqlalchemy import inspect, text
+
+from cagecat import db
+from cagecat.db_models import JobLink
+
+
+def get_existing_links() -> t.Set[t.Tuple[str, str, str]]:
+    """Returns the links which are already present in the job_links table
+
+    Output:
+        - set of (parent_id, child_id, link_type)
+    """
+    return {(link.parent_id, link.child_id, link.link_type)
+            for link in JobLink.query.all()}
+
+
+def collect_links() -> t.Set[t.Tuple[str, str, str]]:
+    """Collects all links between jobs from the columns of the job table
+
+    Output:
+        - set of (parent_id, child_id, link_type)
+    """
+    columns = [c['name'] for c in inspect(db.engine).get_columns('job')]
+    has_child_jobs = 'child_jobs' in columns
+
+    query = 'SELECT id, main_search_job, depending_on' + \
+            (', child_jobs' if has_child_jobs else '') + ' FROM job'
+
+    links = set()
+    for row in db.session.execute(text(query)):
+        job_id, main_search_job, depending_on = row[0], row[1], row[2]
+
+        if main_search_job not in (None, '', 'null'):
+            links.add((main_search_job, job_id, 'main_search'))
+
+        if depending_on not in (None, '', 'null'):
+            links.add((depending_on, job_id, 'depending'))
+
+        if has_child_jobs and row[3]:
+            for child_id in row[3].split(','):
+                links.add((job_id, child_id, 'main_search'))
+
+    return links
+
+
+def migrate_job_links() -> None:
+    """Converts connections stored in the job table to job_links entries
+
+    Output:
+        - None, added entries to the job_links table
+    """
+    db.create_all()  # creates the job_links table if not present yet
+
+    new_links = collect_links() - get_existing_links()
+
+    for parent_id, child_id, link_type in new_links:
+        db.session.add(JobLink(parent_id=parent_id, child_id=child_id,
+                               link_type=link_type))
+
+    db.session.commit()
+    print(f'Added {len(new_links)} job links')
+
+
+if __name__ == '__main__':
+    migrate_job_links()
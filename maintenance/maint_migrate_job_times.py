@@ -0,0 +1,148 @@
+"""Module to migrate the timing columns of the job table to DateTime columns
+
+Previously, post_time, start_time and finish_time were stored as strings
+(formatted as "%B %d %Y - %H:%M:%S", or "%Y-%m-%d %H:%M:%S.%f" for the
+oldest jobs). As SQLite cannot change the type of a column, this script
+rebuilds the job table with the current model (including its indexes) and
+copies all jobs to it, converting the stored times. Running the script on
+an already migrated database only adds indexes missing in the job table.
+
+The rebuilt job table has no child_jobs column anymore, so the links
+stored in it are converted to job_links entries first (see
+maint_migrate_job_links.py, which may also be run on its own before this
+script).
+
+Note that the post times of jobs submitted before this migration are only
+as accurate as they were stored: the previous default was evaluated once
+when the application was started.
+
+Author: Matthias van den Belt
+"""
+
+import datetime
+import typing as t
+
+from sqlalchemy import inspect, text
+
+from cagecat import db
+from cagecat.db_models import Job
+from maint_migrate_job_links import migrate_job_links
+
+time_formats = ('%B %d %Y - %H:%M:%S', '%Y-%m-%d %H:%M:%S.%f',
+                '%Y-%m-%d %H:%M:%S')
+time_columns = ('post_time', 'start_time', 'finish_time')
+
+
+def parse_time(value: t.Optional[str]) -> t.Optional[datetime.datetime]:
+    """Converts a stored time to a datetime object
+
+    Input:
+        - value: time as stored in the old job table
+
+    Output:
+        - parsed time OR
+        - None if no (valid) time was stored
+    """
+    if value in (None, '', 'null'):
+        return None
+
+    for time_format in time_formats:
+        try:
+            return datetime.datetime.strptime(value, time_format)
+        except ValueError:
+            continue
+
+    return None
+
+
+def is_migrated() -> bool:
+    """Checks if the timing columns of the job table are DateTime columns
+
+    Output:
+        - True if the job table has already been migrated
+    """
+    columns = {c['name']: c['type'] for c in
+               inspect(db.engine).get_columns('job')}
+    return 'DATETIME' in str(columns['post_time']).upper()
+
+
+def convert_row(row: t.Dict[str, t.Any],
+                new_columns: t.List[str]) -> t.Dict[str, t.Any]:
+    """Converts a row of the old job table to a row of the new job table
+
+    Input:
+        - row: column name -> value of a job in the old table
+        - new_columns: names of the columns of the new job table
+
+    Output:
+        - column name -> value of the job in the new table
+    """
+    converted = {c: row[c] for c in new_columns if c in row}
+
+    for column in time_columns:
+        converted[column] = parse_time(row.get(column))
+
+    if converted['post_time'] is None:  # column is not nullable
+        converted['post_time'] = converted['start_time'] or \
+            converted['finish_time'] or datetime.datetime.utcnow()
+        print(f'No valid post time for job {row["id"]}, '
+              f'set to {converted["post_time"]}')
+
+    return converted
+
+
+def create_missing_indexes() -> None:
+    """Creates indexes of the job model missing in a migrated job table
+
+    Output:
+        - None, created indexes
+    """
+    existing = {i['name'] for i in inspect(db.engine).get_indexes('job')}
+
+    for index in Job.__table__.indexes:
+        if index.name not in existing:
+            index.create(db.engine)
+            print(f'Created index {index.name}')
+
+
+def migrate_job_times() -> None:
+    """Rebuilds the job table with DateTime timing columns
+
+    Output:
+        - None, rebuilt job table with converted times and indexes
+
+    Links between jobs stored in the child_jobs column are migrated to the
+    job_links table before the column is dropped.
+    """
+    if is_migrated():
+        create_missing_indexes()
+        return
+
+    columns = [c['name'] for c in inspect(db.engine).get_columns('job')]
+    if 'child_jobs' in columns:
+        migrate_job_links()
+
+    new_columns = [c.name for c in Job.__table__.columns]
+
+    with db.engine.begin() as conn:
+        # keep the foreign keys of job_links pointing to the job table
+        conn.execute(text('PRAGMA legacy_alter_table = ON'))
+        conn.execute(text('ALTER TABLE job RENAME TO job_old'))
+
+        Job.__table__.create(conn)
+
+        result = conn.execute(text('SELECT * FROM job_old'))
+        old_columns = list(result.keys())
+        rows = [convert_row(dict(zip(old_columns, row)), new_columns)
+                for row in result]
+        if rows:
+            conn.execute(Job.__table__.insert(), rows)
+
+        conn.execute(text('DROP TABLE job_old'))
+        conn.execute(text('PRAGMA legacy_alter_table = OFF'))
+
+    print(f'Migrated {len(rows)} jobs')
+
+
+if __name__ == '__main__':
+    migrate_job_times()
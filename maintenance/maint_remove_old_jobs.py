@@ -1,72 +1,222 @@
 """Module to remove stored data of jobs that have ran > 30 days ago.
 
+Expired jobs are selected from the database by their (indexed) finish time,
+or post time for jobs that never finished. Their directories are deleted in
+parallel, after which the jobs are removed from the database in batches.
+
+Periodically (every expiry_conf['orphan_sweep_days'] days), job directories
+which have no entry in the database and are older than the retention period
+are removed as well, e.g. directories of jobs of which the submission
+failed.
+
 Author: Matthias van den Belt
 """
 
 import os
 import datetime
 import shutil
+import time
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 
 from config_files.sensitive import maintenance_logs, server_prefix
-from cagecat import db
-from cagecat.general_utils import fetch_job_from_db
+from cagecat import db, r
+from cagecat.db_models import Job, JobLink
 from cagecat.const import jobs_dir
-from config_files.config import persistent_jobs
+from cagecat.workers.search_cache import forget_cached_searches
+from cagecat.generation_usage import release_generations
+from config_files.config import persistent_jobs, job_retention_days, \
+    expiry_conf
 
+# modification time of this file is the moment of the last orphan sweep
+orphan_sweep_marker = os.path.join(maintenance_logs, 'last_orphan_sweep')
 
-def get_folders_to_delete(period_to_keep: int = 31) -> t.List[t.Tuple[str, str]]:
-    """Returns the folders which are too old to keep (and should be deleted)
+
+def get_expired_jobs(period_to_keep: int = job_retention_days) -> t.List[str]:
+    """Returns the IDs of jobs which are too old to keep
 
     Input:
         - period_to_keep: how many days files should be stored on the server
 
     Output:
-        - to_delete: directory path and job ID's to delete
+        - job IDs to delete, persistent jobs excluded
     """
+    cutoff = datetime.datetime.utcnow() - \
+        datetime.timedelta(days=period_to_keep)
 
-    to_delete = []
-    current = datetime.datetime.now()
-    j_dir = os.path.join(server_prefix, jobs_dir)
+    query = db.session.query(Job.id).filter(
+        db.or_(Job.finish_time < cutoff,
+               db.and_(Job.finish_time.is_(None), Job.post_time < cutoff)),
+        Job.id.notin_(persistent_jobs))
 
-    for fn in os.listdir(j_dir):
-        fp = os.path.join(j_dir, fn)
-        if os.path.isdir(fp):
-            if (current - datetime.datetime.fromtimestamp(os.path.getmtime(fp))).days >= period_to_keep:
-                to_delete.append((fp, os.path.split(fp)[-1]))
+    return [job_id for job_id, in query]
 
-    return to_delete
 
+def get_orphaned_directories(period_to_keep: int = job_retention_days) \
+        -> t.List[str]:
+    """Returns the job directories without a job in the database
 
-def delete_old_jobs():
-    """Delete old jobs from the server
+    Input:
+        - period_to_keep: how many days files should be stored on the server
 
     Output:
-        - None, entries are removed from the database and job folders which
-            have expired the storage data are removed
+        - job IDs (names) of the directories which have no entry in the
+            database and were not modified during period_to_keep,
+            persistent jobs excluded
     """
-    with open(os.path.join(f'{maintenance_logs}',
-                           f'{datetime.datetime.now().date()}_removal.txt'),
-              'w') as outf:
-        for directory, job_id in get_folders_to_delete():
+    cutoff = time.time() - period_to_keep * 86400
 
-            if job_id in persistent_jobs:
-                print(f'Skipped: {job_id} (in persistent jobs)')
-                continue
+    candidates = []
+    with os.scandir(os.path.join(server_prefix, jobs_dir)) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False) and \
+                    entry.name not in persistent_jobs and \
+                    entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                candidates.append(entry.name)
+
+    known = set()
+    batch_size = expiry_conf['batch_size']
+    for i in range(0, len(candidates), batch_size):
+        query = db.session.query(Job.id).filter(
+            Job.id.in_(candidates[i:i+batch_size]))
+        known.update(job_id for job_id, in query)
+
+    return [job_id for job_id in candidates if job_id not in known]
+
+
+def is_orphan_sweep_due() -> bool:
+    """Determines whether orphaned job directories should be removed
+
+    Output:
+        - True if the previous sweep was more than
+            expiry_conf['orphan_sweep_days'] days ago, or was never done
+    """
+    try:
+        last_sweep = os.path.getmtime(orphan_sweep_marker)
+    except FileNotFoundError:
+        return True
+
+    return time.time() - last_sweep > \
+        expiry_conf['orphan_sweep_days'] * 86400
+
+
+def get_directory_size(directory: str) -> int:
+    """Calculates the total size of the files in a directory
+
+    Input:
+        - directory: path to the directory
+
+    Output:
+        - size in bytes
+    """
+    size = 0
+    for root, _, files in os.walk(directory):
+        for fn in files:
             try:
-                shutil.rmtree(directory)
-            except FileNotFoundError:  # occurred during development.
-                #  will not happen in production
-                print(f'Directory not found: {directory}')
+                size += os.lstat(os.path.join(root, fn)).st_size
+            except FileNotFoundError:
+                continue
 
-            db.session.delete(fetch_job_from_db(job_id))
+    return size
 
-            outf.write(f'Deleted: {directory}\n')
 
-        outf.write('Finished deleting jobs')
+def remove_job_directory(job_id: str) -> t.Tuple[str, int]:
+    """Deletes the directory of a job
+
+    Input:
+        - job_id: ID of the job to delete the directory of
 
+    Output:
+        - job_id: ID of the job
+        - size: number of bytes freed
+    """
+    directory = os.path.join(server_prefix, jobs_dir, job_id)
+    size = get_directory_size(directory)
+
+    try:
+        shutil.rmtree(directory)
+    except FileNotFoundError:  # e.g. already deleted in an interrupted run
+        size = 0
+
+    return job_id, size
+
+
+def delete_job_batch(job_ids: t.List[str],
+                     executor: ThreadPoolExecutor) -> t.List[t.Tuple[str, int]]:
+    """Deletes the directories and database entries of a batch of jobs
+
+    Input:
+        - job_ids: IDs of the jobs to delete
+        - executor: pool used to delete the directories in parallel
+
+    Output:
+        - per job: job ID and number of bytes freed
+
+    Directories are deleted before the database entries, so an interrupted
+    run is continued by the next run.
+    """
+    removed = list(executor.map(remove_job_directory, job_ids))
+
+    JobLink.query.filter(JobLink.parent_id.in_(job_ids) |
+                         JobLink.child_id.in_(job_ids)) \
+        .delete(synchronize_session=False)
+    Job.query.filter(Job.id.in_(job_ids)).delete(synchronize_session=False)
     db.session.commit()
 
+    forget_cached_searches(job_ids)
+    for job_id in job_ids:  # sessions do not refer to the generations anymore
+        release_generations(r, job_id, 'sessions')
+
+    return removed
+
+
+def delete_old_jobs():
+    """Delete old jobs from the server
+
+    Output:
+        - None, entries are removed from the database and job folders which
+            have expired the storage data are removed. Orphaned job
+            directories are removed when a sweep is due. The number of
+            removed jobs and directories, bytes freed and duration of the
+            run are logged
+    """
+    start = time.monotonic()
+    total_jobs = total_orphans = total_bytes = 0
+
+    expired = get_expired_jobs()
+    batch_size = expiry_conf['batch_size']
+
+    with open(os.path.join(f'{maintenance_logs}',
+                           f'{datetime.datetime.now().date()}_removal.txt'),
+              'w') as outf, \
+            ThreadPoolExecutor(max_workers=expiry_conf['workers']) as executor:
+
+        for i in range(0, len(expired), batch_size):
+            for job_id, size in delete_job_batch(expired[i:i+batch_size],
+                                                 executor):
+                outf.write(f'Deleted: {job_id} ({size} bytes)\n')
+                total_jobs += 1
+                total_bytes += size
+
+        if is_orphan_sweep_due():
+            for job_id, size in executor.map(remove_job_directory,
+                                             get_orphaned_directories()):
+                outf.write(f'Deleted orphaned directory: {job_id} '
+                           f'({size} bytes)\n')
+                total_orphans += 1
+                total_bytes += size
+
+            with open(orphan_sweep_marker, 'w') as marker:
+                marker.write(f'{datetime.datetime.now()}\n')
+
+        metrics = f'Jobs removed: {total_jobs}; orphaned directories ' \
+                  f'removed: {total_orphans}; bytes freed: {total_bytes}; ' \
+                  f'duration: {time.monotonic() - start:.1f} s'
+        outf.write(f'{metrics}\n')
+        outf.write('Finished deleting jobs')
+
+    print(metrics)
+
 
 if __name__ == '__main__':
     delete_old_jobs()